@@ -0,0 +1,98 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import os
+import sys
+import time
+
+import click
+
+from benchmarks.generator import generate_database
+from benchmarks.runner import DEFAULT_TOLERANCE, compare, results_json, run_isolated
+from benchmarks.suites import SUITES
+
+
+@click.command()
+@click.option(
+    "-r",
+    "--rows",
+    multiple=True,
+    type=int,
+    default=[100_000],
+    show_default=True,
+    help="Row counts of the generated tables, e.g. -r 100000 -r 1000000 -r 10000000",
+)
+@click.option(
+    "-s",
+    "--suite",
+    "suites",
+    multiple=True,
+    type=click.Choice(list(SUITES)),
+    help="Suites to run, all of them by default",
+)
+@click.option(
+    "--data-dir",
+    default=os.path.join(".benchmarks", "data"),
+    show_default=True,
+    help="Directory of the generated databases, they are reused between runs",
+)
+@click.option(
+    "-o",
+    "--output",
+    default=os.path.join(".benchmarks", "results.json"),
+    show_default=True,
+    help="File path of the results",
+)
+@click.option("--baseline", default=None, help="File path of the baseline results")
+@click.option(
+    "--tolerance",
+    default=DEFAULT_TOLERANCE,
+    show_default=True,
+    help="Relative change of throughput or memory tolerated by the comparison",
+)
+def execute(rows, suites, data_dir, output, baseline, tolerance):
+    results = []
+    for row_count in rows:
+        start = time.perf_counter()
+        database_path = generate_database(data_dir, row_count)
+        print(
+            f"Generated {row_count} rows in {time.perf_counter() - start:.1f}s: "
+            f"{database_path}"
+        )
+        for suite in suites or SUITES:
+            result = run_isolated(database_path, suite, row_count)
+            print(
+                f"{result.key}: {result.time_taken}s, {result.rows_per_second} rows/s, "
+                f"{result.query_count} queries, {result.peak_memory_mb} MB, "
+                f"{result.errors} errors"
+            )
+            results.append(result)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(results_json(results), file, indent=2)
+    print(f"Results written to {output}")
+
+    if baseline is not None:
+        with open(baseline) as file:
+            regressions = compare(results, json.load(file), tolerance)
+        for regression in regressions:
+            print(f"Regression {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regression against the baseline")
+
+
+if __name__ == "__main__":
+    execute()
@@ -0,0 +1,135 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import sqlite3
+from typing import List, Tuple
+
+import numpy as np
+
+TABLE_NAME = "orders"
+CHUNK_SIZE = 100_000
+
+COLUMNS: List[Tuple[str, str]] = [
+    ("id", "INTEGER"),
+    ("price", "REAL"),
+    ("quantity", "INTEGER"),
+    ("discount", "REAL"),
+    ("product_name", "TEXT"),
+    ("email", "TEXT"),
+    ("customer_id", "TEXT"),
+    ("state", "TEXT"),
+    ("created_at", "TEXT"),
+]
+
+PRODUCT_NAMES = np.array(
+    ["apple", "orange", "banana", "mango", "papaya", "grapes", "kiwi", "melon"]
+)
+STATES = np.array(["CA", "NY", "TX", "FL", "WA", "IL", "OH", "GA", "XX", "ca"])
+
+
+def _uuids(generator: np.random.Generator, size: int) -> List[str]:
+    digits = generator.bytes(16 * size).hex()
+    return [
+        f"{h[:8]}-{h[8:12]}-4{h[13:16]}-a{h[17:20]}-{h[20:32]}"
+        for h in (digits[index : index + 32] for index in range(0, 32 * size, 32))
+    ]
+
+
+def _chunk(generator: np.random.Generator, start: int, size: int) -> List[Tuple]:
+    """
+    Generate the rows [start, start + size) of the table
+    """
+    ids = np.arange(start, start + size)
+    prices = np.round(generator.normal(100.0, 25.0, size), 2)
+    quantities = generator.poisson(3.0, size) - generator.binomial(1, 0.02, size)
+    discounts = np.round(generator.uniform(0.0, 0.5, size), 3)
+    discount_nulls = generator.random(size) < 0.05
+
+    names = PRODUCT_NAMES[generator.integers(0, len(PRODUCT_NAMES), size)].astype(
+        object
+    )
+    draws = generator.random(size)
+    names[draws < 0.02] = None
+    names[(draws >= 0.02) & (draws < 0.03)] = ""
+
+    emails = np.char.add(np.char.add("user", ids.astype(str)), "@example.com")
+    emails = emails.astype(object)
+    emails[generator.random(size) < 0.03] = "not-an-email"
+
+    customer_ids = _uuids(generator, size)
+    # about one percent of the orders are duplicates of the customer of the previous order
+    for index in np.flatnonzero(generator.random(size) < 0.01):
+        if index > 0:
+            customer_ids[index] = customer_ids[index - 1]
+
+    states = STATES[generator.integers(0, len(STATES), size)]
+    created_at = (
+        np.datetime64("2023-01-01T00:00:00")
+        + generator.integers(0, 365 * 24 * 3600, size).astype("timedelta64[s]")
+    ).astype(str)
+
+    return list(
+        zip(
+            ids.tolist(),
+            prices.tolist(),
+            quantities.tolist(),
+            [
+                None if is_null else discount
+                for discount, is_null in zip(discounts.tolist(), discount_nulls)
+            ],
+            names.tolist(),
+            emails.tolist(),
+            customer_ids,
+            states.tolist(),
+            [f"{value}Z" for value in created_at.tolist()],
+        )
+    )
+
+
+def generate_database(directory: str, rows: int, seed: int = 42) -> str:
+    """
+    Generate a SQLite database with a synthetic table of orders. A database generated
+    earlier with the same row count and seed is reused.
+    :param directory: directory of the database files
+    :param rows: number of rows of the table
+    :param seed: seed of the random generator
+    :return: path of the database file
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{TABLE_NAME}_{rows}_{seed}.sqlite")
+    if os.path.exists(path):
+        return path
+    temporary_path = f"{path}.tmp"
+    if os.path.exists(temporary_path):
+        os.remove(temporary_path)
+    generator = np.random.default_rng(seed)
+    connection = sqlite3.connect(temporary_path)
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute(
+            f"CREATE TABLE {TABLE_NAME} ("
+            + ", ".join(f"{name} {type_}" for name, type_ in COLUMNS)
+            + ")"
+        )
+        insert = f"INSERT INTO {TABLE_NAME} VALUES ({', '.join('?' for _ in COLUMNS)})"
+        for start in range(0, rows, CHUNK_SIZE):
+            connection.executemany(
+                insert, _chunk(generator, start, min(CHUNK_SIZE, rows - start))
+            )
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(temporary_path, path)
+    return path
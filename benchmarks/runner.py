@@ -0,0 +1,145 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from benchmarks.suites import SUITES, suite_configuration
+from dcs_core.core.inspect import Inspect
+from dcs_core.core.utils.tracing import InMemoryTracer, SpanKind, set_tracer
+
+# relative changes of throughput and memory tolerated before a result is a regression
+DEFAULT_TOLERANCE = 0.2
+
+
+@dataclass
+class BenchmarkResult:
+    suite: str
+    rows: int
+    validations: int
+    # validations that returned no result
+    errors: int
+    time_taken: float
+    rows_per_second: float
+    query_count: int
+    # peak resident memory of the process running the benchmark, in megabytes
+    peak_memory_mb: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.suite}/{self.rows}"
+
+
+def _peak_memory_mb() -> float:
+    # ru_maxrss survives exec, the new process would report the peak of its parent
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024 if platform.system() == "Darwin" else 1024)
+
+
+def run_case(database_path: str, suite: str, rows: int) -> BenchmarkResult:
+    """
+    Run the validations of a suite on a generated database with a new Inspect
+    :param database_path: path of the generated database
+    :param suite: name of the suite
+    :param rows: number of rows of the generated table
+    :return: result of the benchmark
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    tracer = InMemoryTracer()
+    set_tracer(tracer)
+    try:
+        inspect = Inspect()
+        inspect.add_validations_yaml_str(suite_configuration(suite, database_path))
+        start = time.perf_counter()
+        output = inspect.run()
+        time_taken = time.perf_counter() - start
+    finally:
+        set_tracer(None)
+    return BenchmarkResult(
+        suite=suite,
+        rows=rows,
+        validations=len(output.validations),
+        errors=sum(
+            validation_info is None for validation_info in output.validations.values()
+        ),
+        time_taken=round(time_taken, 4),
+        rows_per_second=round(rows / time_taken, 1),
+        query_count=len(tracer.get_spans(SpanKind.QUERY)),
+        peak_memory_mb=round(_peak_memory_mb(), 1),
+    )
+
+
+def run_isolated(database_path: str, suite: str, rows: int) -> BenchmarkResult:
+    """
+    Run a benchmark in a new process, so that its peak memory is its own
+    """
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return pool.submit(run_case, database_path, suite, rows).result()
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """
+    Compare the results with a stored baseline
+    :param results: results of the benchmarks
+    :param baseline: results of the baseline by key, as stored by the runner
+    :param tolerance: relative change tolerated before a result is a regression
+    :return: description of the regressions
+    """
+    regressions: List[str] = []
+    for result in results:
+        expected: Optional[Dict] = baseline.get(result.key)
+        if expected is None:
+            continue
+        if result.rows_per_second < expected["rows_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{result.key}: throughput {result.rows_per_second} rows/s, "
+                f"baseline {expected['rows_per_second']} rows/s"
+            )
+        if result.query_count > expected["query_count"]:
+            regressions.append(
+                f"{result.key}: {result.query_count} queries, "
+                f"baseline {expected['query_count']} queries"
+            )
+        if result.peak_memory_mb > expected["peak_memory_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{result.key}: peak memory {result.peak_memory_mb} MB, "
+                f"baseline {expected['peak_memory_mb']} MB"
+            )
+    return regressions
+
+
+def results_json(results: List[BenchmarkResult]) -> Dict[str, Dict]:
+    return {result.key: asdict(result) for result in results}
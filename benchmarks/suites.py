@@ -0,0 +1,86 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict
+
+from benchmarks.generator import TABLE_NAME
+
+DATA_SOURCE_NAME = "benchmark_db"
+
+# validations of every suite on the generated table, in the configuration format
+SUITES: Dict[str, str] = {
+    "numeric": """
+  - min_price:
+      on: min(price)
+  - max_price:
+      on: max(price)
+  - avg_price:
+      on: avg(price)
+  - stddev_price:
+      on: stddev(price)
+  - percentile_90_price:
+      on: percentile_90(price)
+  - sum_quantity:
+      on: sum(quantity)
+  - zero_quantity:
+      on: count_zero(quantity)
+  - negative_quantity:
+      on: percent_negative(quantity)
+""",
+    "completeness": """
+  - null_discount:
+      on: count_null(discount)
+  - percent_null_product_name:
+      on: percent_null(product_name)
+  - empty_product_name:
+      on: count_empty_string(product_name)
+  - percent_empty_product_name:
+      on: percent_empty_string(product_name)
+""",
+    "validity": """
+  - invalid_email:
+      on: count_email(email)
+  - uuid_customer_id:
+      on: percent_uuid(customer_id)
+  - percent_invalid_email:
+      on: percent_email(email)
+  - state_code:
+      on: count_usa_state_code(state)
+""",
+    "uniqueness": """
+  - duplicate_customer_id:
+      on: count_duplicate(customer_id)
+  - distinct_customer_id:
+      on: count_distinct(customer_id)
+  - distinct_product_name:
+      on: count_distinct(product_name)
+""",
+}
+
+
+def suite_configuration(suite: str, database_path: str) -> str:
+    """
+    Get the data source and the validations of a suite as a configuration string
+    :param suite: name of the suite
+    :param database_path: path of the generated SQLite database
+    """
+    return (
+        f"""
+data_sources:
+  - name: {DATA_SOURCE_NAME}
+    type: sqlite
+    connection:
+      database: {database_path}
+validations for {DATA_SOURCE_NAME}.{TABLE_NAME}:"""
+        + SUITES[suite]
+    )
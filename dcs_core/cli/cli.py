@@ -31,6 +31,7 @@ from dcs_core.core.configuration.configuration_parser import load_configuration
 from dcs_core.core.inspect import InspectOutput
 from dcs_core.report.dashboard import DashboardInfoBuilder, html_template
 from dcs_core.report.models import TemplateParams
+from dcs_core.report.openmetrics import OpenMetricsTextfileExporter
 
 logger.remove()
 logger.add(sys.stderr, level="WARNING")
@@ -53,6 +54,18 @@ def main():
     default=None,
     help="Specify the file path for configuration",
 )
+@click.option(
+    "--timing-report",
+    is_flag=True,
+    help="Specify if the inspection should print the cost of every validation",
+)
+@click.option(
+    "--openmetrics-path",
+    required=False,
+    default=None,
+    help="Specify the file path to write the results in OpenMetrics text format, "
+    "e.g. for the textfile collector of node_exporter",
+)
 # Disabled for now TODO: Enable in future for validations
 # @click.option(
 #     "--auto-profile",
@@ -72,6 +85,8 @@ def main():
 # )
 def inspect(
     config_path: Union[str, None],
+    timing_report: bool = False,
+    openmetrics_path: Union[str, None] = None,
     # auto_profile: bool = False, # Disabled for now
     # html_report: bool = False,
     # report_path: str = "datachecks_report.html",
@@ -100,6 +115,14 @@ def inspect(
         #     print(f"HTML report generated at {report_path}")
         # else:
         print(_build_metric_cli_table(inspect_output=output))
+        if timing_report:
+            print(_build_timing_cli_table(inspect_output=output))
+        if openmetrics_path:
+            # the latency histograms are kept next to the file between the runs
+            OpenMetricsTextfileExporter(
+                openmetrics_path, state_path=f"{openmetrics_path}.json"
+            ).export(output, run_duration=inspector.execution_time_taken)
+            print(f"OpenMetrics written to {openmetrics_path}")
         sys.exit(0)
 
     except Exception as e:
@@ -132,7 +155,14 @@ def _build_metric_cli_table(*, inspect_output: InspectOutput):
             validation_info.name,
             validation_info.data_source_name,
             validation_info.validation_function,
-            str(validation_info.value),
+            (
+                str(validation_info.value)
+                if validation_info.confidence_interval is None
+                else f"{validation_info.value} "
+                f"[{validation_info.confidence_interval[0]}, "
+                f"{validation_info.confidence_interval[1]}]"
+            )
+            + (" (cached)" if validation_info.cached else ""),
             Text(
                 "-"
                 if validation_info.is_valid is None
@@ -167,6 +197,33 @@ def _build_metric_cli_table(*, inspect_output: InspectOutput):
     return table
 
 
+def _build_timing_cli_table(*, inspect_output: InspectOutput):
+    table = Table(
+        title="Validation Timings",
+        show_header=True,
+        header_style="bold blue",
+    )
+    table.add_column("Validation Name", style="cyan", no_wrap=True)
+    table.add_column("Data Source", style="magenta")
+    table.add_column("Dataset", style="magenta")
+    table.add_column("Time (s)", justify="right", style="green")
+    table.add_column("Queries", justify="right")
+    table.add_column("Rows", justify="right")
+
+    for validation_info in inspect_output.get_timing_report():
+        instrumentation = validation_info.instrumentation
+        table.add_row(
+            validation_info.name,
+            validation_info.data_source_name,
+            validation_info.dataset,
+            f"{instrumentation.time_taken:.3f}",
+            str(instrumentation.query_count),
+            "-" if instrumentation.rows is None else str(instrumentation.rows),
+        )
+
+    return table
+
+
 def _build_html_report(*, inspect_output: InspectOutput, report_path: str):
     template_params = TemplateParams(
         dashboard_id="dcs_dashboard_" + str(uuid.uuid4()).replace("-", ""),
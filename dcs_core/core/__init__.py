@@ -17,3 +17,10 @@ from dcs_core.core.configuration.configuration_parser import (
     load_configuration,
 )
 from dcs_core.core.inspect import Inspect
+from dcs_core.core.utils.tracing import (
+    InMemoryTracer,
+    JsonLinesFileTracer,
+    SpanKind,
+    Tracer,
+    set_tracer,
+)
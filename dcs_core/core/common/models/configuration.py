@@ -39,6 +39,7 @@ class DataSourceType(str, Enum):
     DATABRICKS = "databricks"
     SPARK_DF = "spark_df"
     ORACLE = "oracle"
+    SQLITE = "sqlite"
 
 
 class DataSourceLanguageSupport(str, Enum):
@@ -74,9 +75,16 @@ class DataSourceConnectionConfiguration:
     driver: Optional[str] = None  # SQL Server specific configuration
 
     spark_session: Optional[Any] = None  # Spark specific configuration
+    persist: Optional[bool] = None  # Spark specific configuration
 
     service_name: Optional[str] = None  # Oracle specific configuration
 
+    pool_size: Optional[int] = None  # SQL connection pool configuration
+    max_overflow: Optional[int] = None  # SQL connection pool configuration
+    pool_recycle: Optional[int] = None  # SQL connection pool configuration
+    pool_pre_ping: Optional[bool] = None  # SQL connection pool configuration
+    pool_timeout: Optional[int] = None  # SQL connection pool configuration
+
 
 @dataclass
 class DataSourceConfiguration:
@@ -88,6 +96,7 @@ class DataSourceConfiguration:
     type: DataSourceType
     connection_config: DataSourceConnectionConfiguration
     language_support: Optional[DataSourceLanguageSupport] = None
+    max_concurrency: Optional[int] = None
 
 
 @dataclass
@@ -99,6 +108,13 @@ class ValidationConfig:
     query: Optional[str] = None
     regex: Optional[str] = None
     values: Optional[List] = None
+    # column that strictly increases with every insert, e.g. an auto-increment id.
+    # Rows inserted later with a watermark equal to the last seen one are never scanned.
+    watermark: Optional[str] = None
+    approximate: Optional[bool] = None
+    sample: Optional[float] = None
+    cache: Optional[bool] = None
+    updated_column: Optional[str] = None
 
     def _on_field_validation(self):
         if self.on is None:
@@ -239,11 +255,13 @@ class Configuration:
     metrics: Optional[Dict[str, MetricConfiguration]] = None
     storage: Optional[MetricStorageConfiguration] = None
 
-    def add_spark_session(self, data_source_name: str, spark_session):
+    def add_spark_session(
+        self, data_source_name: str, spark_session, persist: bool = False
+    ):
         self.data_sources[data_source_name] = DataSourceConfiguration(
             name=data_source_name,
             type=DataSourceType.SPARK_DF,
             connection_config=DataSourceConnectionConfiguration(
-                spark_session=spark_session
+                spark_session=spark_session, persist=persist
             ),
         )
@@ -12,11 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import pytz
 from dateutil import parser
 
@@ -98,6 +99,46 @@ class MetricValue:
         )
 
 
+@dataclass
+class FieldDistribution:
+    """
+    FieldDistribution is a class that represents the value distribution of a field profile.
+    """
+
+    field_name: str
+    # most frequent values and their frequencies, in descending order of frequency
+    top_values: np.ndarray
+    top_counts: np.ndarray
+    # equi-width histogram of a numeric field, len(histogram_edges) == len(histogram_counts) + 1
+    histogram_edges: Optional[np.ndarray] = None
+    histogram_counts: Optional[np.ndarray] = None
+
+    @property
+    def json(self):
+        return json.dumps(asdict(self), cls=EnhancedJSONEncoder)
+
+    @classmethod
+    def from_json(cls, json_string: str):
+        json_obj = json.loads(json_string)
+        histogram_edges = json_obj.get("histogram_edges")
+        histogram_counts = json_obj.get("histogram_counts")
+        return cls(
+            field_name=json_obj.get("field_name"),
+            top_values=np.array(json_obj.get("top_values"), dtype=str),
+            top_counts=np.array(json_obj.get("top_counts"), dtype=np.int64),
+            histogram_edges=(
+                np.array(histogram_edges, dtype=np.float64)
+                if histogram_edges is not None
+                else None
+            ),
+            histogram_counts=(
+                np.array(histogram_counts, dtype=np.int64)
+                if histogram_counts is not None
+                else None
+            ),
+        )
+
+
 @dataclass
 class TableMetrics:
     """
@@ -116,6 +157,11 @@ class TableMetrics:
     """
     historical_metrics: Optional[Dict[str, List[MetricValue]]] = None
 
+    """
+    Value distributions of the profiled fields by field name
+    """
+    distributions: Dict[str, FieldDistribution] = field(default_factory=dict)
+
 
 @dataclass
 class IndexMetrics:
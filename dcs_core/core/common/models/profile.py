@@ -12,10 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
-from dcs_core.core.common.models.metric import MetricsType, MetricValue
+from dcs_core.core.common.models.metric import (
+    FieldDistribution,
+    MetricsType,
+    MetricValue,
+)
 
 
 @dataclass
@@ -36,6 +40,7 @@ class NumericFieldProfile:
     distinct_count: Optional[MetricValue] = None
     skewness: Optional[MetricValue] = None
     kurtosis: Optional[MetricValue] = None
+    distribution: Optional[FieldDistribution] = None
 
     @property
     def get_metric_values(self) -> List[MetricValue]:
@@ -62,6 +67,7 @@ class TextFieldProfile:
     avg_length: Optional[MetricValue] = None
     distinct_count: Optional[MetricValue] = None
     missing_count: Optional[MetricValue] = None
+    distribution: Optional[FieldDistribution] = None
 
     @property
     def get_metric_values(self) -> List[MetricValue]:
@@ -73,3 +79,17 @@ class TextFieldProfile:
             if isinstance(value, MetricValue):
                 values.append(value)
         return values
+
+
+@dataclass
+class ProfilingProgress:
+    """
+    ProfilingProgress is a class that represents the progress of a data source profiling.
+    """
+
+    total_tables: int = 0
+    completed_tables: int = 0
+    # tables whose profile was loaded from a checkpoint of an earlier run
+    resumed_tables: int = 0
+    # profiling time in seconds by table name
+    table_timings: Dict[str, float] = field(default_factory=dict)
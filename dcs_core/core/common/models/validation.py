@@ -12,11 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+from dcs_core.core.utils.utils import EnhancedJSONEncoder
 
 
 class ConditionType(str, Enum):
@@ -27,6 +30,16 @@ class ConditionType(str, Enum):
     EQ = "eq"
 
 
+class AggregateMerge(str, Enum):
+    """
+    How a partial aggregate of an incremental validation is merged into its stored value
+    """
+
+    SUM = "sum"
+    MIN = "min"
+    MAX = "max"
+
+
 @dataclass
 class Threshold:
     gte: Optional[float] = None
@@ -188,6 +201,42 @@ class ValidationFunction(str, Enum):
     FAILED_ROWS = "failed_rows"
 
 
+@dataclass
+class QueryStatistics:
+    """
+    Statistics of a query or a search request issued to compute a validation
+    """
+
+    # SQL text or JSON search body
+    text: str
+    # wall time of the query in seconds
+    time_taken: float
+    # rows returned by a SQL query or documents matched by a search, None when unknown
+    rows: Optional[int] = None
+    # number of validations served by the query, e.g. by a fused query
+    shared_by: int = 1
+
+
+@dataclass
+class ValidationInstrumentation:
+    """
+    Cost of the computation of a validation in a run
+    """
+
+    # wall time in seconds, including the share of the queries shared with other validations
+    time_taken: float = 0.0
+    queries: List[QueryStatistics] = field(default_factory=list)
+
+    @property
+    def query_count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def rows(self) -> Optional[int]:
+        rows = [query.rows for query in self.queries if query.rows is not None]
+        return sum(rows) if rows else None
+
+
 @dataclass
 class ValidationInfo:
     name: str
@@ -201,3 +250,34 @@ class ValidationInfo:
     is_valid: Optional[bool] = None
     reason: Optional[str] = None
     tags: Dict[str, str] = None
+    # 95% confidence interval of a value estimated from a sample
+    confidence_interval: Optional[Tuple[float, float]] = None
+    # True when the value is served from the result of an earlier run on unchanged data
+    cached: bool = False
+    instrumentation: Optional[ValidationInstrumentation] = None
+
+    @property
+    def json(self):
+        return json.dumps(asdict(self), cls=EnhancedJSONEncoder)
+
+    @classmethod
+    def from_json(cls, json_string: str):
+        json_obj = json.loads(json_string)
+        confidence_interval = json_obj.get("confidence_interval", None)
+        return cls(
+            name=json_obj.get("name"),
+            identity=json_obj.get("identity"),
+            data_source_name=json_obj.get("data_source_name"),
+            dataset=json_obj.get("dataset"),
+            validation_function=ValidationFunction(json_obj.get("validation_function")),
+            value=json_obj.get("value"),
+            timestamp=datetime.fromisoformat(json_obj.get("timestamp")),
+            field=json_obj.get("field", None),
+            is_valid=json_obj.get("is_valid", None),
+            reason=json_obj.get("reason", None),
+            tags=json_obj.get("tags", None),
+            confidence_interval=tuple(confidence_interval)
+            if confidence_interval is not None
+            else None,
+            cached=json_obj.get("cached", False),
+        )
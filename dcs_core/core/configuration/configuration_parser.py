@@ -28,6 +28,9 @@ from dcs_core.core.common.models.configuration import (
     DataSourceConnectionConfiguration,
     DataSourceLanguageSupport,
     DataSourceType,
+    LocalFileStorageParameters,
+    MetricStorageConfiguration,
+    MetricStorageType,
     ValidationConfig,
     ValidationConfigByDataset,
 )
@@ -76,6 +79,11 @@ class DataSourceConfigParser(ConfigParser):
             warehouse=config["connection"].get("warehouse"),
             role=config["connection"].get("role"),
             service_name=config["connection"].get("service_name"),
+            pool_size=config["connection"].get("pool_size"),
+            max_overflow=config["connection"].get("max_overflow"),
+            pool_recycle=config["connection"].get("pool_recycle"),
+            pool_pre_ping=config["connection"].get("pool_pre_ping"),
+            pool_timeout=config["connection"].get("pool_timeout"),
         )
         return connection_config
 
@@ -110,6 +118,7 @@ class DataSourceConfigParser(ConfigParser):
                     config=config
                 ),
                 language_support=language_support,
+                max_concurrency=config.get("max_concurrency"),
             )
             data_source_configurations[name_] = data_source_configuration
 
@@ -145,6 +154,11 @@ class ValidationConfigParser(ConfigParser):
                         query=value.get("query"),
                         regex=value.get("regex"),
                         values=value.get("values"),
+                        watermark=value.get("watermark"),
+                        approximate=value.get("approximate"),
+                        sample=value.get("sample"),
+                        cache=value.get("cache"),
+                        updated_column=value.get("updated_column"),
                     )
                     validation_dict[validation_name] = validation_config
 
@@ -183,6 +197,28 @@ class ValidationConfigParser(ConfigParser):
             )
 
 
+class StorageConfigParser(ConfigParser):
+    @staticmethod
+    def _local_file_storage_config_parser(config: Dict) -> LocalFileStorageParameters:
+        if "params" not in config:
+            raise DataChecksConfigurationError(
+                "storage params should be provided for local file storage configuration"
+            )
+        if "path" not in config["params"]:
+            raise DataChecksConfigurationError(
+                "path should be provided for local file storage configuration"
+            )
+        return LocalFileStorageParameters(path=config["params"]["path"])
+
+    def parse(self, config: Dict) -> Optional[MetricStorageConfiguration]:
+        if config["type"] == MetricStorageType.LOCAL_FILE:
+            return MetricStorageConfiguration(
+                type=MetricStorageType.LOCAL_FILE,
+                params=self._local_file_storage_config_parser(config=config),
+            )
+        return None
+
+
 def _parse_configuration_from_dict(config_dict: Dict) -> Configuration:
     try:
         data_source_configurations = {}
@@ -192,8 +228,14 @@ def _parse_configuration_from_dict(config_dict: Dict) -> Configuration:
             )
         validate_configurations = ValidationConfigParser().parse(config_dict)
 
+        storage_configuration = None
+        if config_dict.get("storage") is not None:
+            storage_configuration = StorageConfigParser().parse(config_dict["storage"])
+
         configuration = Configuration(
-            data_sources=data_source_configurations, validations=validate_configurations
+            data_sources=data_source_configurations,
+            validations=validate_configurations,
+            storage=storage_configuration,
         )
 
         return configuration
@@ -221,6 +263,8 @@ def load_configuration_from_yaml_str(
             configuration.data_sources[k] = v
         for k, v in from_dict.validations.items():
             configuration.validations[k] = v
+        if from_dict.storage is not None:
+            configuration.storage = from_dict.storage
     return from_dict
 
 
@@ -288,5 +332,7 @@ def load_configuration(
                     configuration.data_sources[k] = v
                 for k, v in from_dict.validations.items():
                     configuration.validations[k] = v
+                if from_dict.storage is not None:
+                    configuration.storage = from_dict.storage
 
             return from_dict
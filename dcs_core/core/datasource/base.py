@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 from abc import ABC
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from dcs_core.core.common.models.configuration import DataSourceLanguageSupport
 
@@ -62,3 +62,16 @@ class DataSource(ABC):
         Close the connection
         """
         raise NotImplementedError("close_connection method is not implemented")
+
+    def start_run(self, datasets: Iterable[str] = ()):
+        """
+        Called at the start of an inspection run. Data sources can set up run scoped state here.
+        :param datasets: names of the datasets that the run queries
+        """
+        pass
+
+    def end_run(self):
+        """
+        Called at the end of an inspection run to release run scoped state
+        """
+        pass
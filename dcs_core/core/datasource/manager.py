@@ -12,8 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import importlib
-from dataclasses import asdict
-from typing import Dict, List
+from dataclasses import asdict, replace
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
 from dcs_core.core.common.models.configuration import (
@@ -21,6 +23,8 @@ from dcs_core.core.common.models.configuration import (
     DataSourceConfiguration,
 )
 from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from dcs_core.core.utils.tracing import SpanKind, trace
 
 
 class DataSourceManager:
@@ -41,24 +45,127 @@ class DataSourceManager:
         "snowflake": "SnowFlakeDataSource",
         "mssql": "MssqlDataSource",
         "oracle": "OracleDataSource",
+        "sqlite": "SQLiteDataSource",
     }
 
     def __init__(self, config: Configuration):
         self._config = config
         self._data_sources: Dict[str, DataSource] = {}
+        self._data_source_configs: Dict[str, DataSourceConfiguration] = {}
+        self._removed_async_data_sources: List[SearchIndexDataSource] = []
 
     def connect(self):
-        for name, data_source_config in self._config.data_sources.items():
-            self._data_sources[data_source_config.name] = self._create_data_source(
+        """
+        Connect the new and changed data sources. The data source of an unchanged
+        configuration is kept connected, so that its connection pool and the validations
+        and plans built on it in an earlier run are reused. The data sources that were
+        changed or removed from the configuration are closed.
+        """
+        data_source_names = {
+            data_source_config.name
+            for data_source_config in self._config.data_sources.values()
+        }
+        for name in list(self._data_sources.keys()):
+            if name not in data_source_names:
+                self._close_data_source(name)
+
+        for data_source_config in self._config.data_sources.values():
+            name = data_source_config.name
+            if self._data_source_configs.get(name) == data_source_config:
+                continue
+            if name in self._data_sources:
+                self._close_data_source(name)
+            data_source = self._create_data_source(
                 data_source_config=data_source_config
             )
-        for data_source in self._data_sources.values():
             try:
-                data_source.connect()
+                with trace(
+                    SpanKind.DATA_SOURCE,
+                    "connect",
+                    data_source=data_source.data_source_name,
+                ):
+                    data_source.connect()
             except Exception as e:
+                self._close(data_source)
                 raise DataChecksDataSourcesConnectionError(
                     f"Failed to connect to data source {data_source.data_source_name} [{str(e)}]"
                 )
+            self._data_sources[name] = data_source
+            # a copy, the configuration objects may be changed in place between runs
+            self._data_source_configs[name] = replace(
+                data_source_config,
+                connection_config=replace(data_source_config.connection_config),
+            )
+
+    def _close_data_source(self, name: str):
+        self._data_source_configs.pop(name, None)
+        data_source = self._data_sources.pop(name)
+        # an asyncio client can only be closed on its event loop, see connect_async
+        if (
+            isinstance(data_source, SearchIndexDataSource)
+            and data_source.async_client is not None
+        ):
+            self._removed_async_data_sources.append(data_source)
+        self._close(data_source)
+
+    @staticmethod
+    def _close(data_source: DataSource):
+        try:
+            data_source.close()
+        except Exception as e:
+            logger.warning(
+                f"Failed to close data source {data_source.data_source_name} [{str(e)}]"
+            )
+
+    def close(self):
+        """
+        Close all the data sources
+        """
+        for name in list(self._data_sources.keys()):
+            self._close_data_source(name)
+
+    async def connect_async(self):
+        """
+        Connect the asyncio clients of the search data sources. The clients of the data
+        sources closed by connect since the last call are closed here, on the event loop.
+        """
+        await self._close_removed_async_clients()
+        for data_source in self._data_sources.values():
+            if isinstance(data_source, SearchIndexDataSource):
+                await data_source.connect_async()
+
+    async def close_async(self):
+        """
+        Close the asyncio clients of the search data sources
+        """
+        await self._close_removed_async_clients()
+        for data_source in self._data_sources.values():
+            if isinstance(data_source, SearchIndexDataSource):
+                await data_source.close_async()
+
+    async def _close_removed_async_clients(self):
+        removed_data_sources, self._removed_async_data_sources = (
+            self._removed_async_data_sources,
+            [],
+        )
+        for data_source in removed_data_sources:
+            await data_source.close_async()
+
+    def start_run(self, datasets: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Notify the data sources that an inspection run is starting
+        :param datasets: names of the datasets that the run queries, by data source name
+        """
+        datasets = datasets or {}
+        for name, data_source in self._data_sources.items():
+            data_source.start_run(datasets.get(name, ()))
+
+    def end_run(self):
+        """
+        Notify the data sources that an inspection run has ended
+        """
+        for data_source in self._data_sources.values():
+            data_source.end_run()
 
     @property
     def get_data_sources(self) -> Dict[str, DataSource]:
@@ -83,7 +190,10 @@ class DataSourceManager:
 
             return SparkDFDataSource(
                 data_source_name,
-                {"spark_session": data_source_config.connection_config.spark_session},
+                {
+                    "spark_session": data_source_config.connection_config.spark_session,
+                    "persist": data_source_config.connection_config.persist,
+                },
             )
         try:
             module_name = (
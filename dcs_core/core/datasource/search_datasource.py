@@ -12,12 +12,30 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import json
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from dateutil import parser
 
 from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.utils.instrumentation import record_query
+from dcs_core.core.utils.tracing import SpanKind, trace
+
+
+@dataclass
+class SearchRequest:
+    """
+    A search request body together with the function that reads the metric value
+    from the search response
+    """
+
+    index_name: str
+    body: Dict
+    extract: Callable[[Dict], Any]
 
 
 class SearchIndexDataSource(DataSource):
@@ -41,10 +59,55 @@ class SearchIndexDataSource(DataSource):
         "nested": dict,
     }
 
+    # Regex patterns of the predefined string pattern validations
+    PREDEFINED_REGEX_PATTERNS = {
+        "usa_phone": "\\+?1?[-.\\s]?\\(?[0-9]{3}\\)?[-.\\s]?[0-9]{3}[-.\\s]?[0-9]{4}"
+    }
+
+    # Maximum number of searches sent in a single _msearch request
+    MAX_MSEARCH_REQUESTS = 100
+
+    # Number of composite aggregation buckets fetched per page when counting duplicates
+    DUPLICATE_COUNT_PAGE_SIZE = 1000
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
         self.client = None
+        self.async_client = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def create_async_client(self) -> Any:
+        """
+        Create the asyncio client of the data source.
+        Returns None if the data source has no asyncio client, its requests then run
+        on the synchronous client.
+        """
+        return None
+
+    async def connect_async(self):
+        """
+        Connect the asyncio client of the data source. The client and its connection pool
+        are kept for the lifetime of the data source, they are only created again when
+        the data source is used on another event loop, which the client is bound to.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client_loop is loop:
+            return
+        self.async_client = self.create_async_client()
+        self._async_client_loop = loop
+
+    async def close_async(self):
+        """
+        Close the asyncio client of the data source
+        """
+        if (
+            self.async_client is not None
+            and self._async_client_loop is asyncio.get_running_loop()
+        ):
+            await self.async_client.close()
+        self.async_client = None
+        self._async_client_loop = None
 
     def query_get_index_metadata(self) -> List[str]:
         """
@@ -81,6 +144,220 @@ class SearchIndexDataSource(DataSource):
         types = self.query_get_field_metadata(index_name=index_name)
         return types[field]
 
+    def _search(self, index_name: str, body: Dict) -> Dict:
+        """
+        Send a search and record its statistics
+        :param index_name: name of the index
+        :param body: search body
+        :return: search response
+        """
+        start = time.perf_counter()
+        with trace(
+            SpanKind.QUERY,
+            "search",
+            data_source=self.data_source_name,
+            index=index_name,
+            query=body,
+        ):
+            response = self.client.search(index=index_name, body=body)
+        total = response.get("hits", {}).get("total")
+        record_query(
+            body, start, rows=total.get("value") if isinstance(total, dict) else total
+        )
+        return response
+
+    def execute_search_request(self, request: SearchRequest) -> Any:
+        """
+        Execute a single search request
+        :param request: search request
+        :return: metric value
+        """
+        response = self._search(request.index_name, request.body)
+        return request.extract(response)
+
+    @staticmethod
+    def is_aggregation_only(body: Dict) -> bool:
+        """
+        Check if a search body only computes aggregations, without returning hits
+        :param body: search body
+        """
+        return (
+            body.get("size") == 0
+            and "aggs" in body
+            and set(body.keys()) <= {"size", "query", "aggs"}
+        )
+
+    def combine_search_requests(
+        self, requests: List[SearchRequest]
+    ) -> Tuple[List[Tuple[str, Dict]], List[Tuple[int, Optional[Dict[str, str]]]]]:
+        """
+        Combine the aggregation only requests on the same index and query into a single
+        size 0 search with sibling aggregations, so the metrics come from one shard pass.
+        :param requests: search requests
+        :return: list of (index name, search body) and, per request, the position of the
+            search that serves it with the names of its aggregations there
+        """
+        searches: List[Tuple[str, Dict]] = []
+        routes: List[Tuple[int, Optional[Dict[str, str]]]] = []
+        combined_searches: Dict[Tuple[str, str], int] = {}
+        for request in requests:
+            if not self.is_aggregation_only(request.body):
+                searches.append((request.index_name, request.body))
+                routes.append((len(searches) - 1, None))
+                continue
+            key = (
+                request.index_name,
+                json.dumps(request.body.get("query"), sort_keys=True),
+            )
+            if key not in combined_searches:
+                body = {"size": 0, "aggs": {}}
+                if "query" in request.body:
+                    body["query"] = request.body["query"]
+                searches.append((request.index_name, body))
+                combined_searches[key] = len(searches) - 1
+            position = combined_searches[key]
+            aggregations = searches[position][1]["aggs"]
+            names: Dict[str, str] = {}
+            for name, aggregation in request.body["aggs"].items():
+                combined_name = next(
+                    (n for n, a in aggregations.items() if a == aggregation), None
+                )
+                if combined_name is None:
+                    combined_name = f"agg_{len(aggregations)}"
+                    aggregations[combined_name] = aggregation
+                names[name] = combined_name
+            routes.append((position, names))
+        return searches, routes
+
+    @staticmethod
+    def route_search_responses(
+        routes: List[Tuple[int, Optional[Dict[str, str]]]],
+        search_responses: List[Optional[Dict]],
+    ) -> List[Optional[Dict]]:
+        """
+        Give every request the response of the search that served it, with its own
+        aggregation names
+        """
+        responses: List[Optional[Dict]] = []
+        for position, names in routes:
+            response = search_responses[position]
+            if response is not None and names is not None:
+                response = {
+                    **response,
+                    "aggregations": {
+                        name: response["aggregations"][combined_name]
+                        for name, combined_name in names.items()
+                    },
+                }
+            responses.append(response)
+        return responses
+
+    def execute_search_requests(
+        self, requests: List[SearchRequest]
+    ) -> List[Optional[Dict]]:
+        """
+        Execute the search requests with _msearch, see combine_search_requests
+        :param requests: search requests
+        :return: responses in the order of the requests, None for a failed request
+        """
+        searches, routes = self.combine_search_requests(requests)
+        return self.route_search_responses(routes, self._msearch(searches))
+
+    async def execute_search_requests_async(
+        self, requests: List[SearchRequest], max_concurrency: int = 1
+    ) -> List[Optional[Dict]]:
+        """
+        Execute the search requests with _msearch on the async client
+        :param requests: search requests
+        :param max_concurrency: maximum number of _msearch requests in flight
+        :return: responses in the order of the requests, None for a failed request
+        """
+        searches, routes = self.combine_search_requests(requests)
+        return self.route_search_responses(
+            routes, await self._msearch_async(searches, max_concurrency)
+        )
+
+    def _msearch_bodies(self, searches: List[Tuple[str, Dict]]) -> List[List[Dict]]:
+        """
+        Build the _msearch bodies of the searches, MAX_MSEARCH_REQUESTS per body
+        """
+        bodies = []
+        for offset in range(0, len(searches), self.MAX_MSEARCH_REQUESTS):
+            body = []
+            for index_name, search_body in searches[
+                offset : offset + self.MAX_MSEARCH_REQUESTS
+            ]:
+                body.append({"index": index_name})
+                body.append(search_body)
+            bodies.append(body)
+        return bodies
+
+    def _msearch(self, searches: List[Tuple[str, Dict]]) -> List[Optional[Dict]]:
+        """
+        Send the searches with _msearch, MAX_MSEARCH_REQUESTS per round trip
+        :param searches: list of (index name, search body)
+        :return: responses in the order of the searches, None for a failed search
+        """
+        responses: List[Optional[Dict]] = []
+        for body in self._msearch_bodies(searches):
+            start = time.perf_counter()
+            with trace(
+                SpanKind.QUERY, "msearch", data_source=self.data_source_name, query=body
+            ):
+                result = self.client.msearch(body=body)
+            record_query(body, start)
+            for response in result["responses"]:
+                responses.append(None if "error" in response else response)
+        return responses
+
+    async def _msearch_async(
+        self, searches: List[Tuple[str, Dict]], max_concurrency: int = 1
+    ) -> List[Optional[Dict]]:
+        """
+        Send the searches with _msearch on the async client, with at most max_concurrency
+        round trips in flight
+        :param searches: list of (index name, search body)
+        :param max_concurrency: maximum number of _msearch requests in flight
+        :return: responses in the order of the searches, None for a failed search
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def send(body: List[Dict]) -> Dict:
+            async with semaphore:
+                start = time.perf_counter()
+                with trace(
+                    SpanKind.QUERY,
+                    "msearch",
+                    data_source=self.data_source_name,
+                    query=body,
+                ):
+                    result = await self.async_client.msearch(body=body)
+                record_query(body, start)
+                return result
+
+        results = await asyncio.gather(
+            *(send(body) for body in self._msearch_bodies(searches))
+        )
+        return [
+            None if "error" in response else response
+            for result in results
+            for response in result["responses"]
+        ]
+
+    def request_get_document_count(
+        self, index_name: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"document_count": {"filter": {"match_all": {}}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: response["aggregations"]["document_count"][
+                "doc_count"
+            ],
+        )
+
     def query_get_document_count(self, index_name: str, filters: Dict = None) -> int:
         """
         Get the document count
@@ -88,9 +365,21 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: count of documents
         """
-        body = {"query": filters} if filters else {}
-        response = self.client.count(index=index_name, body=body)
-        return response["count"]
+        return self.execute_search_request(
+            self.request_get_document_count(index_name=index_name, filters=filters)
+        )
+
+    def request_get_max(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"max_value": {"max": {"field": field}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: response["aggregations"]["max_value"]["value"],
+        )
 
     def query_get_max(self, index_name: str, field: str, filters: Dict = None) -> int:
         """
@@ -100,12 +389,21 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: max value
         """
-        query = {"aggs": {"max_value": {"max": {"field": field}}}}
-        if filters:
-            query["query"] = filters
+        return self.execute_search_request(
+            self.request_get_max(index_name=index_name, field=field, filters=filters)
+        )
 
-        response = self.client.search(index=index_name, body=query)
-        return response["aggregations"]["max_value"]["value"]
+    def request_get_min(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"min_value": {"min": {"field": field}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: response["aggregations"]["min_value"]["value"],
+        )
 
     def query_get_min(self, index_name: str, field: str, filters: Dict = None) -> int:
         """
@@ -115,12 +413,23 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"min_value": {"min": {"field": field}}}}
-        if filters:
-            query["query"] = filters
+        return self.execute_search_request(
+            self.request_get_min(index_name=index_name, field=field, filters=filters)
+        )
 
-        response = self.client.search(index=index_name, body=query)
-        return response["aggregations"]["min_value"]["value"]
+    def request_get_avg(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"avg_value": {"avg": {"field": field}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: round(
+                response["aggregations"]["avg_value"]["value"], 2
+            ),
+        )
 
     def query_get_avg(self, index_name: str, field: str, filters: Dict = None) -> int:
         """
@@ -130,12 +439,23 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"avg_value": {"avg": {"field": field}}}}
-        if filters:
-            query["query"] = filters
+        return self.execute_search_request(
+            self.request_get_avg(index_name=index_name, field=field, filters=filters)
+        )
 
-        response = self.client.search(index=index_name, body=query)
-        return round(response["aggregations"]["avg_value"]["value"], 2)
+    def request_get_sum(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"sum_value": {"sum": {"field": field}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: round(
+                response["aggregations"]["sum_value"]["value"], 2
+            ),
+        )
 
     def query_get_sum(self, index_name: str, field: str, filters: Dict = None) -> int:
         """
@@ -145,12 +465,23 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"sum_value": {"sum": {"field": field}}}}
-        if filters:
-            query["query"] = filters
+        return self.execute_search_request(
+            self.request_get_sum(index_name=index_name, field=field, filters=filters)
+        )
 
-        response = self.client.search(index=index_name, body=query)
-        return round(response["aggregations"]["sum_value"]["value"], 2)
+    def request_get_variance(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"stats": {"extended_stats": {"field": field}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: round(
+                response["aggregations"]["stats"]["variance_sampling"], 2
+            ),
+        )
 
     def query_get_variance(
         self, index_name: str, field: str, filters: Dict = None
@@ -162,12 +493,25 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"stats": {"extended_stats": {"field": field}}}}
-        if filters:
-            query["query"] = filters
+        return self.execute_search_request(
+            self.request_get_variance(
+                index_name=index_name, field=field, filters=filters
+            )
+        )
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-        return round(response["stats"]["variance_sampling"], 2)
+    def request_get_stddev(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"stats": {"extended_stats": {"field": field}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: round(
+                response["aggregations"]["stats"]["std_deviation_sampling"], 2
+            ),
+        )
 
     def query_get_stddev(
         self, index_name: str, field: str, filters: Dict = None
@@ -179,12 +523,26 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"stats": {"extended_stats": {"field": field}}}}
-        if filters:
-            query["query"] = filters
+        return self.execute_search_request(
+            self.request_get_stddev(index_name=index_name, field=field, filters=filters)
+        )
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-        return round(response["stats"]["std_deviation_sampling"], 2)
+    def request_get_distinct_count(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {
+            "size": 0,
+            "aggs": {"distinct_count": {"cardinality": {"field": field}}},
+        }
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: response["aggregations"]["distinct_count"][
+                "value"
+            ],
+        )
 
     def query_get_distinct_count(
         self, index_name: str, field: str, filters: Dict = None
@@ -196,12 +554,11 @@ class SearchIndexDataSource(DataSource):
         :param filters:
         :return:
         """
-        query = {"aggs": {"distinct_count": {"cardinality": {"field": field}}}}
-        if filters:
-            query["query"] = filters
-
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-        return response["distinct_count"]["value"]
+        return self.execute_search_request(
+            self.request_get_distinct_count(
+                index_name=index_name, field=field, filters=filters
+            )
+        )
 
     def query_get_time_diff(self, index_name: str, field: str) -> int:
         """
@@ -211,9 +568,14 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: time difference in milliseconds
         """
-        query = {"query": {"match_all": {}}, "sort": [{f"{field}": {"order": "desc"}}]}
+        query = {
+            "size": 1,
+            "_source": [field],
+            "query": {"match_all": {}},
+            "sort": [{f"{field}": {"order": "desc"}}],
+        }
 
-        response = self.client.search(index=index_name, body=query)
+        response = self._search(index_name, query)
 
         if response["hits"]["hits"]:
             last_updated = response["hits"]["hits"][0]["_source"][field]
@@ -224,6 +586,20 @@ class SearchIndexDataSource(DataSource):
 
         return 0
 
+    def request_get_null_count(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {"size": 0, "aggs": {"null_count": {"missing": {"field": field}}}}
+        if filters:
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: response["aggregations"]["null_count"][
+                "doc_count"
+            ],
+        )
+
     def query_get_null_count(
         self, index_name: str, field: str, filters: Dict = None
     ) -> int:
@@ -234,11 +610,37 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: null count
         """
-        query = {"query": {"bool": {"must_not": {"exists": {"field": field}}}}}
+        return self.execute_search_request(
+            self.request_get_null_count(
+                index_name=index_name, field=field, filters=filters
+            )
+        )
+
+    def request_get_null_percentage(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {
+            "size": 0,
+            "aggs": {
+                "null_count": {"missing": {"field": field}},
+                "total_count": {"value_count": {"field": field}},
+            },
+        }
         if filters:
-            query["query"]["bool"]["filter"] = filters
-        response = self.client.search(index=index_name, body=query)
-        return response["hits"]["total"]["value"]
+            body["query"] = filters
+
+        def extract(response: Dict) -> float:
+            aggregations = response["aggregations"]
+            return round(
+                (
+                    aggregations["null_count"]["doc_count"]
+                    / aggregations["total_count"]["value"]
+                )
+                * 100,
+                2,
+            )
+
+        return SearchRequest(index_name=index_name, body=body, extract=extract)
 
     def query_get_null_percentage(
         self, index_name: str, field: str, filters: Dict = None
@@ -250,21 +652,29 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: null percentage
         """
-        query = {
+        return self.execute_search_request(
+            self.request_get_null_percentage(
+                index_name=index_name, field=field, filters=filters
+            )
+        )
+
+    def request_get_empty_string_count(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> SearchRequest:
+        body = {
             "size": 0,
             "aggs": {
-                "null_count": {"missing": {"field": field}},
-                "total_count": {"value_count": {"field": field}},
+                "empty_string_count": {"filter": {"match": {f"{field}.keyword": ""}}}
             },
         }
         if filters:
-            query["query"] = filters
-
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-        return round(
-            (response["null_count"]["doc_count"] / response["total_count"]["value"])
-            * 100,
-            2,
+            body["query"] = filters
+        return SearchRequest(
+            index_name=index_name,
+            body=body,
+            extract=lambda response: response["aggregations"]["empty_string_count"][
+                "doc_count"
+            ],
         )
 
     def query_get_empty_string_count(
@@ -277,24 +687,16 @@ class SearchIndexDataSource(DataSource):
         :param filters: optional filter
         :return: count of empty strings
         """
+        return self.execute_search_request(
+            self.request_get_empty_string_count(
+                index_name=index_name, field=field, filters=filters
+            )
+        )
 
-        query = {"query": {"bool": {"must": {"match": {f"{field}.keyword": ""}}}}}
-        if filters:
-            query["query"]["bool"]["filter"] = filters
-        response = self.client.search(index=index_name, body=query)
-        return response["hits"]["total"]["value"]
-
-    def query_get_empty_string_percentage(
+    def request_get_empty_string_percentage(
         self, index_name: str, field: str, filters: Dict = None
-    ) -> float:
-        """
-        Get the empty string percentage
-        :param index_name: name of the index
-        :param field: field name
-        :param filters: optional filter
-        :return: empty string percentage
-        """
-        query = {
+    ) -> SearchRequest:
+        body = {
             "size": 0,
             "aggs": {
                 "empty_string_count": {
@@ -304,16 +706,33 @@ class SearchIndexDataSource(DataSource):
             },
         }
         if filters:
-            query["query"] = filters
+            body["query"] = filters
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
-        total_count = response["total_count"]["value"]
-        empty_string_count = response["empty_string_count"]["doc_count"]
+        def extract(response: Dict) -> float:
+            aggregations = response["aggregations"]
+            total_count = aggregations["total_count"]["value"]
+            empty_string_count = aggregations["empty_string_count"]["doc_count"]
+            if total_count == 0:
+                return 0.0
+            return round((empty_string_count / total_count) * 100, 2)
 
-        if total_count == 0:
-            return 0.0
+        return SearchRequest(index_name=index_name, body=body, extract=extract)
 
-        return round((empty_string_count / total_count) * 100, 2)
+    def query_get_empty_string_percentage(
+        self, index_name: str, field: str, filters: Dict = None
+    ) -> float:
+        """
+        Get the empty string percentage
+        :param index_name: name of the index
+        :param field: field name
+        :param filters: optional filter
+        :return: empty string percentage
+        """
+        return self.execute_search_request(
+            self.request_get_empty_string_percentage(
+                index_name=index_name, field=field, filters=filters
+            )
+        )
 
     def profiling_search_aggregates_numeric(self, index_name: str, field: str) -> Dict:
         """
@@ -324,13 +743,14 @@ class SearchIndexDataSource(DataSource):
         """
 
         query = {
+            "size": 0,
             "aggs": {
                 "stats": {"extended_stats": {"field": field}},
                 "distinct_count": {"cardinality": {"field": field}},
                 "missing_count": {"missing": {"field": field}},
-            }
+            },
         }
-        response = self.client.search(index=index_name, body=query)["aggregations"]
+        response = self._search(index_name, query)["aggregations"]
 
         return {
             "avg": response["stats"]["avg"],
@@ -356,16 +776,17 @@ class SearchIndexDataSource(DataSource):
             }
         }
         query = {
+            "size": 0,
             "aggs": {
                 "max_length": {"max": script},
                 "min_length": {"min": script},
                 "avg_length": {"avg": script},
                 "distinct_count": {"cardinality": {"field": f"{field}.keyword"}},
                 "missing_count": {"missing": {"field": f"{field}.keyword"}},
-            }
+            },
         }
 
-        response = self.client.search(index=index_name, body=query)["aggregations"]
+        response = self._search(index_name, query)["aggregations"]
 
         return {
             "distinct_count": response["distinct_count"]["value"],
@@ -379,28 +800,35 @@ class SearchIndexDataSource(DataSource):
         self, index_name: str, field: str, filters: Dict = None
     ) -> int:
         """
-        Get the duplicate count
+        Get the duplicate count.
+        The values are streamed with a composite aggregation, DUPLICATE_COUNT_PAGE_SIZE buckets
+        per page, and the buckets with more than one document are counted page by page.
         :param index_name: name of the index
         :param field: field name
         :return: duplicate count
         """
         field_type = self.query_get_field_type(index_name=index_name, field=field)
-        query = {
-            "aggs": {
-                "duplicate_count": {
-                    "terms": {
-                        "field": field if field_type != "str" else f"{field}.keyword",
-                        "size": 10000,
-                        "min_doc_count": 2,
-                    },
-                }
-            }
+        terms_field = field if field_type != "str" else f"{field}.keyword"
+        composite = {
+            "size": self.DUPLICATE_COUNT_PAGE_SIZE,
+            "sources": [{"value": {"terms": {"field": terms_field}}}],
         }
+        query = {"size": 0, "aggs": {"duplicate_count": {"composite": composite}}}
         if filters:
             query["query"] = filters
-        response = self.client.search(index=index_name, body=query)["aggregations"]
 
-        return len(response["duplicate_count"]["buckets"])
+        duplicate_count = 0
+        while True:
+            response = self._search(index_name, query)
+            aggregation = response["aggregations"]["duplicate_count"]
+            # composite aggregations do not support min_doc_count, filter every page
+            duplicate_count += sum(
+                1 for bucket in aggregation["buckets"] if bucket["doc_count"] > 1
+            )
+            after_key = aggregation.get("after_key")
+            if not aggregation["buckets"] or after_key is None:
+                return duplicate_count
+            composite["after"] = after_key
 
     def query_string_pattern_validity(
         self,
@@ -419,21 +847,18 @@ class SearchIndexDataSource(DataSource):
         :param filters: filter condition
         :return: count of valid values, count of total row count
         """
-        regex_patterns = {
-            "usa_phone": "\\+?1?[-.\\s]?\\(?[0-9]{3}\\)?[-.\\s]?[0-9]{3}[-.\\s]?[0-9]{4}"
-        }
-
         if not regex_pattern and not predefined_regex_pattern:
             raise ValueError(
                 "Either regex_pattern or predefined_regex_pattern should be provided"
             )
 
         if predefined_regex_pattern:
-            regex_string = regex_patterns[predefined_regex_pattern]
+            regex_string = self.PREDEFINED_REGEX_PATTERNS[predefined_regex_pattern]
         else:
             regex_string = regex_pattern
 
         query = {
+            "size": 0,
             "track_total_hits": True,
             "query": {"regexp": {f"{field}.keyword": regex_string}},
         }
@@ -441,8 +866,17 @@ class SearchIndexDataSource(DataSource):
         if filters:
             query["query"]["bool"]["filter"] = filters
 
-        response = self.client.search(index=index_name, body=query)
-        total_count = self.client.count(
-            index=index_name, body={"query": {"match_all": {}}}
-        )
+        response = self._search(index_name, query)
+        start = time.perf_counter()
+        with trace(
+            SpanKind.QUERY,
+            "count",
+            data_source=self.data_source_name,
+            index=index_name,
+            query={"query": {"match_all": {}}},
+        ):
+            total_count = self.client.count(
+                index=index_name, body={"query": {"match_all": {}}}
+            )
+        record_query({"query": {"match_all": {}}}, start, rows=total_count["count"])
         return response["hits"]["total"]["value"], total_count["count"]
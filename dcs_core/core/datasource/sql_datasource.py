@@ -12,13 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from sqlalchemy import inspect, text
-from sqlalchemy.engine import Connection
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Connection, Engine
 
 from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.utils.instrumentation import record_query
+from dcs_core.core.utils.tracing import SpanKind, trace
 
 
 class SQLDataSource(DataSource):
@@ -26,31 +31,349 @@ class SQLDataSource(DataSource):
     Abstract class for SQL data sources
     """
 
+    PREDEFINED_REGEX_PATTERNS = {
+        "uuid": r"^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$",
+        "usa_phone": r"^(\+1[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}$",
+        "email": r"^(?!.*\.\.)(?!.*@.*@)[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+        "usa_zip_code": r"^[0-9]{5}(?:-[0-9]{4})?$",
+        "ssn": r"^(?!000|666|9\d{2})\d{3}-(?!00)\d{2}-(?!0000)\d{4}$",
+        "sedol": r"[B-Db-dF-Hf-hJ-Nj-nP-Tp-tV-Xv-xYyZz\d]{6}\d",
+        "lei": r"^[A-Z0-9]{18}[0-9]{2}$",
+        "cusip": r"^[0-9A-Z]{9}$",
+        "figi": r"^BBG[A-Z0-9]{9}$",
+        "isin": r"^[A-Z]{2}[A-Z0-9]{9}[0-9]$",
+        "perm_id": r"^\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{3}$",
+    }
+
+    USA_STATE_CODES = [
+        "AL",
+        "AK",
+        "AZ",
+        "AR",
+        "CA",
+        "CO",
+        "CT",
+        "DE",
+        "FL",
+        "GA",
+        "HI",
+        "ID",
+        "IL",
+        "IN",
+        "IA",
+        "KS",
+        "KY",
+        "LA",
+        "ME",
+        "MD",
+        "MA",
+        "MI",
+        "MN",
+        "MS",
+        "MO",
+        "MT",
+        "NE",
+        "NV",
+        "NH",
+        "NJ",
+        "NM",
+        "NY",
+        "NC",
+        "ND",
+        "OH",
+        "OK",
+        "OR",
+        "PA",
+        "RI",
+        "SC",
+        "SD",
+        "TN",
+        "TX",
+        "UT",
+        "VT",
+        "VA",
+        "WA",
+        "WV",
+        "WI",
+        "WY",
+    ]
+
+    # USA_STATE_CODES as the item list of a SQL IN condition
+    USA_STATE_CODES_SQL = ", ".join(f"'{code}'" for code in USA_STATE_CODES)
+
+    # Maximum number of columns in the select list of a single query
+    MAX_SELECT_COLUMNS = 1000
+
+    # Aggregates of the profile of a numeric column by metric name
+    PROFILING_NUMERIC_AGGREGATES = {
+        "avg": "avg({column})",
+        "min": "min({column})",
+        "max": "max({column})",
+        "sum": "sum({column})",
+        "stddev": "stddev_samp({column})",
+        "variance": "var_samp({column})",
+        "distinct_count": "count(distinct({column}))",
+        "missing_count": "sum(case when {column} is null then 1 else 0 end)",
+        # raw moments for the skewness and the kurtosis
+        "non_null_count": "count({column})",
+        "sum_squares": "sum(1.0 * {column} * {column})",
+        "sum_cubes": "sum(1.0 * {column} * {column} * {column})",
+        "sum_fourth_powers": "sum(1.0 * {column} * {column} * {column} * {column})",
+    }
+
+    # Aggregates of the profile of a text column by metric name
+    PROFILING_STRING_AGGREGATES = {
+        "distinct_count": "count(distinct({column}))",
+        "missing_count": "sum(case when {column} is null then 1 else 0 end)",
+        "max_length": "max(length({column}))",
+        "min_length": "min(length({column}))",
+        "avg_length": "avg(length({column}))",
+    }
+
+    # Number of equi-width bins of the histogram of a numeric column profile
+    PROFILING_HISTOGRAM_BINS = 10
+
+    # Number of most frequent values of a column profile
+    PROFILING_TOP_K = 10
+
+    # Type that column values are cast to, to return values of any type in one column
+    TEXT_CAST_TYPE = "VARCHAR(255)"
+
+    # Whether the dialect supports GROUP BY GROUPING SETS
+    SUPPORTS_GROUPING_SETS = True
+
+    # ISO 8601 timestamp of the timestamp validity validations
+    TIMESTAMP_ISO_REGEX = r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])T([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.\d{1,3})?(Z|[+-](0[0-9]|1[0-4]):[0-5][0-9])?$"
+
+    # Connection pool settings that can be set in the data source connection configuration
+    POOL_OPTIONS = [
+        "pool_size",
+        "max_overflow",
+        "pool_recycle",
+        "pool_pre_ping",
+        "pool_timeout",
+    ]
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
         self.connection: Union[Connection, None] = None
+        self.engine: Union[Engine, None] = None
         self.database: str = data_connection.get("database")
         self.use_sa_text_query = True
+        self._row_count_cache: Optional[Dict[Tuple[str, Optional[str]], int]] = None
+        self._sketch_cache: Optional[Dict[Tuple, Any]] = None
+        self._column_metadata_cache: Optional[Dict[str, Dict[str, str]]] = None
+        self._sketch_locks: Dict[Tuple, threading.Lock] = {}
+        self._sketch_locks_lock = threading.Lock()
 
     def is_connected(self) -> bool:
         """
         Check if the data source is connected
         """
-        return self.connection is not None
+        return self.engine is not None or self.connection is not None
 
     def close(self):
-        self.connection.close()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
+
+    def pool_options(self) -> Dict[str, Any]:
+        """
+        Get the connection pool settings configured for the data source
+        :return: keyword arguments for create_engine
+        """
+        return {
+            option: self.data_connection.get(option)
+            for option in self.POOL_OPTIONS
+            if self.data_connection.get(option) is not None
+        }
+
+    def create_pooled_engine(self, url, **kwargs) -> Engine:
+        """
+        Create the pooled engine of the data source with the configured pool settings
+        :param url: database url
+        :param kwargs: dialect specific create_engine arguments
+        :return: engine
+        """
+        self.engine = create_engine(url, **{**kwargs, **self.pool_options()})
+        return self.engine
+
+    def get_engine(self) -> Engine:
+        """
+        Get the engine of the data source, the engine of its connection if it has no pool
+        """
+        return self.engine if self.engine is not None else self.connection.engine
+
+    def check_connection(self):
+        """
+        Check out a connection to fail early on wrong settings, it goes back to the pool
+        """
+        with self.checkout_connection():
+            pass
+
+    @contextmanager
+    def checkout_connection(self) -> Iterator[Connection]:
+        """
+        Check out a connection from the engine pool for a single query.
+        Falls back to the data source connection when the data source has no engine.
+        """
+        if self.engine is None:
+            yield self.connection
+            return
+        with self.engine.connect() as connection:
+            yield connection
 
     def fetchall(self, query):
-        if self.use_sa_text_query:
-            return self.connection.execute(text(query)).fetchall()
-        return self.connection.execute(query).fetchall()
+        start = time.perf_counter()
+        with trace(
+            SpanKind.QUERY, "fetchall", data_source=self.data_source_name, query=query
+        ), self.checkout_connection() as connection:
+            if self.use_sa_text_query:
+                rows = connection.execute(text(query)).fetchall()
+            else:
+                rows = connection.execute(query).fetchall()
+        record_query(query, start, rows=len(rows))
+        return rows
 
     def fetchone(self, query):
-        if self.use_sa_text_query:
-            return self.connection.execute(text(query)).fetchone()
-        return self.connection.execute(query).fetchone()
+        start = time.perf_counter()
+        with trace(
+            SpanKind.QUERY, "fetchone", data_source=self.data_source_name, query=query
+        ), self.checkout_connection() as connection:
+            if self.use_sa_text_query:
+                row = connection.execute(text(query)).fetchone()
+            else:
+                row = connection.execute(query).fetchone()
+        record_query(query, start, rows=0 if row is None else 1)
+        return row
+
+    def fetch_batches(self, query, batch_size: int) -> Iterator[List]:
+        """
+        Stream the rows of a query in batches of batch_size rows
+        """
+        start = time.perf_counter()
+        row_count = 0
+        with self.checkout_connection() as connection:
+            # only the execution is traced, a span must not stay open across the yields
+            with trace(
+                SpanKind.QUERY,
+                "fetch_batches",
+                data_source=self.data_source_name,
+                query=query,
+            ):
+                result = connection.execute(text(query))
+            while True:
+                rows = result.fetchmany(batch_size)
+                if not rows:
+                    record_query(query, start, rows=row_count)
+                    return
+                row_count += len(rows)
+                yield rows
+
+    def query_aggregates(
+        self, table: str, expressions: List[str], filters: Optional[str] = None
+    ) -> Tuple:
+        """
+        Compute many aggregate expressions over a table with one query
+        :param table: name of the table
+        :param expressions: SQL aggregate expressions
+        :param filters: optional filter
+        :return: values of the expressions, in order
+        """
+        select_list = ", ".join(
+            f"{expression} AS agg_{index}"
+            for index, expression in enumerate(expressions)
+        )
+        query = f"SELECT {select_list} FROM {self.qualified_table_name(table)}"
+        if filters:
+            query += f" WHERE {filters}"
+        return tuple(self.fetchone(query))
+
+    def start_run(self, datasets: Iterable[str] = ()):
+        """
+        Memoize the total row count per (table, filter), the column sketches and the
+        column metadata for the duration of the run
+        """
+        self._row_count_cache = {}
+        self._sketch_cache = {}
+        self._column_metadata_cache = {}
+
+    def end_run(self):
+        self._row_count_cache = None
+        self._sketch_cache = None
+        self._column_metadata_cache = None
+
+    def cached_sketch(self, key: Tuple) -> Optional[Any]:
+        """
+        Get a column sketch computed earlier in the run
+        """
+        if self._sketch_cache is None:
+            return None
+        return self._sketch_cache.get(key)
+
+    def cache_sketch(self, key: Tuple, sketch: Any):
+        if self._sketch_cache is not None:
+            self._sketch_cache[key] = sketch
+
+    def sketch_lock(self, key: Tuple) -> threading.Lock:
+        """
+        Get the lock held while the sketch of the key is built, so that the validations
+        sharing a sketch build it once while other sketches are built concurrently
+        """
+        with self._sketch_locks_lock:
+            return self._sketch_locks.setdefault(key, threading.Lock())
+
+    def cache_row_count(self, table: str, filters: Optional[str], row_count: int):
+        """
+        Store a row count computed elsewhere, e.g. by a fused query, in the run cache
+        :param table: name of the table
+        :param filters: filter of the row count
+        :param row_count: row count
+        """
+        if self._row_count_cache is not None:
+            self._row_count_cache[(table, filters or None)] = row_count
+
+    def regex_match_condition(self, field: str, pattern: str) -> str:
+        """
+        Get the condition that matches a column against a regex pattern
+        :param field: column name
+        :param pattern: regex pattern
+        :return: regex match condition
+        """
+        return f"{field} ~ '{pattern}'"
+
+    def percentile_aggregate(self, field: str, percentile: float) -> Optional[str]:
+        """
+        Get the aggregate expression of a discrete percentile of a column, used by the
+        fused query planner
+        :param field: column name
+        :param percentile: percentile between 0 and 1
+        :return: aggregate expression, None if the dialect has no percentile aggregate
+        """
+        return f"PERCENTILE_DISC({percentile}) WITHIN GROUP (ORDER BY {field})"
+
+    def approximate_distinct_count_aggregate(self, field: str) -> Optional[str]:
+        """
+        Get the native approximate distinct count aggregate expression of a column
+        :param field: column name
+        :return: aggregate expression, None if the dialect has no approximate aggregate
+        """
+        return None
+
+    def approximate_percentile_aggregate(
+        self, field: str, percentile: float
+    ) -> Optional[str]:
+        """
+        Get the native approximate percentile aggregate expression of a column
+        :param field: column name
+        :param percentile: percentile between 0 and 1
+        :return: aggregate expression, None if the dialect has no approximate aggregate
+        """
+        return None
 
     def qualified_table_name(self, table_name: str) -> str:
         """
@@ -60,26 +383,115 @@ class SQLDataSource(DataSource):
         """
         return f"{table_name}"
 
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        return f"{self.qualified_table_name(table_name)} TABLESAMPLE BERNOULLI ({percentage})"
+
+    @staticmethod
+    def _python_type_name(column_type: Any) -> str:
+        try:
+            return column_type.python_type.__name__
+        except NotImplementedError:
+            return "object"
+
     def query_get_column_metadata(self, table_name: str) -> Dict[str, str]:
         """
         Get the column metadata
         :param table_name: name of the table
         :return: query for column metadata
         """
+        if (
+            self._column_metadata_cache is not None
+            and table_name in self._column_metadata_cache
+        ):
+            return self._column_metadata_cache[table_name]
+
         results_: Dict[str, str] = {}
 
-        columns = inspect(self.connection.engine).get_columns(table_name)
+        columns = inspect(self.get_engine()).get_columns(table_name)
         for column in columns:
-            results_[column["name"]] = column["type"].python_type.__name__
+            results_[column["name"]] = self._python_type_name(column["type"])
 
         return results_
 
+    def query_get_bulk_column_metadata(
+        self, table_names: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get the column metadata of many tables at once, memoized for the run
+        :param table_names: names of the tables
+        :return: column metadata by table name
+        """
+        cache = self._column_metadata_cache
+        missing_tables = [
+            table_name
+            for table_name in table_names
+            if cache is None or table_name not in cache
+        ]
+        metadata = self._load_column_metadata(missing_tables) if missing_tables else {}
+        if cache is not None:
+            cache.update(metadata)
+            metadata = cache
+        return {table_name: metadata.get(table_name, {}) for table_name in table_names}
+
+    def _load_column_metadata(
+        self, table_names: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Load the column metadata of the tables with get_multi_columns, which reads the
+        catalog once for all the tables on the dialects that support it
+        """
+        columns_by_table = inspect(self.get_engine()).get_multi_columns(
+            filter_names=table_names
+        )
+        return {
+            table_name: {
+                column["name"]: self._python_type_name(column["type"])
+                for column in columns
+            }
+            for (_, table_name), columns in columns_by_table.items()
+        }
+
+    def query_get_information_schema_column_metadata(
+        self, schema_condition: str, table_names: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Load the column metadata of the tables of a schema from information_schema.columns
+        with a single query. Data types are mapped with the type names of the dialect.
+        :param schema_condition: condition on table_schema that selects the schema
+        :param table_names: names of the tables
+        :return: column metadata by table name
+        """
+        type_names = self.get_engine().dialect.ischema_names
+        wanted_tables = set(table_names)
+        results_: Dict[str, Dict[str, str]] = {}
+        rows = self.fetchall(
+            "SELECT table_name, column_name, data_type FROM information_schema.columns "
+            f"WHERE {schema_condition} ORDER BY table_name, ordinal_position"
+        )
+        for table_name, column_name, data_type in rows:
+            if table_name not in wanted_tables:
+                continue
+            column_type = type_names.get(str(data_type).lower())
+            try:
+                type_name = self._python_type_name(column_type())
+            except TypeError:
+                # unknown data type, or a type that can not be built without arguments
+                type_name = "object"
+            results_.setdefault(table_name, {})[column_name] = type_name
+        return results_
+
     def query_get_table_metadata(self) -> List[str]:
         """
         Get the table metadata
         :return: query for table metadata
         """
-        return inspect(self.connection.engine).get_table_names()
+        return inspect(self.get_engine()).get_table_names()
 
     def query_get_row_count(self, table: str, filters: str = None) -> int:
         """
@@ -87,11 +499,38 @@ class SQLDataSource(DataSource):
         :param table: name of the table
         :param filters: optional filter
         """
+        cache_key = (table, filters or None)
+        if self._row_count_cache is not None and cache_key in self._row_count_cache:
+            return self._row_count_cache[cache_key]
+
         qualified_table_name = self.qualified_table_name(table)
         query = f"SELECT COUNT(*) FROM {qualified_table_name}"
         if filters:
             query += f" WHERE {filters}"
-        return self.fetchone(query)[0]
+        row_count = self.fetchone(query)[0]
+        self.cache_row_count(table, filters, row_count)
+        return row_count
+
+    def query_get_table_fingerprint(
+        self, table: str, updated_column: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get a fingerprint of the table that changes when the content of the table changes.
+        By default the fingerprint is the row count and the latest value of the updated
+        column. A row count alone misses in-place updates, so tables without an updated
+        column are not fingerprinted.
+        :param table: name of the table
+        :param updated_column: column that holds the last update time of a row
+        :return: table fingerprint, None if the table can not be fingerprinted
+        """
+        if updated_column is None:
+            return None
+        qualified_table_name = self.qualified_table_name(table)
+        row_count, last_updated = self.fetchone(
+            f"SELECT COUNT(*), MAX({updated_column}) FROM {qualified_table_name}"
+        )
+        self.cache_row_count(table, None, row_count)
+        return f"{row_count}:{last_updated}"
 
     def query_get_custom_sql(self, query: str) -> Union[int, float, None]:
         """
@@ -310,76 +749,202 @@ class SQLDataSource(DataSource):
             return int((datetime.utcnow() - result[0]).total_seconds())
         return 0
 
-    def profiling_sql_aggregates_numeric(
-        self, table_name: str, column_name: str
+    def _profiling_sql_aggregates(
+        self, table_name: str, column_name: str, aggregates: Dict[str, str]
     ) -> Dict:
         column_name = f'"{column_name}"'
         qualified_table_name = self.qualified_table_name(table_name)
-        query = f"""
-            SELECT
-                avg({column_name}) as avg,
-                min({column_name}) as min,
-                max({column_name}) as max,
-                sum({column_name}) as sum,
-                stddev_samp({column_name}) as stddev,
-                var_samp({column_name}) as variance,
-                count(distinct({column_name})) as distinct_count,
-                sum(case when {column_name} is null then 1 else 0 end) as missing_count
-            FROM {qualified_table_name}
-            """
+        select_list = ", ".join(
+            f"{template.format(column=column_name)} as {name}"
+            for name, template in aggregates.items()
+        )
+        result = self.fetchone(f"SELECT {select_list} FROM {qualified_table_name}")
+        return dict(zip(aggregates, result))
 
-        result = self.fetchone(query)
-        return {
-            "avg": result[0],
-            "min": result[1],
-            "max": result[2],
-            "sum": result[3],
-            "stddev": result[4],
-            "variance": result[5],
-            "distinct_count": result[6],
-            "missing_count": result[7],
-        }
+    def profiling_sql_aggregates_numeric(
+        self, table_name: str, column_name: str
+    ) -> Dict:
+        return self._profiling_sql_aggregates(
+            table_name, column_name, self.PROFILING_NUMERIC_AGGREGATES
+        )
 
     def profiling_sql_aggregates_string(
         self, table_name: str, column_name: str
     ) -> Dict:
-        column_name = f'"{column_name}"'
-        qualified_table_name = self.qualified_table_name(table_name)
+        return self._profiling_sql_aggregates(
+            table_name, column_name, self.PROFILING_STRING_AGGREGATES
+        )
+
+    def profiling_sql_aggregates_table(
+        self, table_name: str, columns: Dict[str, Dict[str, str]]
+    ) -> Tuple[int, Dict[str, Dict]]:
+        """
+        Compute the profiling aggregates of many columns and the row count of a table with
+        one scan. The select list is split into several queries when it is longer than
+        MAX_SELECT_COLUMNS, the aggregates of a column always stay in the same query.
+        :param table_name: name of the table
+        :param columns: profiling aggregates by column name, e.g. PROFILING_NUMERIC_AGGREGATES
+        :return: row count and aggregate values by column name
+        """
+        chunks: List[List[Tuple[Optional[str], str, str]]] = [
+            [(None, "row_count", "COUNT(*)")]
+        ]
+        for column_name, aggregates in columns.items():
+            quoted_column_name = f'"{column_name}"'
+            expressions = [
+                (column_name, name, template.format(column=quoted_column_name))
+                for name, template in aggregates.items()
+            ]
+            if len(chunks[-1]) + len(expressions) > self.MAX_SELECT_COLUMNS:
+                chunks.append([])
+            chunks[-1].extend(expressions)
+
+        row_count = None
+        values: Dict[str, Dict] = {column_name: {} for column_name in columns}
+        for chunk in chunks:
+            row = self.query_aggregates(
+                table_name, [expression for _, _, expression in chunk]
+            )
+            for (column_name, name, _), value in zip(chunk, row):
+                if column_name is None:
+                    row_count = value
+                else:
+                    values[column_name][name] = value
+        self.cache_row_count(table_name, None, row_count)
+        return row_count, values
+
+    def profiling_sql_frequencies_table(
+        self,
+        table_name: str,
+        histogram_ranges: Dict[str, Tuple[float, float]],
+        top_k_columns: List[str],
+    ) -> Dict[str, Dict[str, List[Tuple[str, int]]]]:
+        """
+        Compute the equi-width histograms and the most frequent values of many columns of a
+        table with one query. Only the bucket counts and the top K values of every column
+        are returned, never the raw rows.
+        The columns are grouped with GROUPING SETS in a single scan of the table. Dialects
+        without GROUPING SETS run one grouped branch, and so one scan, per column in a
+        UNION ALL.
+        :param table_name: name of the table
+        :param histogram_ranges: minimum and maximum value by numeric column name
+        :param top_k_columns: names of the columns to get the most frequent values of
+        :return: (value, frequency) pairs by column name, under the "histogram" and "top_k"
+            keys. Histogram values are bucket numbers between 0 and PROFILING_HISTOGRAM_BINS - 1
+        """
+        frequencies: Dict[str, Dict[str, List[Tuple[str, int]]]] = {
+            "histogram": {column_name: [] for column_name in histogram_ranges},
+            "top_k": {column_name: [] for column_name in top_k_columns},
+        }
+        bins = self.PROFILING_HISTOGRAM_BINS
+        # (profile kind, column name, grouped expression)
+        groups: List[Tuple[str, str, str]] = []
+        for column_name, (min_value, max_value) in histogram_ranges.items():
+            quoted_column_name = f'"{column_name}"'
+            # a constant column only fills the last bin, the width must not be zero
+            width = (max_value - min_value) / bins or 1
+            bucket = (
+                f"CASE WHEN {quoted_column_name} >= {max_value} THEN {bins - 1} "
+                f"ELSE FLOOR(({quoted_column_name} - {min_value}) / {width}) END"
+            )
+            groups.append(("histogram", column_name, bucket))
+        for column_name in top_k_columns:
+            groups.append(("top_k", column_name, f'"{column_name}"'))
+        if not groups:
+            return frequencies
+
+        if self.SUPPORTS_GROUPING_SETS:
+            grouped_frequencies = self._grouping_sets_frequencies_query(
+                table_name, groups
+            )
+        else:
+            grouped_frequencies = self._union_frequencies_query(table_name, groups)
         query = f"""
-            SELECT
-                count(distinct({column_name})) as distinct_count,
-                sum(case when {column_name} is null then 1 else 0 end) as missing_count,
-                max(length({column_name})) as max_length,
-                min(length({column_name})) as min_length,
-                avg(length({column_name})) as avg_length
-            FROM {qualified_table_name}
+            SELECT profile_group, bucket_value, frequency
+            FROM (
+                SELECT profile_group, bucket_value, frequency,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY profile_group
+                        ORDER BY frequency DESC, bucket_value
+                    ) AS frequency_rank
+                FROM ({grouped_frequencies}) frequencies
+            ) ranked_frequencies
+            WHERE profile_group IS NOT NULL AND (
+                profile_group < {len(histogram_ranges)}
+                OR frequency_rank <= {self.PROFILING_TOP_K}
+            )
             """
+        for profile_group, bucket_value, frequency in self.fetchall(query):
+            profile_kind, column_name, _ = groups[int(profile_group)]
+            frequencies[profile_kind][column_name].append((bucket_value, frequency))
+        return frequencies
+
+    def _grouping_sets_frequencies_query(
+        self, table_name: str, groups: List[Tuple[str, str, str]]
+    ) -> str:
+        """
+        Count the values of every group expression in one scan, with one grouping set per
+        expression. The group of a row is the only expression that is not NULL in it, the
+        rows of NULL values have no group.
+        """
+        aliases = [f"group_{index}" for index in range(len(groups))]
+        values = ", ".join(
+            f"CAST({expression} AS {self.TEXT_CAST_TYPE}) AS {alias}"
+            for (_, _, expression), alias in zip(groups, aliases)
+        )
+        profile_group = " ".join(
+            f"WHEN {alias} IS NOT NULL THEN {index}"
+            for index, alias in enumerate(aliases)
+        )
+        grouping_sets = ", ".join(f"({alias})" for alias in aliases)
+        return (
+            f"SELECT CASE {profile_group} END AS profile_group, "
+            f"COALESCE({', '.join(aliases)}) AS bucket_value, COUNT(*) AS frequency "
+            f"FROM (SELECT {values} FROM {self.qualified_table_name(table_name)}) "
+            f"profiled_values GROUP BY GROUPING SETS ({grouping_sets})"
+        )
 
-        result = self.fetchone(query)
-        return {
-            "distinct_count": result[0],
-            "missing_count": result[1],
-            "max_length": result[2],
-            "min_length": result[3],
-            "avg_length": result[4],
-        }
+    def _union_frequencies_query(
+        self, table_name: str, groups: List[Tuple[str, str, str]]
+    ) -> str:
+        """
+        Count the values of every group expression with one grouped branch per expression
+        """
+        qualified_table_name = self.qualified_table_name(table_name)
+        return " UNION ALL ".join(
+            f"SELECT {index} AS profile_group, "
+            f"CAST({expression} AS {self.TEXT_CAST_TYPE}) AS bucket_value, "
+            f"COUNT(*) AS frequency FROM {qualified_table_name} "
+            f'WHERE "{column_name}" IS NOT NULL GROUP BY {expression}'
+            for index, (_, column_name, expression) in enumerate(groups)
+        )
 
     def query_get_duplicate_count(
         self, table: str, field: str, filters: str = None
     ) -> int:
+        """
+        Get the number of values of a field that occur more than once.
+        The duplicate groups are counted in the database so only a scalar is fetched.
+        :param table: name of the table
+        :param field: field name
+        :param filters: optional filter
+        :return: duplicate count
+        """
         filters = f"WHERE {filters}" if filters else ""
         qualified_table_name = self.qualified_table_name(table)
         query = f"""
-            SELECT
-            count(*) as duplicate_count
-            FROM {qualified_table_name}
-            {filters}
-            GROUP BY {field}
-            HAVING COUNT(*) > 1
+            SELECT COUNT(*) AS duplicate_count
+            FROM (
+                SELECT {field}
+                FROM {qualified_table_name}
+                {filters}
+                GROUP BY {field}
+                HAVING COUNT(*) > 1
+            ) duplicate_groups
             """
 
-        result = self.fetchall(query)
-        return len(result) if result else 0
+        result = self.fetchone(query)
+        return result[0] if result else 0
 
     def query_string_pattern_validity(
         self,
@@ -401,29 +966,14 @@ class SQLDataSource(DataSource):
         filters = f"WHERE {filters}" if filters else ""
         qualified_table_name = self.qualified_table_name(table)
 
-        regex_patterns = {
-            "uuid": r"^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$",
-            "usa_phone": r"^(\+1[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}$",
-            "email": r"^(?!.*\.\.)(?!.*@.*@)[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-            "usa_zip_code": r"^[0-9]{5}(?:-[0-9]{4})?$",
-            "ssn": r"^(?!000|666|9\d{2})\d{3}-(?!00)\d{2}-(?!0000)\d{4}$",
-            "sedol": r"[B-Db-dF-Hf-hJ-Nj-nP-Tp-tV-Xv-xYyZz\d]{6}\d",
-            "lei": r"^[A-Z0-9]{18}[0-9]{2}$",
-            "cusip": r"^[0-9A-Z]{9}$",
-            "figi": r"^BBG[A-Z0-9]{9}$",
-            "isin": r"^[A-Z]{2}[A-Z0-9]{9}[0-9]$",
-            "perm_id": r"^\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{3}$",
-        }
-
         if not regex_pattern and not predefined_regex_pattern:
             raise ValueError(
                 "Either regex_pattern or predefined_regex_pattern should be provided"
             )
 
         if predefined_regex_pattern:
-            regex_query = f"case when {field} ~ '{regex_patterns[predefined_regex_pattern]}' then 1 else 0 end"
-        else:
-            regex_query = f"case when {field} ~ '{regex_pattern}' then 1 else 0 end"
+            regex_pattern = self.PREDEFINED_REGEX_PATTERNS[predefined_regex_pattern]
+        regex_query = f"case when {self.regex_match_condition(field, regex_pattern)} then 1 else 0 end"
 
         query = f"""
             select sum({regex_query}) as valid_count, count(*) as total_count
@@ -455,7 +1005,7 @@ class SQLDataSource(DataSource):
             values_str = ", ".join([f"'{value}'" for value in values])
             regex_query = f"CASE WHEN {field} IN ({values_str}) THEN 1 ELSE 0 END"
         else:
-            regex_query = f"CASE WHEN {field} ~ '{regex_pattern}' THEN 1 ELSE 0 END"
+            regex_query = f"CASE WHEN {self.regex_match_condition(field, regex_pattern)} THEN 1 ELSE 0 END"
         query = f"""
             SELECT SUM({regex_query}) AS valid_count, COUNT(*) as total_count
             FROM {qualified_table_name}
@@ -507,67 +1057,11 @@ class SQLDataSource(DataSource):
         :param filters: filter condition
         :return: count of valid state codes, count of total row count
         """
-        # List of valid state codes
-        valid_state_codes = [
-            "AL",
-            "AK",
-            "AZ",
-            "AR",
-            "CA",
-            "CO",
-            "CT",
-            "DE",
-            "FL",
-            "GA",
-            "HI",
-            "ID",
-            "IL",
-            "IN",
-            "IA",
-            "KS",
-            "KY",
-            "LA",
-            "ME",
-            "MD",
-            "MA",
-            "MI",
-            "MN",
-            "MS",
-            "MO",
-            "MT",
-            "NE",
-            "NV",
-            "NH",
-            "NJ",
-            "NM",
-            "NY",
-            "NC",
-            "ND",
-            "OH",
-            "OK",
-            "OR",
-            "PA",
-            "RI",
-            "SC",
-            "SD",
-            "TN",
-            "TX",
-            "UT",
-            "VT",
-            "VA",
-            "WA",
-            "WV",
-            "WI",
-            "WY",
-        ]
-
-        valid_state_codes_str = ", ".join(f"'{code}'" for code in valid_state_codes)
-
         filters = f"WHERE {filters}" if filters else ""
 
         qualified_table_name = self.qualified_table_name(table)
 
-        regex_query = f"CASE WHEN {field} ~ '^[A-Z]{{2}}$' AND {field} IN ({valid_state_codes_str}) THEN 1 ELSE 0 END"
+        regex_query = f"CASE WHEN {self.regex_match_condition(field, '^[A-Z]{2}$')} AND {field} IN ({self.USA_STATE_CODES_SQL}) THEN 1 ELSE 0 END"
 
         query = f"""
             SELECT SUM({regex_query}) AS valid_count, COUNT(*) AS total_count
@@ -595,11 +1089,7 @@ class SQLDataSource(DataSource):
         valid_count = self.fetchone(valid_query)[0]
 
         if operation == "percent":
-            total_query = f"SELECT COUNT(*) FROM {qualified_table_name}"
-            if filters:
-                total_query += f" WHERE {filters}"
-
-            total_count = self.fetchone(total_query)[0]
+            total_count = self.query_get_row_count(table=table, filters=filters)
 
             result = (valid_count / total_count) * 100 if total_count > 0 else 0
             return round(result, 2)
@@ -634,12 +1124,8 @@ class SQLDataSource(DataSource):
             zero_query += f" AND {filters}"
 
         if operation == "percent":
-            total_count_query = f"SELECT COUNT(*) FROM {qualified_table_name}"
-            if filters:
-                total_count_query += f" WHERE {filters}"
-
             zero_count = self.fetchone(zero_query)[0]
-            total_count = self.fetchone(total_count_query)[0]
+            total_count = self.query_get_row_count(table=table, filters=filters)
 
             if total_count == 0:
                 return 0.0
@@ -662,18 +1148,14 @@ class SQLDataSource(DataSource):
         if filters:
             negative_query += f" AND {filters}"
 
-        total_count_query = f"SELECT COUNT(*) FROM {qualified_table_name}"
-
-        if filters:
-            total_count_query += f" WHERE {filters}"
-
+        negative_count = self.fetchone(negative_query)[0]
         if operation == "percent":
-            query = f"SELECT (CAST(({negative_query}) AS float) / CAST(({total_count_query}) AS float)) * 100"
-        else:
-            query = negative_query
+            total_count = self.query_get_row_count(table=table, filters=filters)
+            if total_count == 0:
+                return 0.0
+            return round((negative_count / total_count) * 100, 2)
 
-        result = self.fetchone(query)[0]
-        return round(result, 2) if operation == "percent" else result
+        return negative_count
 
     def query_get_all_space_count(
         self, table: str, field: str, operation: str, filters: str = None
@@ -744,7 +1226,7 @@ class SQLDataSource(DataSource):
 
         qualified_table_name = self.qualified_table_name(table)
 
-        timestamp_iso_regex = r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])T([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.\d{1,3})?(Z|[+-](0[0-9]|1[0-4]):[0-5][0-9])?$"
+        timestamp_iso_regex = self.TIMESTAMP_ISO_REGEX
 
         if predefined_regex == "timestamp_iso":
             regex_condition = f"{field} ~ '{timestamp_iso_regex}'"
@@ -804,10 +1286,7 @@ class SQLDataSource(DataSource):
 
         try:
             valid_count = self.fetchone(query)[0]
-            total_count_query = (
-                f"SELECT COUNT(*) FROM {qualified_table_name} {filters_clause}"
-            )
-            total_count = self.fetchone(total_count_query)[0]
+            total_count = self.query_get_row_count(table=table, filters=filters)
 
             if operation == "count":
                 return valid_count, total_count
@@ -839,7 +1318,7 @@ class SQLDataSource(DataSource):
 
         qualified_table_name = self.qualified_table_name(table)
 
-        timestamp_iso_regex = r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])T([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.\d{1,3})?(Z|[+-](0[0-9]|1[0-4]):[0-5][0-9])?$"
+        timestamp_iso_regex = self.TIMESTAMP_ISO_REGEX
 
         if predefined_regex == "timestamp_iso":
             regex_condition = f"{field} ~ '{timestamp_iso_regex}'"
@@ -899,10 +1378,7 @@ class SQLDataSource(DataSource):
          """
         try:
             valid_count = self.fetchone(query)[0]
-            total_count_query = (
-                f"SELECT COUNT(*) FROM {qualified_table_name} {filters_clause}"
-            )
-            total_count = self.fetchone(total_count_query)[0]
+            total_count = self.query_get_row_count(table=table, filters=filters)
 
             if operation == "count":
                 return valid_count, total_count
@@ -934,7 +1410,7 @@ class SQLDataSource(DataSource):
 
         qualified_table_name = self.qualified_table_name(table)
 
-        timestamp_iso_regex = r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])T([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.\d{1,3})?(Z|[+-](0[0-9]|1[0-4]):[0-5][0-9])?$"
+        timestamp_iso_regex = self.TIMESTAMP_ISO_REGEX
 
         if predefined_regex == "timestamp_iso":
             regex_condition = f"{field} ~ '{timestamp_iso_regex}'"
@@ -989,10 +1465,7 @@ class SQLDataSource(DataSource):
 
         try:
             valid_count = self.fetchone(query)[0]
-            total_count_query = (
-                f"SELECT COUNT(*) FROM {qualified_table_name} {filters_clause}"
-            )
-            total_count = self.fetchone(total_count_query)[0]
+            total_count = self.query_get_row_count(table=table, filters=filters)
 
             if operation == "count":
                 return valid_count, total_count
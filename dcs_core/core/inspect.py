@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import sys
 import traceback
 from dataclasses import dataclass
@@ -32,13 +33,18 @@ from dcs_core.core.configuration.configuration_parser import (
     load_configuration_from_yaml_str,
 )
 from dcs_core.core.datasource.manager import DataSourceManager
+from dcs_core.core.utils.tracing import SpanKind, trace
 from dcs_core.core.utils.tracking import (
     create_inspect_event_json,
     is_tracking_enabled,
     send_event_json,
 )
 from dcs_core.core.utils.utils import truncate_error
+from dcs_core.core.validation.cache import ValidationResultCache
+from dcs_core.core.validation.executor import ValidationExecutor
 from dcs_core.core.validation.manager import ValidationManager
+from dcs_core.core.validation.planner import FusedQueryPlanner, SearchRequestBatcher
+from dcs_core.integrations.storage.local_file import LocalFileValidationStateRepository
 
 requests.packages.urllib3.disable_warnings(
     requests.packages.urllib3.exceptions.InsecureRequestWarning
@@ -68,6 +74,21 @@ class InspectOutput:
                     metric_values.append(metric)
         return metric_values
 
+    def get_timing_report(self) -> List[ValidationInfo]:
+        """
+        This method returns the instrumented validations, most expensive first
+        """
+        return sorted(
+            (
+                validation_info
+                for validation_info in self.validations.values()
+                if validation_info is not None
+                and validation_info.instrumentation is not None
+            ),
+            key=lambda validation_info: validation_info.instrumentation.time_taken,
+            reverse=True,
+        )
+
     def get_inspect_info(self):
         metrics_count, datasource_count, combined_metrics_count = 0, 0, 0
         table_count, index_count = 0, 0
@@ -98,6 +119,7 @@ class Inspect:
     def __init__(
         self,
         configuration: Optional[Configuration] = None,
+        max_workers: int = ValidationExecutor.DEFAULT_MAX_WORKERS,
     ):
         if configuration is None:
             self.configuration = Configuration()
@@ -109,6 +131,10 @@ class Inspect:
             application_configs=self.configuration,
             data_source_manager=self.data_source_manager,
         )
+        self.result_cache = ValidationResultCache()
+        self.query_planner = FusedQueryPlanner()
+        self.search_request_batcher = SearchRequestBatcher()
+        self.max_workers = max_workers
 
         self.execution_time_taken = 0
         self.is_storage_enabled = False
@@ -123,8 +149,72 @@ class Inspect:
             yaml_string=yaml_str, configuration=self.configuration
         )
 
-    def add_spark_session(self, spark_session, data_source_name: str = "spark_df"):
-        self.configuration.add_spark_session(data_source_name, spark_session)
+    def add_spark_session(
+        self,
+        spark_session,
+        data_source_name: str = "spark_df",
+        persist: bool = False,
+    ):
+        """
+        Add a Spark session as a data source
+        :param persist: cache the validated tables in memory for the duration of a run,
+            so that the source files are scanned once. Tables that are already cached
+            stay cached after the run
+        """
+        self.configuration.add_spark_session(
+            data_source_name, spark_session, persist=persist
+        )
+
+    def _start_run(self) -> ValidationExecutor:
+        """
+        Connect the data sources, build the validations and serve the cached ones
+        :return: executor of the validations
+        """
+        self.data_source_manager.connect()
+        self.validation_manager.build_validations()
+        self.validation_manager.reset_run_state()
+        self.data_source_manager.start_run(
+            {
+                data_source_name: list(datasets)
+                for data_source_name, datasets in (
+                    self.validation_manager.get_validations.items()
+                )
+            }
+        )
+        if self.configuration.storage is not None:
+            self.validation_manager.set_state_repository(
+                LocalFileValidationStateRepository(
+                    self.configuration.storage.params.path
+                )
+            )
+        validation_executor = ValidationExecutor(
+            max_workers=self.max_workers,
+            max_concurrency={
+                name: data_source_config.max_concurrency
+                for name, data_source_config in self.configuration.data_sources.items()
+                if data_source_config.max_concurrency
+            },
+        )
+        self.result_cache.execute(
+            self.validation_manager.get_validations, executor=validation_executor
+        )
+        return validation_executor
+
+    def _end_run(self, start: datetime, inspect_info: Optional[Dict], error):
+        self.data_source_manager.end_run()
+        end = datetime.now()
+        self.execution_time_taken = round((end - start).total_seconds(), 3)
+        logger.info(f"Inspection took {self.execution_time_taken} seconds")
+        err_message = truncate_error(repr(error))
+        if is_tracking_enabled():
+            event_json = create_inspect_event_json(
+                runtime_seconds=self.execution_time_taken,
+                inspect_info=inspect_info,
+                error=err_message,
+            )
+            send_event_json(event_json)
+        if error:
+            logger.error(error)
 
     def run(self) -> InspectOutput:
         """
@@ -134,22 +224,23 @@ class Inspect:
         error = None
         inspect_info = None
         try:
-            self.data_source_manager.connect()
-            self.validation_manager.build_validations()
-
-            validation_infos: Dict[str, ValidationInfo] = {}
-
-            for datasource, _ in self.validation_manager.get_validations.items():
-                for dataset, _ in self.validation_manager.get_validations[
-                    datasource
-                ].items():
-                    for _, validation in self.validation_manager.get_validations[
-                        datasource
-                    ][dataset].items():
-                        validation_info = validation.get_validation_info()
-                        validation_infos[
-                            validation.get_validation_identity()
-                        ] = validation_info
+            with trace(SpanKind.RUN, "inspect"):
+                validation_executor = self._start_run()
+                plan_key = self.validation_manager.plan_key
+                self.query_planner.execute(
+                    self.validation_manager.get_validations,
+                    executor=validation_executor,
+                    plan_key=plan_key,
+                )
+                self.search_request_batcher.execute(
+                    self.validation_manager.get_validations,
+                    executor=validation_executor,
+                    plan_key=plan_key,
+                )
+
+                validation_infos: Dict[
+                    str, ValidationInfo
+                ] = validation_executor.execute(self.validation_manager.get_validations)
 
             output = InspectOutput(validations=validation_infos)
             inspect_info = output.get_inspect_info()
@@ -160,16 +251,62 @@ class Inspect:
             traceback.print_exc(file=sys.stdout)
             error = ex
         finally:
-            end = datetime.now()
-            self.execution_time_taken = round((end - start).total_seconds(), 3)
-            logger.info(f"Inspection took {self.execution_time_taken} seconds")
-            err_message = truncate_error(repr(error))
-            if is_tracking_enabled():
-                event_json = create_inspect_event_json(
-                    runtime_seconds=self.execution_time_taken,
-                    inspect_info=inspect_info,
-                    error=err_message,
+            self._end_run(start, inspect_info, error)
+
+    def close(self):
+        """
+        Close the data sources and their connection pools, once the inspection is no
+        longer run
+        """
+        self.data_source_manager.close()
+
+    async def close_async(self):
+        """
+        Close the asyncio clients of the search data sources and the data sources, once
+        the inspection is no longer run on the event loop
+        """
+        await self.data_source_manager.close_async()
+        await asyncio.to_thread(self.close)
+
+    async def run_async(self) -> InspectOutput:
+        """
+        Start the inspection process without blocking the event loop.
+        The search requests of all the search data sources are awaited concurrently on the
+        event loop with their asyncio clients, while the SQL queries run in worker threads.
+        The asyncio clients are kept between runs, close them with close_async.
+        """
+        start = datetime.now()
+        error = None
+        inspect_info = None
+        try:
+            with trace(SpanKind.RUN, "inspect"):
+                validation_executor = await asyncio.to_thread(self._start_run)
+                await self.data_source_manager.connect_async()
+                validations = self.validation_manager.get_validations
+                plan_key = self.validation_manager.plan_key
+                await asyncio.gather(
+                    asyncio.to_thread(
+                        self.query_planner.execute,
+                        validations,
+                        executor=validation_executor,
+                        plan_key=plan_key,
+                    ),
+                    self.search_request_batcher.execute_async(
+                        validations, executor=validation_executor, plan_key=plan_key
+                    ),
                 )
-                send_event_json(event_json)
-            if error:
-                logger.error(error)
+
+                validation_infos: Dict[str, ValidationInfo] = await asyncio.to_thread(
+                    validation_executor.execute, validations
+                )
+
+            output = InspectOutput(validations=validation_infos)
+            inspect_info = output.get_inspect_info()
+
+            return output
+        except Exception as ex:
+            logger.error(f"Error while running inspection: {ex}")
+            traceback.print_exc(file=sys.stdout)
+            error = ex
+        finally:
+            await asyncio.to_thread(self._end_run, start, inspect_info, error)
@@ -0,0 +1,130 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import os
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+from dcs_core.core.common.models.metric import (
+    FieldDistribution,
+    MetricsType,
+    MetricValue,
+    TableMetrics,
+)
+from dcs_core.core.utils.utils import ensure_directory_exists, write_to_file_atomically
+
+
+class ProfilingCheckpoint:
+    """
+    Stores the profiles of the finished tables of a data source profiling, so that an
+    interrupted profiling resumes with the tables that were not profiled yet.
+    Checkpoints older than max_age_seconds, or whose row count no longer matches the
+    table, are discarded and the table is profiled again.
+
+    Directory Structure:
+
+    Dir:profiling_checkpoints
+    - Dir:data_source_name
+        - file:table_name.json
+    """
+
+    DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+    def __init__(
+        self,
+        storage_path: str,
+        data_source_name: str,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.checkpoint_path = (
+            f"{storage_path}/profiling_checkpoints/{data_source_name}"
+        )
+        self.max_age_seconds = max_age_seconds
+        ensure_directory_exists(self.checkpoint_path, create_if_not_exists=True)
+
+    def _file_name(self, table_name: str) -> str:
+        return f"{self.checkpoint_path}/{table_name}.json"
+
+    def load(
+        self, table_name: str, row_count: Callable[[], int]
+    ) -> Optional[TableMetrics]:
+        """
+        Load the profile of a table finished by an earlier run
+        :param table_name: name of the table
+        :param row_count: gets the current row count of the table, only called when the
+            table has a checkpoint
+        :return: table profile, None if the table has no checkpoint or it is stale
+        """
+        file_name = self._file_name(table_name)
+        if not os.path.exists(file_name):
+            return None
+        try:
+            with open(file_name, "r") as file:
+                checkpoint = json.load(file)
+            if time.time() - checkpoint["saved_at"] > self.max_age_seconds:
+                logger.info(f"Ignoring expired profiling checkpoint {file_name}")
+                return None
+            metrics = [
+                MetricValue.from_json(metric) for metric in checkpoint["metrics"]
+            ]
+            checkpoint_row_count = next(
+                (
+                    metric.value
+                    for metric in metrics
+                    if metric.metric_type == MetricsType.ROW_COUNT
+                ),
+                None,
+            )
+            if checkpoint_row_count != row_count():
+                logger.info(f"Ignoring outdated profiling checkpoint {file_name}")
+                return None
+            return TableMetrics(
+                table_name=table_name,
+                metrics={metric.identity: metric for metric in metrics},
+                data_source=checkpoint["data_source"],
+                distributions={
+                    distribution.field_name: distribution
+                    for distribution in map(
+                        FieldDistribution.from_json, checkpoint["distributions"]
+                    )
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Ignoring invalid profiling checkpoint {file_name}: {e}")
+            return None
+
+    def save(self, table_name: str, table_metrics: TableMetrics):
+        """
+        Save the profile of a finished table
+        """
+        file_name = self._file_name(table_name)
+        checkpoint = {
+            "saved_at": time.time(),
+            "data_source": table_metrics.data_source,
+            "metrics": [metric.json for metric in table_metrics.metrics.values()],
+            "distributions": [
+                distribution.json
+                for distribution in table_metrics.distributions.values()
+            ],
+        }
+        write_to_file_atomically(file_name, json.dumps(checkpoint))
+
+    def clear(self):
+        """
+        Remove the checkpoints once the whole data source is profiled
+        """
+        for file_name in os.listdir(self.checkpoint_path):
+            os.remove(f"{self.checkpoint_path}/{file_name}")
@@ -11,20 +11,19 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from datetime import datetime, timezone
-from typing import Dict, List, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 
-from dcs_core.core.common.models.metric import (
-    IndexMetrics,
-    MetricsType,
-    MetricValue,
-    TableMetrics,
-)
+from loguru import logger
+
+from dcs_core.core.common.models.metric import IndexMetrics, TableMetrics
+from dcs_core.core.common.models.profile import ProfilingProgress
 from dcs_core.core.datasource.base import DataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
-from dcs_core.core.metric.base import MetricIdentity
-from dcs_core.core.profiling.numeric_field_profiling import NumericSQLFieldProfiler
-from dcs_core.core.profiling.text_field_profiling import TextSQLFieldProfiler
+from dcs_core.core.profiling.checkpoint import ProfilingCheckpoint
+from dcs_core.core.profiling.table_profiling import TableSQLProfiler
 
 
 class DataSourceProfiling:
@@ -33,108 +32,93 @@ class DataSourceProfiling:
 
     """
 
-    def __init__(self, data_source: DataSource):
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        data_source: DataSource,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        checkpoint_path: Optional[str] = None,
+    ):
         """
         :param data_source: The data source for which field profiles are to be generated.
+        :param max_workers: Maximum number of tables profiled concurrently.
+        :param checkpoint_path: Directory to checkpoint the finished tables in, so that an
+            interrupted profiling resumes with the remaining tables.
         """
         self._datasource = data_source
+        # tables are only profiled concurrently on a pooled engine, a single
+        # connection is not shared between threads
+        if getattr(data_source, "engine", None) is None:
+            max_workers = 1
+        self.max_workers = max(1, max_workers)
+        self._checkpoint: Optional[ProfilingCheckpoint] = (
+            ProfilingCheckpoint(checkpoint_path, data_source.data_source_name)
+            if checkpoint_path is not None
+            else None
+        )
+        self._progress_lock = threading.Lock()
+        self.progress = ProfilingProgress()
         if isinstance(data_source, SQLDataSource):
             self._tables: List[str] = data_source.query_get_table_metadata()
-            self._field_meta_data: Dict[str, Dict[str, str]] = {}
-            for table in self._tables:
-                self._field_meta_data[table] = data_source.query_get_column_metadata(
-                    table_name=table
-                )
+            self._field_meta_data: Dict[
+                str, Dict[str, str]
+            ] = data_source.query_get_bulk_column_metadata(table_names=self._tables)
+            self.progress.total_tables = len(self._field_meta_data)
 
-    def _generate_sql_data_source_profiles(self) -> List[TableMetrics]:
+    def _profile_table(self, table: str, fields: Dict[str, str]) -> TableMetrics:
         """
-        This method generates field profiles for a SQL data source.
+        Generate the profile of a table, or load it from the checkpoint of an earlier run
         """
-        list_of_metric = []
-        for table, fields in self._field_meta_data.items():
-            table_metrics: List[MetricValue] = []
-
-            for field, data_type in fields.items():
-                # profile for numeric fields if the data type is numeric
-                if data_type in DataSource.NUMERIC_PYTHON_TYPES_FOR_PROFILING:
-                    metrics = self._generate_numeric_field_profile(
-                        table=table, field=field, data_type=data_type
-                    )
-                    table_metrics.extend(metrics)
-
-                # profile for numeric fields if the data type is text
-                elif data_type in DataSource.TEXT_PYTHON_TYPES_FOR_PROFILING:
-                    metrics = self._generate_text_field_profile(
-                        table=table, field=field, data_type=data_type
-                    )
-                    table_metrics.extend(metrics)
-
-            # add row count metrics
-            table_metrics.append(self._generate_sql_table_row_count(table=table))
-            # create a table metric list for a table
-            list_of_metric.append(
-                TableMetrics(
-                    table_name=table,
-                    metrics={metric.identity: metric for metric in table_metrics},
-                    data_source=self._datasource.data_source_name,
-                )
+        table_metrics: Optional[TableMetrics] = None
+        if self._checkpoint is not None:
+            table_metrics = self._checkpoint.load(
+                table, lambda: self._datasource.query_get_row_count(table)
             )
 
-        return list_of_metric
+        if table_metrics is not None:
+            with self._progress_lock:
+                self.progress.resumed_tables += 1
+                self.progress.completed_tables += 1
+            logger.info(f"Resumed profile of table {table} from checkpoint")
+            return table_metrics
 
-    def _generate_sql_table_row_count(self, table: str) -> MetricValue:
-        if isinstance(self._datasource, SQLDataSource):
-            table_row_count = self._datasource.query_get_row_count(table=table)
-            return MetricValue(
-                identity=MetricIdentity.generate_identity(
-                    metric_name="",
-                    metric_type=MetricsType.ROW_COUNT,
-                    data_source=self._datasource,
-                    table_name=table,
-                ),
-                value=table_row_count,
-                data_source=self._datasource.data_source_name,
-                metric_type=MetricsType.ROW_COUNT,
-                table_name=table,
-                timestamp=datetime.now(timezone.utc),
-            )
+        start = time.perf_counter()
+        table_metrics = TableSQLProfiler(
+            data_source=self._datasource, table_name=table, fields=fields
+        ).generate()
+        time_taken = round(time.perf_counter() - start, 3)
+        if self._checkpoint is not None:
+            self._checkpoint.save(table, table_metrics)
+        with self._progress_lock:
+            self.progress.table_timings[table] = time_taken
+            self.progress.completed_tables += 1
+            completed_tables = self.progress.completed_tables
+        logger.info(
+            f"Profiled table {table} in {time_taken} seconds "
+            f"({completed_tables}/{self.progress.total_tables})"
+        )
+        return table_metrics
 
-    def _generate_numeric_field_profile(
-        self, table: str, field: str, data_type: str
-    ) -> List[MetricValue]:
+    def _generate_sql_data_source_profiles(self) -> List[TableMetrics]:
         """
-        This method generates a numeric field profile for a given field.
+        This method generates field profiles for a SQL data source.
+        The tables are profiled concurrently by a bounded pool of workers.
         """
-        profiles = []
-        if isinstance(self._datasource, SQLDataSource):
-            profiler = NumericSQLFieldProfiler(
-                data_source=self._datasource,
-                table_name=table,
-                field_name=field,
-                data_type=data_type,
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="dcs-profiling"
+        ) as pool:
+            list_of_metric = list(
+                pool.map(
+                    lambda table_fields: self._profile_table(*table_fields),
+                    self._field_meta_data.items(),
+                )
             )
-            generate = profiler.generate()
-            profiles = generate.get_metric_values
-        return profiles
 
-    def _generate_text_field_profile(
-        self, table: str, field: str, data_type: str
-    ) -> List[MetricValue]:
-        """
-        This method generates a text field profile for a given field.
-        """
-        profiles = []
-
-        if isinstance(self._datasource, SQLDataSource):
-            profiler = TextSQLFieldProfiler(
-                data_source=self._datasource,
-                table_name=table,
-                field_name=field,
-                data_type=data_type,
-            )
-            generate = profiler.generate()
-            profiles = generate.get_metric_values
-        return profiles
+        # the checkpoints of a failed run are kept to resume from
+        if self._checkpoint is not None:
+            self._checkpoint.clear()
+        return list_of_metric
 
     def generate(self) -> List[Union[TableMetrics, IndexMetrics]]:
         """
@@ -12,20 +12,34 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
 from datetime import datetime, timezone
-from typing import Dict
+from decimal import Decimal, localcontext
+from typing import Dict, Optional, Tuple
 
 from dcs_core.core.common.models.metric import MetricsType, MetricValue
 from dcs_core.core.common.models.profile import NumericFieldProfile
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.metric.base import MetricIdentity
 
+# Smallest ratio of the variance to the raw second moment that keeps the kurtosis
+# derived from float sums accurate to about 8 digits
+FLOAT_MOMENT_RESOLUTION = sys.float_info.epsilon**0.25
+
 
 class NumericSQLFieldProfiler:
     """
     NumericSQLFieldProfiler is a class that represents a numeric field profile that is generated by a data source.
     """
 
+    # Raw moment aggregates that the skewness and the kurtosis are derived from
+    MOMENT_AGGREGATES = [
+        "non_null_count",
+        "sum_squares",
+        "sum_cubes",
+        "sum_fourth_powers",
+    ]
+
     def __init__(
         self,
         data_source: SQLDataSource,
@@ -47,6 +61,12 @@ class NumericSQLFieldProfiler:
         )
         return self._generate_field_profile(data)
 
+    def generate_from_aggregates(self, data: Dict) -> NumericFieldProfile:
+        """
+        Generate the field profile from aggregates computed elsewhere, e.g. by a table profile.
+        """
+        return self._generate_field_profile(data)
+
     def _generate_field_profile(self, data: Dict) -> NumericFieldProfile:
         """
         Generate a numeric field profile from the data provided.
@@ -56,6 +76,11 @@ class NumericSQLFieldProfiler:
             data_type=self._data_type,
         )
         timestamp = datetime.now(timezone.utc)
+        data = dict(data)
+        moments = [data.pop(key, None) for key in self.MOMENT_AGGREGATES]
+        shape = self._skewness_and_kurtosis(data.get("sum"), *moments)
+        if shape is not None:
+            data["skewness"], data["kurtosis"] = shape
         for key, value in data.items():
             metric_value = MetricValue(
                 value=value,
@@ -72,3 +97,45 @@ class NumericSQLFieldProfiler:
             )
             setattr(profile, key, metric_value)
         return profile
+
+    @staticmethod
+    def _skewness_and_kurtosis(
+        sum_values, count, sum_squares, sum_cubes, sum_fourth_powers
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Derive the population skewness and excess kurtosis from the raw moments of a field.
+        The central moments cancel the raw moments when the mean is large relative to the
+        spread. Exact sums, e.g. numeric sums of Postgres, are combined in Decimal, float
+        sums are rejected when the cancellation leaves too few significant digits.
+        :return: skewness and kurtosis, None if the moments are missing, the field is
+            constant or the float sums are not precise enough
+        """
+        sums = (sum_values, sum_squares, sum_cubes, sum_fourth_powers)
+        if None in sums or count is None or count < 2:
+            return None
+        if all(isinstance(value, (int, Decimal)) for value in sums):
+            digits = max(len(Decimal(value).as_tuple().digits) for value in sums)
+            with localcontext() as context:
+                context.prec = 2 * digits + 28
+                count = Decimal(count)
+                mean, raw_2, raw_3, raw_4 = (Decimal(value) / count for value in sums)
+                m2, m3, m4 = NumericSQLFieldProfiler._central_moments(
+                    mean, raw_2, raw_3, raw_4
+                )
+                if m2 <= 0:
+                    return None
+                return float(m3 / m2.sqrt() ** 3), float(m4 / m2**2 - 3)
+        count = float(count)
+        mean, raw_2, raw_3, raw_4 = (float(value) / count for value in sums)
+        m2, m3, m4 = NumericSQLFieldProfiler._central_moments(mean, raw_2, raw_3, raw_4)
+        # the error of the kurtosis grows with (raw_2 / m2) ** 2 times the float resolution
+        if m2 <= raw_2 * FLOAT_MOMENT_RESOLUTION:
+            return None
+        return m3 / m2**1.5, m4 / m2**2 - 3
+
+    @staticmethod
+    def _central_moments(mean, raw_2, raw_3, raw_4):
+        m2 = raw_2 - mean**2
+        m3 = raw_3 - 3 * mean * raw_2 + 2 * mean**3
+        m4 = raw_4 - 4 * mean * raw_3 + 6 * mean**2 * raw_2 - 3 * mean**4
+        return m2, m3, m4
@@ -0,0 +1,161 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from dcs_core.core.common.models.metric import (
+    FieldDistribution,
+    MetricsType,
+    MetricValue,
+    TableMetrics,
+)
+from dcs_core.core.common.models.profile import NumericFieldProfile, TextFieldProfile
+from dcs_core.core.datasource.base import DataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.metric.base import MetricIdentity
+from dcs_core.core.profiling.numeric_field_profiling import NumericSQLFieldProfiler
+from dcs_core.core.profiling.text_field_profiling import TextSQLFieldProfiler
+
+
+class TableSQLProfiler:
+    """
+    TableSQLProfiler profiles all the numeric and text fields of a table and its row count.
+    The aggregates of every field are computed by one wide SELECT, so the table is scanned
+    once instead of once per field. The histograms and the most frequent values of all the
+    fields are computed by one extra query, with GROUPING SETS in a second scan where the
+    database supports them.
+    """
+
+    def __init__(
+        self,
+        data_source: SQLDataSource,
+        table_name: str,
+        fields: Dict[str, str],
+    ):
+        """
+        :param fields: data type by field name
+        """
+        self._data_source = data_source
+        self._table_name = table_name
+        self._fields = fields
+
+    def generate(self) -> TableMetrics:
+        """
+        Generate the field profiles, the value distributions and the row count of the table.
+        """
+        row_count, profiles = self.generate_field_profiles()
+        metrics: List[MetricValue] = []
+        for profile in profiles:
+            metrics.extend(profile.get_metric_values)
+        metrics.append(self._generate_row_count(row_count))
+        return TableMetrics(
+            table_name=self._table_name,
+            metrics={metric.identity: metric for metric in metrics},
+            data_source=self._data_source.data_source_name,
+            distributions={
+                profile.field_name: profile.distribution
+                for profile in profiles
+                if profile.distribution is not None
+            },
+        )
+
+    def generate_field_profiles(
+        self,
+    ) -> Tuple[int, List[Union[NumericFieldProfile, TextFieldProfile]]]:
+        """
+        Generate the profiles of the numeric and text fields of the table
+        :return: row count of the table and the field profiles
+        """
+        columns: Dict[str, Dict[str, str]] = {}
+        for field, data_type in self._fields.items():
+            if data_type in DataSource.NUMERIC_PYTHON_TYPES_FOR_PROFILING:
+                columns[field] = self._data_source.PROFILING_NUMERIC_AGGREGATES
+            elif data_type in DataSource.TEXT_PYTHON_TYPES_FOR_PROFILING:
+                columns[field] = self._data_source.PROFILING_STRING_AGGREGATES
+        row_count, values = self._data_source.profiling_sql_aggregates_table(
+            self._table_name, columns
+        )
+
+        profiles: List[Union[NumericFieldProfile, TextFieldProfile]] = []
+        histogram_ranges: Dict[str, Tuple[float, float]] = {}
+        for field in columns:
+            data_type = self._fields[field]
+            if data_type in DataSource.NUMERIC_PYTHON_TYPES_FOR_PROFILING:
+                profiler_class = NumericSQLFieldProfiler
+                min_value, max_value = values[field].get("min"), values[field].get(
+                    "max"
+                )
+                if min_value is not None and max_value is not None:
+                    histogram_ranges[field] = (float(min_value), float(max_value))
+            else:
+                profiler_class = TextSQLFieldProfiler
+            profiler = profiler_class(
+                data_source=self._data_source,
+                table_name=self._table_name,
+                field_name=field,
+                data_type=data_type,
+            )
+            profiles.append(profiler.generate_from_aggregates(values[field]))
+
+        if columns:
+            frequencies = self._data_source.profiling_sql_frequencies_table(
+                self._table_name, histogram_ranges, list(columns)
+            )
+            for profile in profiles:
+                profile.distribution = self._generate_distribution(
+                    profile.field_name,
+                    frequencies.get("top_k", {}).get(profile.field_name, []),
+                    frequencies.get("histogram", {}).get(profile.field_name),
+                    histogram_ranges.get(profile.field_name),
+                )
+        return row_count, profiles
+
+    def _generate_distribution(
+        self,
+        field_name: str,
+        top_k: List[Tuple[str, int]],
+        histogram: Union[List[Tuple[str, int]], None],
+        histogram_range: Union[Tuple[float, float], None],
+    ) -> FieldDistribution:
+        distribution = FieldDistribution(
+            field_name=field_name,
+            top_values=np.array([value for value, _ in top_k], dtype=str),
+            top_counts=np.array([count for _, count in top_k], dtype=np.int64),
+        )
+        if histogram is not None and histogram_range is not None:
+            bins = self._data_source.PROFILING_HISTOGRAM_BINS
+            counts = np.zeros(bins, dtype=np.int64)
+            for bucket, count in histogram:
+                # rounding of the bucket expression can reach the upper edge
+                counts[min(int(float(bucket)), bins - 1)] += count
+            distribution.histogram_edges = np.linspace(*histogram_range, bins + 1)
+            distribution.histogram_counts = counts
+        return distribution
+
+    def _generate_row_count(self, row_count: int) -> MetricValue:
+        return MetricValue(
+            identity=MetricIdentity.generate_identity(
+                metric_name="",
+                metric_type=MetricsType.ROW_COUNT,
+                data_source=self._data_source,
+                table_name=self._table_name,
+            ),
+            value=row_count,
+            data_source=self._data_source.data_source_name,
+            metric_type=MetricsType.ROW_COUNT,
+            table_name=self._table_name,
+            timestamp=datetime.now(timezone.utc),
+        )
@@ -40,6 +40,12 @@ class TextSQLFieldProfiler:
         )
         return self._generate_field_profile(data)
 
+    def generate_from_aggregates(self, data: Dict) -> TextFieldProfile:
+        """
+        Generate the field profile from aggregates computed elsewhere, e.g. by a table profile.
+        """
+        return self._generate_field_profile(data)
+
     def _generate_field_profile(self, data: Dict) -> TextFieldProfile:
         """
         Generate a numeric field profile from the data provided.
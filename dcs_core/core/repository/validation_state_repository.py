@@ -0,0 +1,35 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import abc
+from typing import Dict, Optional
+
+
+class ValidationStateRepository(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def get_state(self, validation_id: str) -> Optional[Dict]:
+        """
+        This method will return the state stored for the given validation_id, or None if the validation
+        has no stored state yet. The state is a JSON serializable dictionary, for example the last seen
+        watermark and the partial aggregates of an incremental validation.
+        """
+        pass
+
+    @abc.abstractmethod
+    def save_state(self, validation_id: str, state: Dict) -> int:
+        """
+        This method will save the state of the given validation_id. The previous state of the validation,
+        if any, will be overwritten.
+        """
+        pass
@@ -0,0 +1,60 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Union
+
+from dcs_core.core.common.models.validation import QueryStatistics
+
+# queries recorded for the validation computed in the current thread or task
+_recorded_queries: ContextVar[Optional[List[QueryStatistics]]] = ContextVar(
+    "dcs_recorded_queries", default=None
+)
+
+
+@contextmanager
+def record_queries() -> Iterator[List[QueryStatistics]]:
+    """
+    Record the statistics of the queries issued by the data sources inside the block
+    :return: list the statistics are appended to
+    """
+    queries: List[QueryStatistics] = []
+    token = _recorded_queries.set(queries)
+    try:
+        yield queries
+    finally:
+        _recorded_queries.reset(token)
+
+
+def record_query(
+    query: Union[str, Dict, List], start: float, rows: Optional[int] = None
+):
+    """
+    Record a query issued by a data source, if queries are being recorded
+    :param query: SQL text or search body
+    :param start: time.perf_counter() before the query was issued
+    :param rows: rows returned or documents matched, if reported by the driver
+    """
+    queries = _recorded_queries.get()
+    if queries is None:
+        return
+    queries.append(
+        QueryStatistics(
+            text=query if isinstance(query, str) else json.dumps(query, default=str),
+            time_taken=time.perf_counter() - start,
+            rows=rows,
+        )
+    )
@@ -0,0 +1,215 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import base64
+import hashlib
+import itertools
+import math
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+def _encode_array(array: np.ndarray) -> str:
+    return base64.b64encode(array.tobytes()).decode("ascii")
+
+
+def _decode_array(data: str, dtype) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(data), dtype=dtype).copy()
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch that estimates the number of distinct values.
+    The registers are a NumPy array, sketches built on different rows are merged by
+    taking the register wise maximum. The relative error is about 1.04 / sqrt(2 ** precision).
+    """
+
+    NAME = "hll"
+
+    def __init__(self, precision: int = 14, registers: Optional[np.ndarray] = None):
+        self.precision = precision
+        self.registers = (
+            registers
+            if registers is not None
+            else np.zeros(1 << precision, dtype=np.uint8)
+        )
+
+    @staticmethod
+    def _hash(values: Iterable) -> np.ndarray:
+        return np.array(
+            [
+                int.from_bytes(
+                    hashlib.blake2b(str(value).encode(), digest_size=8).digest(),
+                    "big",
+                )
+                for value in values
+            ],
+            dtype=np.uint64,
+        )
+
+    def add(self, values: Iterable):
+        """
+        Add values to the sketch, None values are ignored
+        """
+        hashes = self._hash(value for value in values if value is not None)
+        if hashes.size == 0:
+            return
+        suffix_bits = 64 - self.precision
+        indexes = (hashes >> np.uint64(suffix_bits)).astype(np.int64)
+        suffixes = hashes & np.uint64((1 << suffix_bits) - 1)
+        # suffixes are below 2 ** 53, so the float exponent is their exact bit length
+        _, bit_lengths = np.frexp(suffixes.astype(np.float64))
+        ranks = (suffix_bits - bit_lengths + 1).astype(np.uint8)
+        np.maximum.at(self.registers, indexes, ranks)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError(
+                "Can not merge HyperLogLog sketches of different precision"
+            )
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(float)))
+        zero_registers = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zero_registers > 0:
+            estimate = m * math.log(m / zero_registers)
+        return int(round(estimate))
+
+    def to_dict(self) -> Dict:
+        return {"precision": self.precision, "registers": _encode_array(self.registers)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HyperLogLog":
+        return cls(
+            precision=data["precision"],
+            registers=_decode_array(data["registers"], np.uint8),
+        )
+
+
+class TDigest:
+    """
+    Merging t-digest sketch that estimates quantiles.
+    Values are summarised by centroids (mean, weight) kept in NumPy arrays, with small
+    centroids at the tails so that extreme quantiles stay accurate. Sketches are merged
+    by compressing the union of their centroids.
+    """
+
+    NAME = "tdigest"
+
+    def __init__(
+        self,
+        compression: float = 200,
+        means: Optional[np.ndarray] = None,
+        weights: Optional[np.ndarray] = None,
+        min_value: float = math.inf,
+        max_value: float = -math.inf,
+    ):
+        self.compression = compression
+        self.means = means if means is not None else np.empty(0, dtype=np.float64)
+        self.weights = weights if weights is not None else np.empty(0, dtype=np.float64)
+        self.min_value = min_value
+        self.max_value = max_value
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def _scale(self, q: np.ndarray) -> np.ndarray:
+        return self.compression / (2 * math.pi) * np.arcsin(2 * q - 1)
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        cumulative = np.cumsum(weights) - weights / 2
+        # centroids whose quantiles fall in the same unit of the scale function are merged
+        buckets = np.floor(self._scale(np.clip(cumulative / total, 0, 1))).astype(
+            np.int64
+        )
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def add(self, values: Iterable, weights: Optional[Iterable] = None):
+        """
+        Add values to the sketch, None values are ignored
+        :param values: values to add
+        :param weights: number of occurrences of each value, one by default
+        """
+        pairs = [
+            (value, weight)
+            for value, weight in zip(
+                values, weights if weights is not None else itertools.repeat(1)
+            )
+            if value is not None
+        ]
+        if not pairs:
+            return
+        points = np.array([value for value, _ in pairs], dtype=np.float64)
+        point_weights = np.array([weight for _, weight in pairs], dtype=np.float64)
+        self.min_value = min(self.min_value, float(points.min()))
+        self.max_value = max(self.max_value, float(points.max()))
+        self._compress(
+            np.concatenate([self.means, points]),
+            np.concatenate([self.weights, point_weights]),
+        )
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        if other.means.size == 0:
+            return self
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the value at quantile q, between 0 and 1
+        """
+        if self.means.size == 0:
+            return None
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return float(
+            np.interp(
+                q * self.count,
+                np.r_[0, centers, self.count],
+                np.r_[self.min_value, self.means, self.max_value],
+            )
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "compression": self.compression,
+            "means": _encode_array(self.means),
+            "weights": _encode_array(self.weights),
+            "min": self.min_value,
+            "max": self.max_value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TDigest":
+        return cls(
+            compression=data["compression"],
+            means=_decode_array(data["means"], np.float64),
+            weights=_decode_array(data["weights"], np.float64),
+            min_value=data["min"],
+            max_value=data["max"],
+        )
@@ -0,0 +1,205 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import itertools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+from dcs_core.core.utils.utils import EnhancedJSONEncoder
+
+
+class SpanKind(str, Enum):
+    """
+    SpanKind is an enum that represents the operation traced by a span
+    """
+
+    RUN = "run"
+    DATA_SOURCE = "data_source"
+    DATASET = "dataset"
+    VALIDATION = "validation"
+    QUERY = "query"
+
+
+class _SpanJSONEncoder(EnhancedJSONEncoder):
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+@dataclass
+class Span:
+    """
+    Span is a class that represents a traced operation
+    """
+
+    span_id: int
+    kind: SpanKind
+    name: str
+    # epoch time in seconds
+    start_time: float
+    parent_id: Optional[int] = None
+    # wall time in seconds, set when the span ends
+    duration: Optional[float] = None
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def json(self):
+        return json.dumps(asdict(self), cls=_SpanJSONEncoder)
+
+
+class Tracer:
+    """
+    Receives the start and the end of the traced operations. The default tracer does
+    nothing, subclass it and override on_span_start and on_span_end to export spans.
+    The callbacks are called from the threads running the operations.
+    """
+
+    def on_span_start(self, span: Span):
+        pass
+
+    def on_span_end(self, span: Span):
+        pass
+
+
+class InMemoryTracer(Tracer):
+    """
+    Collects the ended spans in memory, e.g. for tests
+    """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def on_span_end(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def get_spans(self, kind: Optional[SpanKind] = None) -> List[Span]:
+        return [span for span in self.spans if kind is None or span.kind == kind]
+
+
+class JsonLinesFileTracer(Tracer):
+    """
+    Appends every ended span as a JSON line to a file
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+
+    def on_span_end(self, span: Span):
+        line = span.json
+        with self._lock:
+            with open(self.file_path, "a") as file:
+                file.write(line + "\n")
+
+
+_NO_OP_TRACER = Tracer()
+_tracer: Tracer = _NO_OP_TRACER
+_span_ids = itertools.count(1)
+_current_span: ContextVar[Optional[Span]] = ContextVar("dcs_current_span", default=None)
+
+
+def set_tracer(tracer: Optional[Tracer]):
+    """
+    Set the tracer that receives the spans of all the inspections, None to stop tracing
+    """
+    global _tracer
+    _tracer = tracer if tracer is not None else _NO_OP_TRACER
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def start_span(kind: SpanKind, name: str, **attributes) -> Optional[Span]:
+    """
+    Start a span that stays open until end_span, e.g. around tasks run by several threads.
+    The span is the child of the span open in the current context, but it is not made
+    current, run the traced operations within use_span.
+    :return: the span, None when tracing is disabled
+    """
+    tracer = _tracer
+    if tracer is _NO_OP_TRACER:
+        return None
+    parent = _current_span.get()
+    span = Span(
+        span_id=next(_span_ids),
+        kind=kind,
+        name=name,
+        start_time=time.time(),
+        parent_id=parent.span_id if parent is not None else None,
+        attributes=attributes,
+    )
+    tracer.on_span_start(span)
+    return span
+
+
+def end_span(span: Optional[Span], duration: Optional[float] = None):
+    """
+    End a span started with start_span
+    :param duration: wall time in seconds, by default the time since the span started
+    """
+    if span is None:
+        return
+    span.duration = time.time() - span.start_time if duration is None else duration
+    _tracer.on_span_end(span)
+
+
+@contextmanager
+def use_span(span: Optional[Span]) -> Iterator[Optional[Span]]:
+    """
+    Make the span current within the block, the spans opened in it are its children
+    """
+    if span is None:
+        yield None
+        return
+    token = _current_span.set(span)
+    try:
+        yield span
+    finally:
+        _current_span.reset(token)
+
+
+@contextmanager
+def trace(kind: SpanKind, name: str, **attributes) -> Iterator[Optional[Span]]:
+    """
+    Trace the operation run inside the block as a span. The span is the child of the span
+    open in the current context.
+    :param kind: kind of the traced operation
+    :param name: name of the traced operation
+    :param attributes: attributes of the span
+    :return: the span, None when tracing is disabled
+    """
+    span = start_span(kind, name, **attributes)
+    if span is None:
+        yield None
+        return
+    start = time.perf_counter()
+    try:
+        with use_span(span):
+            yield span
+    except BaseException as e:
+        span.error = repr(e)
+        raise
+    finally:
+        end_span(span, time.perf_counter() - start)
@@ -12,10 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import os
 import re
+import tempfile
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
+
 
 def truncate_error(error: str):
     first_line = error.split("\n", 1)[0]
@@ -37,8 +42,29 @@ def write_to_file(file_path: str, data: str):
         file.write(data)
 
 
+def write_to_file_atomically(file_path: str, data: str):
+    """
+    Write a file through a temporary file renamed over it, an interrupted write never
+    leaves a partially written file
+    """
+    fd, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(file_path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(data)
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
 class EnhancedJSONEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, datetime):
             return o.isoformat()
+        if isinstance(o, Decimal):
+            return float(o)
+        if isinstance(o, np.ndarray):
+            return o.tolist()
         return super().default(o)
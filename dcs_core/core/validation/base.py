@@ -14,10 +14,13 @@
 
 import datetime
 import json
+import math
 import sys
+import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from decimal import Decimal
+from typing import Any, List, Optional, Tuple, Union
 
 from loguru import logger
 
@@ -26,11 +29,53 @@ from dcs_core.core.common.models.configuration import (
     ValidationConfig,
 )
 from dcs_core.core.common.models.validation import (
+    AggregateMerge,
     ConditionType,
+    QueryStatistics,
     ValidationFunction,
     ValidationInfo,
+    ValidationInstrumentation,
 )
 from dcs_core.core.datasource.manager import DataSource
+from dcs_core.core.datasource.search_datasource import SearchRequest
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.repository.validation_state_repository import (
+    ValidationStateRepository,
+)
+from dcs_core.core.utils.instrumentation import record_queries
+from dcs_core.core.utils.tracing import SpanKind, trace
+
+
+def _state_value(value: Any) -> Any:
+    """
+    Convert a value fetched from a database into a JSON serializable state value
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _sql_literal(value: Any) -> str:
+    if isinstance(value, (int, float)):
+        return str(value)
+    escaped_value = str(value).replace("'", "''")
+    return f"'{escaped_value}'"
+
+
+def _merge_aggregate(merge: AggregateMerge, stored: Any, new: Any) -> Any:
+    if stored is None:
+        return new
+    if new is None:
+        return stored
+    if merge == AggregateMerge.SUM:
+        return stored + new
+    if merge == AggregateMerge.MIN:
+        return min(stored, new)
+    return max(stored, new)
 
 
 class ValidationIdentity:
@@ -66,6 +111,9 @@ class Validation(ABC):
     Validation is a class that represents a validation that is generated by a data source.
     """
 
+    # z-score of the 95% confidence interval of sampled validations
+    SAMPLE_CONFIDENCE_Z = 1.96
+
     def __init__(
         self,
         name: str,
@@ -97,6 +145,20 @@ class Validation(ABC):
             if data_source.language_support == DataSourceLanguageSupport.SQL:
                 self.values = validation_config.values
 
+        self.watermark = validation_config.watermark
+        self.approximate = bool(validation_config.approximate)
+        self.sample = validation_config.sample
+        self.cache = bool(validation_config.cache)
+        self.updated_column = validation_config.updated_column
+        self.state_repository: Optional[ValidationStateRepository] = None
+
+        self._fused_aggregate_values: Optional[Tuple] = None
+        self._prefetched_metric_value: Tuple = ()
+        self._confidence_interval: Optional[Tuple[float, float]] = None
+        self._table_fingerprint: Optional[str] = None
+        self._cached_validation_info: Optional[ValidationInfo] = None
+        self._shared_queries: List[QueryStatistics] = []
+
     def get_validation_identity(self) -> str:
         return ValidationIdentity.generate_identity(
             validation_function=self.validation_config.get_validation_function,
@@ -106,38 +168,71 @@ class Validation(ABC):
             field_name=self.field_name,
         )
 
-    def _validate_threshold(self, metric_value) -> Tuple[bool, Optional[str]]:
+    @staticmethod
+    def _interval_value(
+        operator: str, value: float, confidence_interval: Tuple[float, float]
+    ) -> float:
+        """
+        The value of the confidence interval that is the most favourable to the condition
+        """
+        lower, upper = confidence_interval
+        if operator in (ConditionType.GTE, ConditionType.GT):
+            return upper
+        if operator in (ConditionType.LTE, ConditionType.LT):
+            return lower
+        return min(max(value, lower), upper)
+
+    def _validate_threshold(
+        self,
+        metric_value,
+        confidence_interval: Optional[Tuple[float, float]] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Validate the metric value against the threshold.
+        With a confidence interval the validation only fails when the whole interval
+        violates the threshold.
+        """
+        reason_prefix = ""
+        if confidence_interval is not None:
+            reason_prefix = (
+                f"Confidence interval [{confidence_interval[0]}, "
+                f"{confidence_interval[1]}] "
+            )
         for operator, value in self.threshold.__dict__.items():
             if value is not None:
+                if confidence_interval is not None:
+                    metric_value = self._interval_value(
+                        operator, value, confidence_interval
+                    )
                 if ConditionType.GTE == operator:
                     if metric_value < value:
                         return (
                             False,
-                            f"Less than threshold value of {value}",
+                            f"{reason_prefix}Less than threshold value of {value}",
                         )
                 elif ConditionType.LTE == operator:
                     if metric_value > value:
                         return (
                             False,
-                            f"Greater than threshold value of {value}",
+                            f"{reason_prefix}Greater than threshold value of {value}",
                         )
                 elif ConditionType.GT == operator:
                     if metric_value <= value:
                         return (
                             False,
-                            f"Less than or equal to threshold value of {value}",
+                            f"{reason_prefix}Less than or equal to threshold value of {value}",
                         )
                 elif ConditionType.LT == operator:
                     if metric_value >= value:
                         return (
                             False,
-                            f"Greater than or equal to threshold value of {value}",
+                            f"{reason_prefix}Greater than or equal to threshold value of {value}",
                         )
                 elif ConditionType.EQ == operator:
                     if metric_value != value:
                         return (
                             False,
-                            f"Not equal to the value of {value}",
+                            f"{reason_prefix}Not equal to the value of {value}",
                         )
         return True, None
 
@@ -145,29 +240,382 @@ class Validation(ABC):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         pass
 
-    def get_validation_info(self, **kwargs) -> Union[ValidationInfo, None]:
-        try:
-            metric_value = self._generate_metric_value(**kwargs)
-            tags = {
-                "name": self.name,
-            }
-
-            value = ValidationInfo(
-                name=self.name,
-                identity=self.get_validation_identity(),
-                data_source_name=self.data_source.data_source_name,
-                dataset=self.dataset_name,
-                validation_function=self.validation_config.get_validation_function,
-                field=self.field_name,
-                value=metric_value,
-                timestamp=datetime.datetime.utcnow(),
-                tags=tags,
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        """
+        SQL aggregate expressions that compute the metric of this validation over the dataset.
+        The fused query planner evaluates the aggregates of every validation on the same dataset
+        and filter in a single SELECT. Returns None if the validation can not be fused.
+        """
+        return None
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        """
+        Compute the metric value from the results of the fused SQL aggregates
+        :param values: aggregate values in the order of fused_sql_aggregates
+        """
+        return values[0]
+
+    def reset_run_state(self):
+        """
+        Discard the values set for a run by the planners and the result cache, so that a
+        run that failed or skipped this validation does not serve them in the next run
+        """
+        self._fused_aggregate_values = None
+        self._prefetched_metric_value = ()
+        self._confidence_interval = None
+        self._table_fingerprint = None
+        self._cached_validation_info = None
+        self._shared_queries = []
+
+    def set_fused_aggregate_values(self, values: Optional[Tuple]):
+        """
+        Set the aggregate values computed by the fused query planner.
+        These values are consumed by the next call of get_validation_info.
+        """
+        self._fused_aggregate_values = values
+
+    def add_shared_queries(self, queries: List[QueryStatistics]):
+        """
+        Add the queries that computed the metric of this validation together with other
+        validations, e.g. a fused query. They are reported by the next call of
+        get_validation_info.
+        """
+        self._shared_queries.extend(queries)
+
+    def search_request(self) -> Optional[SearchRequest]:
+        """
+        Search request that computes the metric of this validation on a search index.
+        The search request batcher sends the requests of all the validations of a data source
+        in a single _msearch request. Returns None if the validation can not be batched.
+        """
+        return None
+
+    def set_prefetched_metric_value(self, value: Union[float, int]):
+        """
+        Set the metric value computed by a batched request.
+        The value is consumed by the next call of get_validation_info.
+        """
+        self._prefetched_metric_value = (value,)
+
+    def sampled_sql_aggregates(self) -> Optional[List[str]]:
+        """
+        SQL aggregates that estimate the metric of this validation from a random sample.
+        By default a plain count, or a count with the COUNT(*) of a percentage, is sampled.
+        Returns None if the metric can not be estimated from a sample.
+        """
+        aggregates = self.fused_sql_aggregates()
+        if not aggregates or not all(
+            aggregate.startswith("COUNT(")
+            and not aggregate.startswith("COUNT(DISTINCT")
+            for aggregate in aggregates
+        ):
+            return None
+        if len(aggregates) == 1 or (
+            len(aggregates) == 2 and aggregates[1] == "COUNT(*)"
+        ):
+            return aggregates
+        return None
+
+    def sampled_metric_value(
+        self, values: Tuple, fraction: float
+    ) -> Tuple[Union[float, int], Optional[Tuple[float, float]]]:
+        """
+        Estimate the metric value and its confidence interval from the sampled aggregates
+        :param values: aggregate values in the order of sampled_sql_aggregates
+        :param fraction: sampled fraction of the rows, between 0 and 1
+        :return: estimated value and confidence interval
+        """
+        z = self.SAMPLE_CONFIDENCE_Z
+        if len(values) == 1:
+            # score interval of the sampled count, it stays wide when no row is sampled
+            count = values[0] or 0
+            variance_factor = 1 - fraction
+            center = count + z**2 * variance_factor / 2
+            margin = z * math.sqrt(
+                variance_factor * (count + z**2 * variance_factor / 4)
+            )
+            return round(count / fraction), (
+                round(max(center - margin, 0) / fraction, 2),
+                round((center + margin) / fraction, 2),
+            )
+        matched_count, sample_count = values
+        if not sample_count:
+            return self.fused_metric_value(values), (0.0, 100.0)
+        # Wilson interval, unlike the Wald interval it does not collapse at 0 and 100%
+        proportion = matched_count / sample_count
+        weight = z**2 / sample_count
+        center = (proportion + weight / 2) / (1 + weight)
+        margin = (
+            z
+            / (1 + weight)
+            * math.sqrt(
+                proportion * (1 - proportion) / sample_count
+                + weight / (4 * sample_count)
+            )
+        )
+        return self.fused_metric_value(values), (
+            round(max(center - margin, 0) * 100, 2),
+            round(min(center + margin, 1) * 100, 2),
+        )
+
+    @property
+    def is_sampled(self) -> bool:
+        return (
+            self.sample is not None
+            and 0 < self.sample < 100
+            and isinstance(self.data_source, SQLDataSource)
+            and self.sampled_sql_aggregates() is not None
+        )
+
+    def _generate_sampled_metric_value(self) -> Union[float, int]:
+        """
+        Estimate the metric value on a random sample of the dataset.
+        The confidence interval of the estimate is consumed by get_validation_info.
+        """
+        query = (
+            f"SELECT {', '.join(self.sampled_sql_aggregates())} "
+            f"FROM {self.data_source.sampled_table_name(self.dataset_name, self.sample)}"
+        )
+        if self.where_filter:
+            query += f" WHERE {self.where_filter}"
+        row = self.data_source.fetchone(query)
+        value, self._confidence_interval = self.sampled_metric_value(
+            tuple(row), self.sample / 100
+        )
+        return value
+
+    def incremental_sql_aggregates(
+        self,
+    ) -> Optional[List[Tuple[str, AggregateMerge]]]:
+        """
+        Mergeable SQL aggregates that compute the metric of this validation incrementally.
+        Every aggregate is evaluated on the rows past the stored watermark and merged into its
+        stored value. By default the validations made of plain counts are incremental.
+        Returns None if the metric can not be computed incrementally.
+        """
+        aggregates = self.fused_sql_aggregates()
+        if not aggregates or not all(
+            aggregate.startswith("COUNT(")
+            and not aggregate.startswith("COUNT(DISTINCT")
+            for aggregate in aggregates
+        ):
+            return None
+        return [(aggregate, AggregateMerge.SUM) for aggregate in aggregates]
+
+    def incremental_metric_value(self, values: Tuple) -> Union[float, int]:
+        """
+        Compute the metric value from the merged incremental aggregates
+        :param values: merged aggregate values in the order of incremental_sql_aggregates
+        """
+        return self.fused_metric_value(values)
+
+    @property
+    def is_incremental(self) -> bool:
+        return (
+            self.watermark is not None
+            and self.state_repository is not None
+            and isinstance(self.data_source, SQLDataSource)
+            and self.incremental_sql_aggregates() is not None
+        )
+
+    @property
+    def keeps_sketch(self) -> bool:
+        """
+        Approximate validations with a watermark keep a column sketch between runs, the
+        others use the approximate aggregates of the database
+        """
+        return (
+            self.approximate
+            and self.watermark is not None
+            and self.state_repository is not None
+            and isinstance(self.data_source, SQLDataSource)
+        )
+
+    def _generate_incremental_metric_value(self) -> Union[float, int]:
+        """
+        Scan the rows past the stored watermark and merge their aggregates into the stored state.
+        The watermark must strictly increase, rows inserted later with a watermark equal to
+        the stored one are not scanned.
+        """
+        validation_id = self.get_validation_identity()
+        aggregates = self.incremental_sql_aggregates()
+        expressions = [expression for expression, _ in aggregates]
+
+        state = self.state_repository.get_state(validation_id)
+        # a state computed with other aggregates, watermark or filter can not be merged, rescan
+        if state is not None and (
+            state.get("aggregates") != expressions
+            or state.get("watermark_column") != self.watermark
+            or state.get("where_filter") != self.where_filter
+        ):
+            state = None
+
+        filters = [f"({self.where_filter})"] if self.where_filter else []
+        if state is not None:
+            filters.append(f"{self.watermark} > {_sql_literal(state['watermark'])}")
+        select_list = ", ".join(expressions + [f"MAX({self.watermark})"])
+        query = f"SELECT {select_list} FROM {self.data_source.qualified_table_name(self.dataset_name)}"
+        if filters:
+            query += f" WHERE {' AND '.join(filters)}"
+        row = self.data_source.fetchone(query)
+
+        values = [_state_value(value) for value in row[:-1]]
+        watermark = _state_value(row[-1])
+        if state is not None:
+            values = [
+                _merge_aggregate(merge, stored, new)
+                for (_, merge), stored, new in zip(aggregates, state["values"], values)
+            ]
+            if watermark is None:
+                watermark = state["watermark"]
+        if watermark is not None:
+            self.state_repository.save_state(
+                validation_id,
+                {
+                    "watermark_column": self.watermark,
+                    "watermark": watermark,
+                    "where_filter": self.where_filter,
+                    "aggregates": expressions,
+                    "values": values,
+                },
             )
-            if self.threshold is not None:
-                value.is_valid, value.reason = self._validate_threshold(metric_value)
+        return self.incremental_metric_value(tuple(values))
+
+    @property
+    def result_cache_id(self) -> str:
+        return f"{self.get_validation_identity()}.result"
+
+    def result_signature(self) -> str:
+        """
+        Signature of the settings that change the metric value of the validation.
+        A cached result is only reused while the signature stays the same.
+        """
+        config = self.validation_config
+        return json.dumps(
+            [
+                config.on,
+                config.where,
+                config.query,
+                config.regex,
+                config.values,
+                config.sample,
+                config.approximate,
+            ],
+            default=str,
+        )
+
+    @property
+    def is_result_cacheable(self) -> bool:
+        return (
+            self.cache
+            and self.state_repository is not None
+            and isinstance(self.data_source, SQLDataSource)
+        )
+
+    def set_table_fingerprint(self, fingerprint: Optional[str]):
+        """
+        Set the fingerprint of the dataset, the result of the validation is stored with it
+        """
+        self._table_fingerprint = fingerprint
 
+    def set_cached_validation_info(self, validation_info: ValidationInfo):
+        """
+        Set the result of an earlier run on the unchanged dataset.
+        The result is returned by the next call of get_validation_info without any query.
+        """
+        self._cached_validation_info = validation_info
+
+    @property
+    def is_cached(self) -> bool:
+        return self._cached_validation_info is not None
+
+    def _get_metric_value(self, **kwargs) -> Union[float, int]:
+        if self._prefetched_metric_value:
+            (value,), self._prefetched_metric_value = self._prefetched_metric_value, ()
             return value
-        except Exception as e:
-            traceback.print_exc(file=sys.stdout)
-            logger.error(f"Failed to generate metric {self.name}: {str(e)}")
-            return None
+        if self._fused_aggregate_values is not None:
+            values, self._fused_aggregate_values = self._fused_aggregate_values, None
+            return self.fused_metric_value(values)
+        if self.is_incremental:
+            return self._generate_incremental_metric_value()
+        if self.is_sampled:
+            return self._generate_sampled_metric_value()
+        return self._generate_metric_value(**kwargs)
+
+    @staticmethod
+    def _instrumentation(
+        start: float,
+        queries: List[QueryStatistics],
+        shared_queries: List[QueryStatistics],
+    ) -> ValidationInstrumentation:
+        return ValidationInstrumentation(
+            time_taken=time.perf_counter()
+            - start
+            + sum(query.time_taken / query.shared_by for query in shared_queries),
+            queries=shared_queries + queries,
+        )
+
+    def get_validation_info(self, **kwargs) -> Union[ValidationInfo, None]:
+        with trace(
+            SpanKind.VALIDATION,
+            self.name,
+            data_source=self.data_source.data_source_name,
+            dataset=self.dataset_name,
+        ) as span:
+            start = time.perf_counter()
+            shared_queries, self._shared_queries = self._shared_queries, []
+            if self._cached_validation_info is not None:
+                validation_info, self._cached_validation_info = (
+                    self._cached_validation_info,
+                    None,
+                )
+                validation_info.instrumentation = self._instrumentation(start, [], [])
+                return validation_info
+            try:
+                with record_queries() as queries:
+                    metric_value = self._get_metric_value(**kwargs)
+                confidence_interval, self._confidence_interval = (
+                    self._confidence_interval,
+                    None,
+                )
+                tags = {
+                    "name": self.name,
+                }
+
+                value = ValidationInfo(
+                    name=self.name,
+                    identity=self.get_validation_identity(),
+                    data_source_name=self.data_source.data_source_name,
+                    dataset=self.dataset_name,
+                    validation_function=self.validation_config.get_validation_function,
+                    field=self.field_name,
+                    value=metric_value,
+                    timestamp=datetime.datetime.utcnow(),
+                    tags=tags,
+                    confidence_interval=confidence_interval,
+                )
+                if self.threshold is not None:
+                    value.is_valid, value.reason = self._validate_threshold(
+                        metric_value, confidence_interval
+                    )
+                if self._table_fingerprint is not None:
+                    fingerprint, self._table_fingerprint = self._table_fingerprint, None
+                    self.state_repository.save_state(
+                        self.result_cache_id,
+                        {
+                            "fingerprint": fingerprint,
+                            "signature": self.result_signature(),
+                            "validation_info": value.json,
+                        },
+                    )
+
+                value.instrumentation = self._instrumentation(
+                    start, queries, shared_queries
+                )
+                return value
+            except Exception as e:
+                traceback.print_exc(file=sys.stdout)
+                logger.error(f"Failed to generate metric {self.name}: {str(e)}")
+                if span is not None:
+                    span.error = repr(e)
+                return None
@@ -0,0 +1,142 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from dcs_core.core.common.models.validation import ValidationInfo
+from dcs_core.core.utils.tracing import SpanKind, trace
+from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.executor import ValidationExecutor
+
+
+class ValidationResultCache:
+    """
+    Serves validations on unchanged datasets from their stored results.
+    A cheap fingerprint of every dataset, e.g. the latest value of its updated column or
+    the last change time tracked by the database, is fetched once per run. The result of
+    a validation is stored with the fingerprint, and while the fingerprint and the
+    validation settings stay the same the stored result is returned without running the
+    metric query.
+    """
+
+    def plan(
+        self, validations: Dict[str, Dict[str, Dict[str, Validation]]]
+    ) -> Dict[Tuple[str, str, Optional[str]], List[Validation]]:
+        """
+        Group the cacheable validations by the fingerprint they depend on
+        :param validations: validations in the ValidationManager format
+        :return: validations by (data source name, dataset, updated column)
+        """
+        groups: Dict[Tuple[str, str, Optional[str]], List[Validation]] = {}
+        for data_source_name, datasets in validations.items():
+            for dataset, validations_by_name in datasets.items():
+                for validation in validations_by_name.values():
+                    if not validation.is_result_cacheable:
+                        continue
+                    groups.setdefault(
+                        (data_source_name, dataset, validation.updated_column), []
+                    ).append(validation)
+        return groups
+
+    @staticmethod
+    def load_cached_result(validation: Validation, fingerprint: str) -> bool:
+        """
+        Give the stored result to the validation if it was computed on the same fingerprint
+        :return: True if the validation is served from the cache
+        """
+        validation.set_table_fingerprint(fingerprint)
+        state = validation.state_repository.get_state(validation.result_cache_id)
+        if (
+            state is None
+            or state.get("fingerprint") != fingerprint
+            or state.get("signature") != validation.result_signature()
+        ):
+            return False
+        validation_info = ValidationInfo.from_json(state["validation_info"])
+        validation_info.cached = True
+        # the threshold may have changed since the result was stored
+        validation_info.is_valid, validation_info.reason = (
+            validation._validate_threshold(
+                validation_info.value, validation_info.confidence_interval
+            )
+            if validation.threshold is not None
+            else (None, None)
+        )
+        validation.set_table_fingerprint(None)
+        validation.set_cached_validation_info(validation_info)
+        return True
+
+    def execute_group(
+        self, dataset: str, updated_column: Optional[str], validations: List[Validation]
+    ) -> int:
+        """
+        Fingerprint a dataset and serve its validations from the cache when it is unchanged
+        :return: number of validations served from the cache
+        """
+        data_source = validations[0].data_source
+        with trace(
+            SpanKind.DATASET,
+            "result_cache",
+            data_source=data_source.data_source_name,
+            dataset=dataset,
+            validations=len(validations),
+        ):
+            try:
+                fingerprint = data_source.query_get_table_fingerprint(
+                    dataset, updated_column
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fingerprint {dataset}, validations will not be cached: {str(e)}"
+                )
+                return 0
+            if fingerprint is None:
+                logger.warning(
+                    f"Can not detect changes of {dataset}, set updated_column to cache "
+                    "its validations"
+                )
+                return 0
+            return sum(
+                self.load_cached_result(validation, fingerprint)
+                for validation in validations
+            )
+
+    def execute(
+        self,
+        validations: Dict[str, Dict[str, Dict[str, Validation]]],
+        executor: Optional[ValidationExecutor] = None,
+    ) -> int:
+        """
+        Serve the validations on unchanged datasets from the cache
+        :param validations: validations in the ValidationManager format
+        :param executor: executor to fingerprint the datasets concurrently, sequential if None
+        :return: number of validations served from the cache
+        """
+        tasks = [
+            (
+                data_source_name,
+                partial(self.execute_group, dataset, updated_column, group),
+            )
+            for (
+                data_source_name,
+                dataset,
+                updated_column,
+            ), group in self.plan(validations).items()
+        ]
+        if executor is None:
+            return sum(task() for _, task in tasks)
+        return sum(executor.run(tasks))
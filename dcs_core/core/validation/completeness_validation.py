@@ -12,9 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Union
+from typing import List, Optional, Tuple, Union
 
-from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from dcs_core.core.datasource.search_datasource import (
+    SearchIndexDataSource,
+    SearchRequest,
+)
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.validation.base import Validation
 
@@ -36,6 +39,16 @@ class CountNullValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_null_count(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} IS NULL THEN 1 END)"]
+
 
 class PercentageNullValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -54,6 +67,20 @@ class PercentageNullValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_null_percentage(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} IS NULL THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        null_count, total_count = values
+        return round(null_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountEmptyStringValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -72,6 +99,16 @@ class CountEmptyStringValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_empty_string_count(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} = '' THEN 1 END)"]
+
 
 class PercentageEmptyStringValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -90,6 +127,22 @@ class PercentageEmptyStringValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_empty_string_percentage(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} = '' THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        empty_string_count, total_count = values
+        return (
+            round(empty_string_count / total_count * 100, 2) if total_count > 0 else 0.0
+        )
+
 
 class CountAllSpaceValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -103,6 +156,9 @@ class CountAllSpaceValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN TRIM({self.field_name}) = '' THEN 1 END)"]
+
 
 class PercentageAllSpaceValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -116,6 +172,16 @@ class PercentageAllSpaceValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN TRIM({self.field_name}) = '' THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        space_count, total_count = values
+        return round(space_count / total_count * 100) if total_count > 0 else 0
+
 
 class CountNullKeywordValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -129,6 +195,11 @@ class CountNullKeywordValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN LOWER({self.field_name}) IN ('nothing', 'nil', 'null', 'none', 'n/a') THEN 1 END)"
+        ]
+
 
 class PercentageNullKeywordValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -141,3 +212,15 @@ class PercentageNullKeywordValidation(Validation):
             )
         else:
             raise ValueError("Invalid data source type")
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN LOWER({self.field_name}) IN ('nothing', 'nil', 'null', 'none', 'n/a') THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        null_keyword_count, total_count = values
+        return (
+            round(null_keyword_count / total_count * 100, 2) if total_count > 0 else 0
+        )
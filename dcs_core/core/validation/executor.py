@@ -0,0 +1,171 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextvars
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from dcs_core.core.common.models.validation import ValidationInfo
+from dcs_core.core.utils.tracing import SpanKind, end_span, start_span, use_span
+from dcs_core.core.validation.base import Validation
+
+
+class _DatasetSpan:
+    """
+    Traces the validations of a dataset as the children of one dataset span.
+    They may run on several threads, the span starts with the first of them and ends
+    with the last one.
+    """
+
+    def __init__(self, data_source_name: str, dataset: str, validation_count: int):
+        self.data_source_name = data_source_name
+        self.dataset = dataset
+        self.validation_count = validation_count
+        self._remaining = validation_count
+        self._started = False
+        self._span = None
+        self._lock = threading.Lock()
+
+    def run(self, task: Callable[[], Any]) -> Any:
+        with self._lock:
+            if not self._started:
+                self._started = True
+                self._span = start_span(
+                    SpanKind.DATASET,
+                    "validations",
+                    data_source=self.data_source_name,
+                    dataset=self.dataset,
+                    validations=self.validation_count,
+                )
+        try:
+            with use_span(self._span):
+                return task()
+        finally:
+            with self._lock:
+                self._remaining -= 1
+                ended = self._remaining == 0
+            if ended:
+                end_span(self._span)
+
+
+class ValidationExecutor:
+    """
+    Runs validations concurrently on a thread pool.
+    Tasks of different data sources run at the same time, while every data source runs
+    at most max_concurrency tasks at once so that a single warehouse is not overloaded.
+    Results are always returned in the order of the submitted tasks.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_MAX_CONCURRENCY = 1
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_concurrency: Optional[Dict[str, int]] = None,
+    ):
+        """
+        :param max_workers: maximum number of threads across all the data sources
+        :param max_concurrency: maximum number of concurrent tasks by data source name
+        """
+        self.max_workers = max_workers
+        self.max_concurrency: Dict[str, int] = max_concurrency or {}
+
+    def get_max_concurrency(self, data_source_name: str) -> int:
+        return max(
+            self.max_concurrency.get(data_source_name, self.DEFAULT_MAX_CONCURRENCY), 1
+        )
+
+    def run(self, tasks: List[Tuple[str, Callable[[], Any]]]) -> List[Any]:
+        """
+        Run the tasks and return their results in the order of the tasks
+        :param tasks: list of (data source name, task) pairs
+        :return: list of task results
+        """
+        results: List[Any] = [None] * len(tasks)
+        queues: Dict[str, Deque[int]] = {}
+        for index, (data_source_name, _) in enumerate(tasks):
+            queues.setdefault(data_source_name, deque()).append(index)
+
+        def drain(queue: Deque[int]):
+            while True:
+                try:
+                    index = queue.popleft()
+                except IndexError:
+                    return
+                results[index] = tasks[index][1]()
+
+        # One lane per allowed concurrent task of a data source. Lanes are interleaved
+        # across data sources so that all of them start early when threads are scarce.
+        lanes_by_data_source = [
+            [queue] * min(self.get_max_concurrency(data_source_name), len(queue))
+            for data_source_name, queue in queues.items()
+        ]
+        lanes: List[Deque[int]] = []
+        for position in range(max((len(l) for l in lanes_by_data_source), default=0)):
+            for data_source_lanes in lanes_by_data_source:
+                if position < len(data_source_lanes):
+                    lanes.append(data_source_lanes[position])
+
+        if not lanes:
+            return results
+        with ThreadPoolExecutor(
+            max_workers=max(min(self.max_workers, len(lanes)), 1),
+            thread_name_prefix="dcs-validation",
+        ) as pool:
+            # every lane runs in a copy of the caller context, so that the spans of the
+            # tasks are children of the span open in the caller
+            futures = [
+                pool.submit(contextvars.copy_context().run, drain, queue)
+                for queue in lanes
+            ]
+            for future in futures:
+                future.result()
+        return results
+
+    def execute(
+        self, validations: Dict[str, Dict[str, Dict[str, Validation]]]
+    ) -> Dict[str, ValidationInfo]:
+        """
+        Generate the validation info of all the validations
+        :param validations: validations in the ValidationManager format
+        :return: validation info by validation identity, in the order of the validations
+        """
+        ordered_validations: List[Validation] = []
+        tasks: List[Tuple[str, Callable[[], Any]]] = []
+        for data_source_name, datasets in validations.items():
+            for dataset, validations_by_name in datasets.items():
+                if not validations_by_name:
+                    continue
+                dataset_span = _DatasetSpan(
+                    data_source_name, dataset, len(validations_by_name)
+                )
+                for validation in validations_by_name.values():
+                    ordered_validations.append(validation)
+                    tasks.append(
+                        (
+                            validation.data_source.data_source_name,
+                            partial(dataset_span.run, validation.get_validation_info),
+                        )
+                    )
+        validation_infos = self.run(tasks)
+        return {
+            validation.get_validation_identity(): validation_info
+            for validation, validation_info in zip(
+                ordered_validations, validation_infos
+            )
+        }
@@ -12,7 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Dict
+import hashlib
+from typing import Dict, Optional, Set, Tuple
 
 from dcs_core.core.common.models.configuration import (
     Configuration,
@@ -20,6 +21,9 @@ from dcs_core.core.common.models.configuration import (
 )
 from dcs_core.core.common.models.validation import ValidationFunction
 from dcs_core.core.datasource.manager import DataSourceManager
+from dcs_core.core.repository.validation_state_repository import (
+    ValidationStateRepository,
+)
 from dcs_core.core.validation.base import Validation
 from dcs_core.core.validation.completeness_validation import (  # noqa F401 this is used in globals
     CountAllSpaceValidation,
@@ -209,11 +213,57 @@ class ValidationManager:
         }
         """
         self.validations: Dict[str, Dict[str, Dict[str, Validation]]] = {}
+        # key of the configuration and the data sources the validations were built from
+        self._built_key: Optional[str] = None
+        # (data source, dataset, validation) of the validations built from the configuration
+        self._built_validations: Set[Tuple[str, str, str]] = set()
 
     def set_validation_configs(self, validations: Dict[str, ValidationConfigByDataset]):
         self.validation_configs = validations
 
+    def set_state_repository(self, state_repository: ValidationStateRepository):
+        """
+        Give the state repository to the validations that run incrementally on a watermark
+        or keep a sketch or their result between runs
+        """
+        for datasets in self.validations.values():
+            for validations_by_name in datasets.values():
+                for validation in validations_by_name.values():
+                    if (
+                        validation.watermark is not None
+                        or validation.approximate
+                        or validation.cache
+                    ):
+                        validation.state_repository = state_repository
+
+    @property
+    def plan_key(self) -> Optional[str]:
+        """
+        Key of the built validations. It only changes when the validations are rebuilt, so
+        the plans made for the validations can be reused while it stays the same.
+        """
+        return self._built_key
+
+    def _build_key(self) -> str:
+        data_source_ids = [
+            f"{name}:{id(data_source)}"
+            for name, data_source in self.data_source_manager.get_data_sources.items()
+        ]
+        return hashlib.sha256(
+            repr((self.validation_configs, data_source_ids)).encode()
+        ).hexdigest()
+
     def build_validations(self):
+        """
+        Build the validations of the configuration. The validations of an earlier build are
+        reused while the configuration and the data sources are unchanged, e.g. when a
+        long running process inspects on a schedule. The validations removed from the
+        configuration are dropped.
+        """
+        built_key = self._build_key()
+        if built_key == self._built_key:
+            return
+        built_validations: Set[Tuple[str, str, str]] = set()
         for _, validation_by_dataset in self.validation_configs.items():
             data_source_name = validation_by_dataset.data_source
             dataset_name = validation_by_dataset.dataset
@@ -246,6 +296,30 @@ class ValidationManager:
                 self.validations[data_source_name][dataset_name][
                     validation_name
                 ] = validation
+                built_validations.add((data_source_name, dataset_name, validation_name))
+        for data_source_name, dataset_name, validation_name in (
+            self._built_validations - built_validations
+        ):
+            datasets = self.validations.get(data_source_name, {})
+            validations_by_name = datasets.get(dataset_name)
+            if validations_by_name is None:
+                continue
+            validations_by_name.pop(validation_name, None)
+            if not validations_by_name:
+                del datasets[dataset_name]
+            if not datasets:
+                del self.validations[data_source_name]
+        self._built_validations = built_validations
+        self._built_key = built_key
+
+    def reset_run_state(self):
+        """
+        Reset the per-run state of the validations, at the start of a run
+        """
+        for datasets in self.validations.values():
+            for validations_by_name in datasets.values():
+                for validation in validations_by_name.values():
+                    validation.reset_run_state()
 
     def add_validation(self, validation: Validation):
         data_source_name = validation.data_source.data_source_name
@@ -258,6 +332,8 @@ class ValidationManager:
             self.validations[data_source_name][dataset_name] = {}
 
         self.validations[data_source_name][dataset_name][validation_name] = validation
+        # the plans made for the earlier validations do not cover the new one
+        self._built_key = None
 
     @property
     def get_validations(self):
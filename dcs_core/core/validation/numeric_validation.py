@@ -12,11 +12,26 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Union
-
-from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+import math
+from typing import List, Optional, Tuple, Union
+
+from dcs_core.core.common.models.validation import AggregateMerge
+from dcs_core.core.datasource.search_datasource import (
+    SearchIndexDataSource,
+    SearchRequest,
+)
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.sketch import get_approximate_percentile
+
+
+def _sample_variance(count, total, sum_of_squares) -> Optional[float]:
+    """
+    Sample variance from the count, sum and sum of squares of the values
+    """
+    if not count or count < 2:
+        return None
+    return max((sum_of_squares - total * total / count) / (count - 1), 0.0)
 
 
 class MinValidation(Validation):
@@ -36,6 +51,19 @@ class MinValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_min(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"MIN({self.field_name})"]
+
+    def incremental_sql_aggregates(self) -> Optional[List[Tuple[str, AggregateMerge]]]:
+        return [(f"MIN({self.field_name})", AggregateMerge.MIN)]
+
 
 class MaxValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -54,6 +82,19 @@ class MaxValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_max(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"MAX({self.field_name})"]
+
+    def incremental_sql_aggregates(self) -> Optional[List[Tuple[str, AggregateMerge]]]:
+        return [(f"MAX({self.field_name})", AggregateMerge.MAX)]
+
 
 class AvgValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -72,6 +113,52 @@ class AvgValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_avg(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"AVG({self.field_name})"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        return round(values[0], 2)
+
+    def incremental_sql_aggregates(self) -> Optional[List[Tuple[str, AggregateMerge]]]:
+        return [
+            (f"SUM({self.field_name})", AggregateMerge.SUM),
+            (f"COUNT({self.field_name})", AggregateMerge.SUM),
+        ]
+
+    def incremental_metric_value(self, values: Tuple) -> Union[float, int]:
+        total, count = values
+        return round(total / count, 2) if count else None
+
+    def sampled_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT({self.field_name})",
+            f"SUM({self.field_name})",
+            f"SUM({self.field_name} * {self.field_name})",
+        ]
+
+    def sampled_metric_value(
+        self, values: Tuple, fraction: float
+    ) -> Tuple[Union[float, int], Optional[Tuple[float, float]]]:
+        count, total, sum_of_squares = values
+        if not count:
+            return None, None
+        average = total / count
+        variance = _sample_variance(count, total, sum_of_squares)
+        if variance is None:
+            return round(average, 2), None
+        margin = self.SAMPLE_CONFIDENCE_Z * math.sqrt(variance / count)
+        return round(average, 2), (
+            round(average - margin, 2),
+            round(average + margin, 2),
+        )
+
 
 class SumValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -90,6 +177,22 @@ class SumValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_sum(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"SUM({self.field_name})"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        return round(values[0], 2)
+
+    def incremental_sql_aggregates(self) -> Optional[List[Tuple[str, AggregateMerge]]]:
+        return [(f"SUM({self.field_name})", AggregateMerge.SUM)]
+
 
 class VarianceValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -108,6 +211,30 @@ class VarianceValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_variance(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"VAR_SAMP({self.field_name})"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        return round(values[0], 2)
+
+    def incremental_sql_aggregates(self) -> Optional[List[Tuple[str, AggregateMerge]]]:
+        return [
+            (f"COUNT({self.field_name})", AggregateMerge.SUM),
+            (f"SUM({self.field_name})", AggregateMerge.SUM),
+            (f"SUM({self.field_name} * {self.field_name})", AggregateMerge.SUM),
+        ]
+
+    def incremental_metric_value(self, values: Tuple) -> Union[float, int]:
+        variance = _sample_variance(*values)
+        return round(variance, 2) if variance is not None else None
+
 
 class StdDevValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -126,10 +253,51 @@ class StdDevValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_stddev(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"STDDEV_SAMP({self.field_name})"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        return round(values[0], 2)
+
+    def incremental_sql_aggregates(self) -> Optional[List[Tuple[str, AggregateMerge]]]:
+        return [
+            (f"COUNT({self.field_name})", AggregateMerge.SUM),
+            (f"SUM({self.field_name})", AggregateMerge.SUM),
+            (f"SUM({self.field_name} * {self.field_name})", AggregateMerge.SUM),
+        ]
+
+    def incremental_metric_value(self, values: Tuple) -> Union[float, int]:
+        variance = _sample_variance(*values)
+        return round(math.sqrt(variance), 2) if variance is not None else None
+
+
+def _fused_percentile_aggregates(
+    validation: Validation, percentile: float
+) -> Optional[List[str]]:
+    aggregate = None
+    if validation.approximate:
+        aggregate = validation.data_source.approximate_percentile_aggregate(
+            validation.field_name, percentile
+        )
+    if aggregate is None:
+        aggregate = validation.data_source.percentile_aggregate(
+            validation.field_name, percentile
+        )
+    return None if aggregate is None else [aggregate]
+
 
 class Percentile20Validation(Validation):
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
+            if self.approximate:
+                return get_approximate_percentile(self, percentile=0.2)
             return self.data_source.query_get_percentile(
                 table=self.dataset_name,
                 field=self.field_name,
@@ -139,10 +307,18 @@ class Percentile20Validation(Validation):
         else:
             raise ValueError("Unsupported data source type for Percentile20Validation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return _fused_percentile_aggregates(self, 0.2)
+
+    def fused_metric_value(self, values: Tuple) -> float:
+        return round(values[0], 2)
+
 
 class Percentile40Validation(Validation):
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
+            if self.approximate:
+                return get_approximate_percentile(self, percentile=0.4)
             return self.data_source.query_get_percentile(
                 table=self.dataset_name,
                 field=self.field_name,
@@ -152,10 +328,18 @@ class Percentile40Validation(Validation):
         else:
             raise ValueError("Unsupported data source type for Percentile40Validation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return _fused_percentile_aggregates(self, 0.4)
+
+    def fused_metric_value(self, values: Tuple) -> float:
+        return round(values[0], 2)
+
 
 class Percentile60Validation(Validation):
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
+            if self.approximate:
+                return get_approximate_percentile(self, percentile=0.6)
             return self.data_source.query_get_percentile(
                 table=self.dataset_name,
                 field=self.field_name,
@@ -165,10 +349,18 @@ class Percentile60Validation(Validation):
         else:
             raise ValueError("Unsupported data source type for Percentile60Validation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return _fused_percentile_aggregates(self, 0.6)
+
+    def fused_metric_value(self, values: Tuple) -> float:
+        return round(values[0], 2)
+
 
 class Percentile80Validation(Validation):
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
+            if self.approximate:
+                return get_approximate_percentile(self, percentile=0.8)
             return self.data_source.query_get_percentile(
                 table=self.dataset_name,
                 field=self.field_name,
@@ -178,10 +370,18 @@ class Percentile80Validation(Validation):
         else:
             raise ValueError("Unsupported data source type for Percentile80Validation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return _fused_percentile_aggregates(self, 0.8)
+
+    def fused_metric_value(self, values: Tuple) -> float:
+        return round(values[0], 2)
+
 
 class Percentile90Validation(Validation):
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
+            if self.approximate:
+                return get_approximate_percentile(self, percentile=0.9)
             return self.data_source.query_get_percentile(
                 table=self.dataset_name,
                 field=self.field_name,
@@ -191,6 +391,12 @@ class Percentile90Validation(Validation):
         else:
             raise ValueError("Unsupported data source type for Percentile90Validation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return _fused_percentile_aggregates(self, 0.9)
+
+    def fused_metric_value(self, values: Tuple) -> float:
+        return round(values[0], 2)
+
 
 class CountZeroValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> int:
@@ -204,6 +410,9 @@ class CountZeroValidation(Validation):
         else:
             raise ValueError("Unsupported data source type for CountZeroValidation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} = 0 THEN 1 END)"]
+
 
 class PercentZeroValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> float:
@@ -217,6 +426,13 @@ class PercentZeroValidation(Validation):
         else:
             raise ValueError("Unsupported data source type for PercentZeroValidation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} = 0 THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> float:
+        zero_count, total_count = values
+        return round(zero_count / total_count * 100, 2) if total_count > 0 else 0.0
+
 
 class CountNegativeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> int:
@@ -230,6 +446,9 @@ class CountNegativeValidation(Validation):
         else:
             raise ValueError("Unsupported data source type for CountNegativeValidation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} < 0 THEN 1 END)"]
+
 
 class PercentNegativeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> float:
@@ -244,3 +463,10 @@ class PercentNegativeValidation(Validation):
             raise ValueError(
                 "Unsupported data source type for PercentNegativeValidation"
             )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {self.field_name} < 0 THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> float:
+        negative_count, total_count = values
+        return round(negative_count / total_count * 100, 2) if total_count > 0 else 0.0
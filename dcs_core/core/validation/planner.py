@@ -0,0 +1,445 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from loguru import logger
+
+from dcs_core.core.common.models.validation import QueryStatistics
+from dcs_core.core.datasource.search_datasource import (
+    SearchIndexDataSource,
+    SearchRequest,
+)
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.utils.instrumentation import record_queries
+from dcs_core.core.utils.tracing import SpanKind, trace
+from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.executor import ValidationExecutor
+
+
+def share_queries(queries: List[QueryStatistics], validations: List[Validation]):
+    """
+    Report the queries that served many validations on each of them, with an equal share
+    of their cost
+    """
+    if not validations:
+        return
+    for query in queries:
+        query.shared_by = len(validations)
+    for validation in validations:
+        validation.add_shared_queries(queries)
+
+
+class PlanCache:
+    """
+    Memoizes the plans of a planner between runs, so that a long running process that
+    inspects the same validations on a schedule plans them, and builds their SQL and search
+    bodies, only once. A plan is reused while the validations are not rebuilt, see
+    ValidationManager.plan_key, and the same validations are served from the result cache.
+    """
+
+    MAX_PLANS = 8
+
+    def __init__(self):
+        self._plans: OrderedDict[Tuple[str, FrozenSet[str]], List] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cached_validation_ids(
+        validations: Dict[str, Dict[str, Dict[str, Validation]]]
+    ) -> FrozenSet[str]:
+        return frozenset(
+            validation.result_cache_id
+            for datasets in validations.values()
+            for validations_by_name in datasets.values()
+            for validation in validations_by_name.values()
+            if validation.is_cached
+        )
+
+    def get(
+        self,
+        plan_key: Optional[str],
+        validations: Dict[str, Dict[str, Dict[str, Validation]]],
+        plan: Callable[[Dict[str, Dict[str, Dict[str, Validation]]]], List],
+    ) -> List:
+        """
+        Get the plan of the validations, planning them on a miss
+        :param plan_key: key of the validations, the plan is not cached if None
+        :param validations: validations in the ValidationManager format
+        :param plan: function that plans the validations
+        :return: plan of the validations
+        """
+        if plan_key is None:
+            return plan(validations)
+        key = (plan_key, self._cached_validation_ids(validations))
+        with self._lock:
+            if key in self._plans:
+                self._plans.move_to_end(key)
+                return self._plans[key]
+        planned = plan(validations)
+        with self._lock:
+            self._plans[key] = planned
+            while len(self._plans) > self.MAX_PLANS:
+                self._plans.popitem(last=False)
+        return planned
+
+
+@dataclass
+class FusedQuery:
+    """
+    A single aggregate query that computes the metrics of many validations
+    sharing the same data source, dataset and where filter.
+    """
+
+    data_source: SQLDataSource
+    dataset: str
+    where_filter: Optional[str]
+    expressions: List[str] = field(default_factory=list)
+    # validations served by the query with the positions of their aggregates
+    targets: List[Tuple[Validation, List[int]]] = field(default_factory=list)
+
+    def add(self, validation: Validation, aggregates: List[str]):
+        positions = []
+        for aggregate in aggregates:
+            if aggregate not in self.expressions:
+                self.expressions.append(aggregate)
+            positions.append(self.expressions.index(aggregate))
+        self.targets.append((validation, positions))
+
+
+class FusedQueryPlanner:
+    """
+    Plans and executes fused aggregate queries for SQL validations.
+    All the validations on the same (data source, dataset, where filter) are evaluated
+    with one SELECT that has one aggregate column per validation, so the table is
+    scanned once instead of once per validation.
+
+    Validations that can not be expressed as plain aggregates, or whose fused query fails,
+    are left untouched and generate their metric with their own query.
+    """
+
+    def __init__(self):
+        self.plan_cache = PlanCache()
+
+    def plan(
+        self, validations: Dict[str, Dict[str, Dict[str, Validation]]]
+    ) -> List[FusedQuery]:
+        """
+        Group the fusible validations into fused queries
+        :param validations: validations in the ValidationManager format
+        :return: list of fused queries
+        """
+        fused_queries: List[FusedQuery] = []
+        for datasets in validations.values():
+            for dataset, validations_by_name in datasets.items():
+                groups: Dict[Optional[str], List[FusedQuery]] = {}
+                for validation in validations_by_name.values():
+                    if not isinstance(validation.data_source, SQLDataSource):
+                        continue
+                    if validation.is_cached:
+                        continue
+                    # incremental validations only scan the rows past their watermark
+                    if validation.is_incremental:
+                        continue
+                    # approximate validations with a watermark are answered from a
+                    # stored sketch
+                    if validation.keeps_sketch:
+                        continue
+                    # sampled validations estimate their metric on their own sample
+                    if validation.is_sampled:
+                        continue
+                    aggregates = validation.fused_sql_aggregates()
+                    if not aggregates:
+                        continue
+                    queries = groups.setdefault(validation.where_filter, [])
+                    max_columns = validation.data_source.MAX_SELECT_COLUMNS
+                    if (
+                        not queries
+                        or len(queries[-1].expressions) + len(aggregates) > max_columns
+                    ):
+                        queries.append(
+                            FusedQuery(
+                                data_source=validation.data_source,
+                                dataset=dataset,
+                                where_filter=validation.where_filter,
+                            )
+                        )
+                    queries[-1].add(validation, aggregates)
+                for queries in groups.values():
+                    fused_queries.extend(queries)
+        return fused_queries
+
+    @staticmethod
+    def execute_query(fused_query: FusedQuery) -> int:
+        """
+        Execute a fused query and give the aggregate values back to its validations
+        :return: number of validations served by the query
+        """
+        try:
+            with trace(
+                SpanKind.DATASET,
+                "fused_query",
+                data_source=fused_query.data_source.data_source_name,
+                dataset=fused_query.dataset,
+                filter=fused_query.where_filter,
+                validations=len(fused_query.targets),
+            ), record_queries() as queries:
+                row = fused_query.data_source.query_aggregates(
+                    fused_query.dataset,
+                    fused_query.expressions,
+                    fused_query.where_filter,
+                )
+        except Exception as e:
+            logger.warning(
+                f"Fused query on {fused_query.dataset} failed, validations will run "
+                f"their own queries: {str(e)}"
+            )
+            return 0
+        if "COUNT(*)" in fused_query.expressions:
+            fused_query.data_source.cache_row_count(
+                fused_query.dataset,
+                fused_query.where_filter,
+                row[fused_query.expressions.index("COUNT(*)")],
+            )
+        for validation, positions in fused_query.targets:
+            validation.set_fused_aggregate_values(
+                tuple(row[position] for position in positions)
+            )
+        share_queries(queries, [validation for validation, _ in fused_query.targets])
+        return len(fused_query.targets)
+
+    def execute(
+        self,
+        validations: Dict[str, Dict[str, Dict[str, Validation]]],
+        executor: Optional[ValidationExecutor] = None,
+        plan_key: Optional[str] = None,
+    ) -> int:
+        """
+        Plan and execute fused queries for the validations
+        :param validations: validations in the ValidationManager format
+        :param executor: executor to run the fused queries concurrently, sequential if None
+        :param plan_key: key to reuse the plan of an earlier run with, see PlanCache
+        :return: number of validations served by fused queries
+        """
+        # a single validation gains nothing from fusion, let it run its own query
+        fused_queries = [
+            fused_query
+            for fused_query in self.plan_cache.get(plan_key, validations, self.plan)
+            if len(fused_query.targets) > 1
+        ]
+        if executor is None:
+            return sum(self.execute_query(query) for query in fused_queries)
+        return sum(
+            executor.run(
+                [
+                    (
+                        fused_query.data_source.data_source_name,
+                        partial(self.execute_query, fused_query),
+                    )
+                    for fused_query in fused_queries
+                ]
+            )
+        )
+
+
+@dataclass
+class SearchRequestBatch:
+    """
+    The search requests of the validations on a single search data source
+    """
+
+    data_source: SearchIndexDataSource
+    targets: List[Tuple[Validation, SearchRequest]] = field(default_factory=list)
+
+
+class SearchRequestBatcher:
+    """
+    Batches the search requests of search index validations.
+    The requests of all the validations on a data source are sent with _msearch, so a run
+    makes a few round trips per data source instead of one per validation.
+
+    Validations without a search request, or whose batched search fails, are left untouched
+    and generate their metric with their own request.
+    """
+
+    def __init__(self):
+        self.plan_cache = PlanCache()
+
+    def plan(
+        self, validations: Dict[str, Dict[str, Dict[str, Validation]]]
+    ) -> List[SearchRequestBatch]:
+        """
+        Group the search requests of the validations by data source
+        :param validations: validations in the ValidationManager format
+        :return: list of search request batches
+        """
+        batches: Dict[str, SearchRequestBatch] = {}
+        for datasets in validations.values():
+            for validations_by_name in datasets.values():
+                for validation in validations_by_name.values():
+                    if not isinstance(validation.data_source, SearchIndexDataSource):
+                        continue
+                    if validation.is_cached:
+                        continue
+                    request = validation.search_request()
+                    if request is None:
+                        continue
+                    batch = batches.setdefault(
+                        validation.data_source.data_source_name,
+                        SearchRequestBatch(data_source=validation.data_source),
+                    )
+                    batch.targets.append((validation, request))
+        return list(batches.values())
+
+    @staticmethod
+    def execute_batch(batch: SearchRequestBatch) -> int:
+        """
+        Execute a batch of search requests and give the metric values back to its validations
+        :return: number of validations served by the batch
+        """
+        try:
+            with trace(
+                SpanKind.DATA_SOURCE,
+                "search_batch",
+                data_source=batch.data_source.data_source_name,
+                validations=len(batch.targets),
+            ), record_queries() as queries:
+                responses = batch.data_source.execute_search_requests(
+                    [request for _, request in batch.targets]
+                )
+        except Exception as e:
+            logger.warning(
+                f"Batched search on {batch.data_source.data_source_name} failed, "
+                f"validations will run their own requests: {str(e)}"
+            )
+            return 0
+        return SearchRequestBatcher.serve_responses(batch, responses, queries)
+
+    @staticmethod
+    async def execute_batch_async(
+        batch: SearchRequestBatch, max_concurrency: int = 1
+    ) -> int:
+        """
+        Execute a batch of search requests on the asyncio client of its data source,
+        or on the synchronous client in a worker thread if it has none
+        :return: number of validations served by the batch
+        """
+        if batch.data_source.async_client is None:
+            return await asyncio.to_thread(SearchRequestBatcher.execute_batch, batch)
+        try:
+            with trace(
+                SpanKind.DATA_SOURCE,
+                "search_batch",
+                data_source=batch.data_source.data_source_name,
+                validations=len(batch.targets),
+            ), record_queries() as queries:
+                responses = await batch.data_source.execute_search_requests_async(
+                    [request for _, request in batch.targets], max_concurrency
+                )
+        except Exception as e:
+            logger.warning(
+                f"Batched search on {batch.data_source.data_source_name} failed, "
+                f"validations will run their own requests: {str(e)}"
+            )
+            return 0
+        return SearchRequestBatcher.serve_responses(batch, responses, queries)
+
+    @staticmethod
+    def serve_responses(
+        batch: SearchRequestBatch,
+        responses: List[Optional[Dict]],
+        queries: Optional[List[QueryStatistics]] = None,
+    ) -> int:
+        """
+        Give the metric values of the responses back to the validations of the batch
+        :param queries: statistics of the searches of the batch, shared by the served validations
+        :return: number of validations served by the batch
+        """
+        served_validations: List[Validation] = []
+        for (validation, request), response in zip(batch.targets, responses):
+            if response is None:
+                continue
+            try:
+                validation.set_prefetched_metric_value(request.extract(response))
+            except Exception:
+                continue
+            served_validations.append(validation)
+        share_queries(queries or [], served_validations)
+        return len(served_validations)
+
+    def execute(
+        self,
+        validations: Dict[str, Dict[str, Dict[str, Validation]]],
+        executor: Optional[ValidationExecutor] = None,
+        plan_key: Optional[str] = None,
+    ) -> int:
+        """
+        Plan and execute the batched search requests for the validations
+        :param validations: validations in the ValidationManager format
+        :param executor: executor to run the batches concurrently, sequential if None
+        :param plan_key: key to reuse the plan of an earlier run with, see PlanCache
+        :return: number of validations served by batched requests
+        """
+        # a single request gains nothing from batching, let it run on its own
+        batches = [
+            batch
+            for batch in self.plan_cache.get(plan_key, validations, self.plan)
+            if len(batch.targets) > 1
+        ]
+        if executor is None:
+            return sum(self.execute_batch(batch) for batch in batches)
+        return sum(
+            executor.run(
+                [
+                    (
+                        batch.data_source.data_source_name,
+                        partial(self.execute_batch, batch),
+                    )
+                    for batch in batches
+                ]
+            )
+        )
+
+    async def execute_async(
+        self,
+        validations: Dict[str, Dict[str, Dict[str, Validation]]],
+        executor: Optional[ValidationExecutor] = None,
+        plan_key: Optional[str] = None,
+    ) -> int:
+        """
+        Plan and execute the batched search requests for the validations on one event loop.
+        The batches of all the data sources are awaited concurrently.
+        :param validations: validations in the ValidationManager format
+        :param executor: executor giving the maximum concurrency of every data source
+        :param plan_key: key to reuse the plan of an earlier run with, see PlanCache
+        :return: number of validations served by batched requests
+        """
+        # unlike threads, an awaited request is cheap, so single requests are batched too
+        results = await asyncio.gather(
+            *(
+                self.execute_batch_async(
+                    batch,
+                    executor.get_max_concurrency(batch.data_source.data_source_name)
+                    if executor is not None
+                    else 1,
+                )
+                for batch in self.plan_cache.get(plan_key, validations, self.plan)
+            )
+        )
+        return sum(results)
@@ -11,7 +11,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from typing import List, Optional
+
+from dcs_core.core.datasource.search_datasource import (
+    SearchIndexDataSource,
+    SearchRequest,
+)
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.validation.base import Validation
 
@@ -30,6 +35,12 @@ class CountDocumentsValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_document_count(
+            index_name=self.dataset_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
 
 class CountRowValidation(Validation):
 
@@ -46,6 +57,9 @@ class CountRowValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return ["COUNT(*)"]
+
 
 class FreshnessValueMetric(Validation):
     """
@@ -0,0 +1,166 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+from typing import Optional, Type, Union
+
+from dcs_core.core.utils.sketches import HyperLogLog, TDigest
+from dcs_core.core.validation.base import Validation, _sql_literal, _state_value
+
+# Number of distinct values fetched per batch while building a sketch
+SKETCH_BATCH_SIZE = 10000
+
+Sketch = Union[HyperLogLog, TDigest]
+
+
+def _sketch_state_id(validation: Validation, sketch_class: Type[Sketch]) -> str:
+    identifiers = [
+        validation.data_source.data_source_name,
+        validation.dataset_name,
+        validation.field_name,
+        sketch_class.NAME,
+    ]
+    if validation.where_filter:
+        identifiers.append(
+            hashlib.md5(validation.where_filter.encode()).hexdigest()[:12]
+        )
+    return ".".join(identifiers)
+
+
+def get_column_sketch(validation: Validation, sketch_class: Type[Sketch]) -> Sketch:
+    """
+    Get the sketch of the validation field, persisted between runs and shared by all
+    the validations on the same (dataset, field, filter) within a run.
+    Only the rows past the stored watermark are read, grouped by value in the database,
+    and merged into the stored sketch. The first run reads the whole table. As for
+    incremental validations, the watermark must strictly increase.
+    :param validation: approximate validation that keeps a sketch
+    :param sketch_class: HyperLogLog or TDigest
+    :return: sketch
+    """
+    data_source = validation.data_source
+    state_id = _sketch_state_id(validation, sketch_class)
+    cache_key = (state_id, validation.watermark)
+    with data_source.sketch_lock(cache_key):
+        sketch = data_source.cached_sketch(cache_key)
+        if sketch is not None:
+            return sketch
+
+        state = validation.state_repository.get_state(state_id)
+        if state is not None and state.get("watermark_column") != validation.watermark:
+            state = None
+        sketch = (
+            sketch_class.from_dict(state["sketch"])
+            if state is not None
+            else sketch_class()
+        )
+
+        filters = [f"({validation.where_filter})"] if validation.where_filter else []
+        if state is not None:
+            filters.append(
+                f"{validation.watermark} > {_sql_literal(state['watermark'])}"
+            )
+        field = validation.field_name
+        query = (
+            f"SELECT {field}, COUNT(*), MAX({validation.watermark}) "
+            f"FROM {data_source.qualified_table_name(validation.dataset_name)}"
+        )
+        if filters:
+            query += f" WHERE {' AND '.join(filters)}"
+        query += f" GROUP BY {field}"
+
+        watermark = state["watermark"] if state is not None else None
+        for rows in data_source.fetch_batches(query, SKETCH_BATCH_SIZE):
+            if sketch_class is TDigest:
+                sketch.add((row[0] for row in rows), (row[1] for row in rows))
+            else:
+                sketch.add(row[0] for row in rows)
+            batch_watermark = max(
+                (row[2] for row in rows if row[2] is not None), default=None
+            )
+            if batch_watermark is not None:
+                batch_watermark = _state_value(batch_watermark)
+                watermark = (
+                    batch_watermark
+                    if watermark is None
+                    else max(watermark, batch_watermark)
+                )
+
+        if watermark is not None:
+            validation.state_repository.save_state(
+                state_id,
+                {
+                    "watermark_column": validation.watermark,
+                    "watermark": watermark,
+                    "sketch": sketch.to_dict(),
+                },
+            )
+        data_source.cache_sketch(cache_key, sketch)
+        return sketch
+
+
+def get_approximate_percentile(
+    validation: Validation, percentile: float
+) -> Optional[float]:
+    """
+    Get the approximate percentile of the validation field, from its stored t-digest or
+    the approximate percentile aggregate of the database. Dialects without one fall back
+    to the exact percentile query.
+    :param validation: approximate validation on a SQL data source
+    :param percentile: percentile between 0 and 1
+    :return: percentile value
+    """
+    if validation.keeps_sketch:
+        value = get_column_sketch(validation, TDigest).quantile(percentile)
+        return round(value, 2) if value is not None else None
+
+    data_source = validation.data_source
+    aggregate = data_source.approximate_percentile_aggregate(
+        validation.field_name, percentile
+    )
+    if aggregate is None:
+        return data_source.query_get_percentile(
+            table=validation.dataset_name,
+            field=validation.field_name,
+            percentile=percentile,
+            filters=validation.where_filter,
+        )
+    value = data_source.query_aggregates(
+        validation.dataset_name, [aggregate], validation.where_filter
+    )[0]
+    return round(value, 2) if value is not None else None
+
+
+def get_approximate_distinct_count(validation: Validation) -> int:
+    """
+    Get the approximate distinct count of the validation field, from its stored
+    HyperLogLog or the approximate distinct count aggregate of the database. Dialects
+    without one fall back to the exact distinct count query.
+    :param validation: approximate validation on a SQL data source
+    :return: distinct count
+    """
+    if validation.keeps_sketch:
+        return get_column_sketch(validation, HyperLogLog).count()
+
+    data_source = validation.data_source
+    aggregate = data_source.approximate_distinct_count_aggregate(validation.field_name)
+    if aggregate is None:
+        return data_source.query_get_distinct_count(
+            table=validation.dataset_name,
+            field=validation.field_name,
+            filters=validation.where_filter,
+        )
+    return data_source.query_aggregates(
+        validation.dataset_name, [aggregate], validation.where_filter
+    )[0]
@@ -12,11 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Union
+from typing import List, Optional, Union
 
-from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from dcs_core.core.datasource.search_datasource import (
+    SearchIndexDataSource,
+    SearchRequest,
+)
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.sketch import get_approximate_distinct_count
 
 
 class CountDuplicateValidation(Validation):
@@ -40,6 +44,8 @@ class CountDuplicateValidation(Validation):
 class CountDistinctValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
+            if self.approximate:
+                return get_approximate_distinct_count(self)
             return self.data_source.query_get_distinct_count(
                 table=self.dataset_name,
                 field=self.field_name,
@@ -53,3 +59,19 @@ class CountDistinctValidation(Validation):
             )
         else:
             raise ValueError("Invalid data source type")
+
+    def search_request(self) -> Optional[SearchRequest]:
+        return self.data_source.request_get_distinct_count(
+            index_name=self.dataset_name,
+            field=self.field_name,
+            filters=self.where_filter if self.where_filter else None,
+        )
+
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.approximate:
+            aggregate = self.data_source.approximate_distinct_count_aggregate(
+                self.field_name
+            )
+            if aggregate is not None:
+                return [aggregate]
+        return [f"COUNT(DISTINCT {self.field_name})"]
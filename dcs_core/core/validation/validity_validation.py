@@ -12,13 +12,44 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Union
+from typing import List, Optional, Tuple, Union
 
 from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.validation.base import Validation
 
 
+def _predefined_regex_condition(validation: Validation, pattern_name: str) -> str:
+    return validation.data_source.regex_match_condition(
+        validation.field_name, SQLDataSource.PREDEFINED_REGEX_PATTERNS[pattern_name]
+    )
+
+
+def _regex_condition(validation: Validation) -> str:
+    return validation.data_source.regex_match_condition(
+        validation.field_name, validation.regex_pattern
+    )
+
+
+def _values_condition(validation: Validation) -> str:
+    values_str = ", ".join([f"'{value}'" for value in validation.values])
+    return f"{validation.field_name} IN ({values_str})"
+
+
+def _usa_state_code_condition(validation: Validation) -> str:
+    regex_condition = validation.data_source.regex_match_condition(
+        validation.field_name, "^[A-Z]{2}$"
+    )
+    return f"{regex_condition} AND {validation.field_name} IN ({SQLDataSource.USA_STATE_CODES_SQL})"
+
+
+def _range_condition(validation: Validation, lower: int, upper: int) -> str:
+    return (
+        f"{validation.field_name} IS NOT NULL"
+        f" AND {validation.field_name} BETWEEN {lower} AND {upper}"
+    )
+
+
 class CountUUIDValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
@@ -34,6 +65,11 @@ class CountUUIDValidation(Validation):
                 "UUID validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'uuid')} THEN 1 END)"
+        ]
+
 
 class PercentUUIDValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -50,6 +86,16 @@ class PercentUUIDValidation(Validation):
                 "UUID validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'uuid')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountInvalidValues(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -71,6 +117,11 @@ class CountInvalidValues(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.values is None:
+            return None
+        return [f"COUNT(CASE WHEN {_values_condition(self)} THEN 1 END)"]
+
 
 class PercentInvalidValues(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -94,6 +145,15 @@ class PercentInvalidValues(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.values is None:
+            return None
+        return [f"COUNT(CASE WHEN {_values_condition(self)} THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        invalid_count, total_count = values
+        return round(invalid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountValidValues(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -115,6 +175,11 @@ class CountValidValues(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.values is None:
+            return None
+        return [f"COUNT(CASE WHEN {_values_condition(self)} THEN 1 END)"]
+
 
 class PercentValidValues(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -136,6 +201,15 @@ class PercentValidValues(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.values is None:
+            return None
+        return [f"COUNT(CASE WHEN {_values_condition(self)} THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountInvalidRegex(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -159,6 +233,11 @@ class CountInvalidRegex(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.regex_pattern is None:
+            return None
+        return [f"COUNT(CASE WHEN {_regex_condition(self)} THEN 1 END)"]
+
 
 class PercentInvalidRegex(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -182,6 +261,15 @@ class PercentInvalidRegex(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.regex_pattern is None:
+            return None
+        return [f"COUNT(CASE WHEN {_regex_condition(self)} THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        invalid_count, total_count = values
+        return round(invalid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountValidRegex(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -205,6 +293,11 @@ class CountValidRegex(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.regex_pattern is None:
+            return None
+        return [f"COUNT(CASE WHEN {_regex_condition(self)} THEN 1 END)"]
+
 
 class PercentValidRegex(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -228,6 +321,15 @@ class PercentValidRegex(Validation):
                 "Valid/Invalid values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        if self.regex_pattern is None:
+            return None
+        return [f"COUNT(CASE WHEN {_regex_condition(self)} THEN 1 END)", "COUNT(*)"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountUSAPhoneValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -250,6 +352,11 @@ class CountUSAPhoneValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'usa_phone')} THEN 1 END)"
+        ]
+
 
 class PercentUSAPhoneValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -272,6 +379,16 @@ class PercentUSAPhoneValidation(Validation):
         else:
             raise ValueError("Invalid data source type")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'usa_phone')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountEmailValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -288,6 +405,11 @@ class CountEmailValidation(Validation):
                 "Email validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'email')} THEN 1 END)"
+        ]
+
 
 class PercentEmailValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -304,6 +426,16 @@ class PercentEmailValidation(Validation):
                 "Email validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'email')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class StringLengthMaxValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -319,6 +451,9 @@ class StringLengthMaxValidation(Validation):
                 "Unsupported data source type for StringLengthMaxValidation"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"MAX(LENGTH({self.field_name}))"]
+
 
 class StringLengthMinValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -334,6 +469,9 @@ class StringLengthMinValidation(Validation):
                 "Unsupported data source type for StringLengthMinValidation"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"MIN(LENGTH({self.field_name}))"]
+
 
 class StringLengthAverageValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -349,6 +487,12 @@ class StringLengthAverageValidation(Validation):
                 "Unsupported data source type for StringLengthAverageValidation"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"AVG(LENGTH({self.field_name}))"]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        return round(values[0], 2)
+
 
 class CountUSAZipCodeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -365,6 +509,11 @@ class CountUSAZipCodeValidation(Validation):
                 "USA Zip Code validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'usa_zip_code')} THEN 1 END)"
+        ]
+
 
 class PercentUSAZipCodeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -381,6 +530,16 @@ class PercentUSAZipCodeValidation(Validation):
                 "USA Zip Code validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'usa_zip_code')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountUSAStateCodeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -399,6 +558,9 @@ class CountUSAStateCodeValidation(Validation):
                 "USA State Code validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {_usa_state_code_condition(self)} THEN 1 END)"]
+
 
 class PercentUSAStateCodeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -417,6 +579,16 @@ class PercentUSAStateCodeValidation(Validation):
                 "USA State Code validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_usa_state_code_condition(self)} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountLatitudeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -430,6 +602,9 @@ class CountLatitudeValidation(Validation):
         else:
             raise ValueError("Unsupported data source type for CountLatitudeValidation")
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {_range_condition(self, -90, 90)} THEN 1 END)"]
+
 
 class PercentLatitudeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -445,6 +620,16 @@ class PercentLatitudeValidation(Validation):
                 "Unsupported data source type for PercentLatitudeValidation"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_range_condition(self, -90, 90)} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountLongitudeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -460,6 +645,9 @@ class CountLongitudeValidation(Validation):
                 "Unsupported data source type for CountLongitudeValidation"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [f"COUNT(CASE WHEN {_range_condition(self, -180, 180)} THEN 1 END)"]
+
 
 class PercentLongitudeValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -475,6 +663,16 @@ class PercentLongitudeValidation(Validation):
                 "Unsupported data source type for PercentLongitudeValidation"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_range_condition(self, -180, 180)} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountSSNValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -491,6 +689,11 @@ class CountSSNValidation(Validation):
                 "SSN values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'ssn')} THEN 1 END)"
+        ]
+
 
 class PercentSSNValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -507,6 +710,16 @@ class PercentSSNValidation(Validation):
                 "SSN values validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'ssn')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountSEDOLValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -523,6 +736,11 @@ class CountSEDOLValidation(Validation):
                 "SEDOL validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'sedol')} THEN 1 END)"
+        ]
+
 
 class PercentSEDOLValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -539,6 +757,16 @@ class PercentSEDOLValidation(Validation):
                 "SEDOL validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'sedol')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountCUSIPValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -555,6 +783,11 @@ class CountCUSIPValidation(Validation):
                 "CUSIP validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'cusip')} THEN 1 END)"
+        ]
+
 
 class PercentCUSIPValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -571,6 +804,16 @@ class PercentCUSIPValidation(Validation):
                 "CUSIP validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'cusip')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountLEIValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -587,6 +830,11 @@ class CountLEIValidation(Validation):
                 "LEI validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'lei')} THEN 1 END)"
+        ]
+
 
 class PercentLEIValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -603,6 +851,16 @@ class PercentLEIValidation(Validation):
                 "LEI validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'lei')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountFIGIValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -619,6 +877,11 @@ class CountFIGIValidation(Validation):
                 "FIGI validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'figi')} THEN 1 END)"
+        ]
+
 
 class PercentFIGIValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -635,6 +898,16 @@ class PercentFIGIValidation(Validation):
                 "FIGI validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'figi')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountISINValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -651,6 +924,11 @@ class CountISINValidation(Validation):
                 "ISIN validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'isin')} THEN 1 END)"
+        ]
+
 
 class PercentISINValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -667,6 +945,16 @@ class PercentISINValidation(Validation):
                 "ISIN validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'isin')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountPermIDValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -683,6 +971,11 @@ class CountPermIDValidation(Validation):
                 "Perm ID validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'perm_id')} THEN 1 END)"
+        ]
+
 
 class PercentPermIDValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -699,6 +992,16 @@ class PercentPermIDValidation(Validation):
                 "Perm ID validation is only supported for SQL data sources"
             )
 
+    def fused_sql_aggregates(self) -> Optional[List[str]]:
+        return [
+            f"COUNT(CASE WHEN {_predefined_regex_condition(self, 'perm_id')} THEN 1 END)",
+            "COUNT(*)",
+        ]
+
+    def fused_metric_value(self, values: Tuple) -> Union[float, int]:
+        valid_count, total_count = values
+        return round(valid_count / total_count * 100, 2) if total_count > 0 else 0
+
 
 class CountTimeStampValidation(Validation):
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
@@ -12,15 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
-
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class BigQueryDataSource(SQLDataSource):
+    TEXT_CAST_TYPE = "STRING"
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
         self.project_id = self.data_connection.get("project")
@@ -34,9 +34,11 @@ class BigQueryDataSource(SQLDataSource):
             credentials_base64 = self.data_connection.get("credentials_base64")
 
             url = f"bigquery://{self.project_id}/{self.dataset_id}"
-            engine = create_engine(url, credentials_base64=credentials_base64)
-            self.connection = engine.connect()
-            return self.connection
+            engine = self.create_pooled_engine(
+                url, credentials_base64=credentials_base64
+            )
+            self.check_connection()
+            return engine
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to BigQuery data source: [{str(e)}]"
@@ -49,3 +51,24 @@ class BigQueryDataSource(SQLDataSource):
         :return: qualified table name
         """
         return f"`{self.project_id}`.{self.dataset_id}.{table_name}"
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        # TABLESAMPLE samples whole blocks, RAND() draws a random number per row
+        return (
+            f"(SELECT * FROM {self.qualified_table_name(table_name)} "
+            f"WHERE RAND() < {percentage / 100}) sampled_rows"
+        )
+
+    def approximate_distinct_count_aggregate(self, field: str) -> Optional[str]:
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def approximate_percentile_aggregate(
+        self, field: str, percentile: float
+    ) -> Optional[str]:
+        return f"APPROX_QUANTILES({field}, 100)[OFFSET({round(percentile * 100)})]"
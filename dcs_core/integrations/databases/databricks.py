@@ -12,9 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -22,6 +21,8 @@ from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class DatabricksDataSource(SQLDataSource):
+    TEXT_CAST_TYPE = "STRING"
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
@@ -42,10 +43,27 @@ class DatabricksDataSource(SQLDataSource):
                     "catalog": self.data_connection.get("catalog"),
                 },
             )
-            engine = create_engine(url, echo=True)
-            self.connection = engine.connect()
-            return self.connection
+            engine = self.create_pooled_engine(url, echo=True)
+            self.check_connection()
+            return engine
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to Databricks data source: [{str(e)}]"
             )
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        return f"{self.qualified_table_name(table_name)} TABLESAMPLE ({percentage} PERCENT)"
+
+    def approximate_distinct_count_aggregate(self, field: str) -> Optional[str]:
+        return f"approx_count_distinct({field})"
+
+    def approximate_percentile_aggregate(
+        self, field: str, percentile: float
+    ) -> Optional[str]:
+        return f"percentile_approx({field}, {percentile})"
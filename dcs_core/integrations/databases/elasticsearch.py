@@ -11,9 +11,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Dict
+from typing import Any, Dict
 
 from elasticsearch import Elasticsearch
+from loguru import logger
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
 from dcs_core.core.datasource import SearchIndexDataSource
@@ -27,23 +28,37 @@ class ElasticSearchDataSource(SearchIndexDataSource):
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
+    def _client_options(self) -> Dict:
+        auth = None
+        if self.data_connection.get("username") is not None:
+            auth = (
+                self.data_connection.get("username"),
+                self.data_connection.get("password"),
+            )
+        host = self.data_connection.get("host")
+        port = int(self.data_connection.get("port"))
+        return {"hosts": [{"host": host, "port": port}], "http_auth": auth}
+
+    def create_async_client(self) -> Any:
+        """
+        Create the asyncio client, it needs the aiohttp package
+        """
+        try:
+            from elasticsearch import AsyncElasticsearch
+        except ImportError:
+            logger.warning(
+                "ElasticSearch asyncio client is not available, install "
+                '"elasticsearch[async]". Requests will run on the synchronous client'
+            )
+            return None
+        return AsyncElasticsearch(**self._client_options())
+
     def connect(self) -> Elasticsearch:
         """
         Connect to the data source
         """
         try:
-            auth = None
-            if self.data_connection.get("username") is not None:
-                auth = (
-                    self.data_connection.get("username"),
-                    self.data_connection.get("password"),
-                )
-
-            host = self.data_connection.get("host")
-            port = int(self.data_connection.get("port"))
-            self.client = Elasticsearch(
-                hosts=[{"host": host, "port": port}], http_auth=auth
-            )
+            self.client = Elasticsearch(**self._client_options())
             if not self.client.ping():
                 raise Exception("Failed to connect to ElasticSearch data source")
             return self.client
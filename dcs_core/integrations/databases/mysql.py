@@ -12,9 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -22,6 +21,9 @@ from dcs_core.core.datasource.sql_datasource import SQLDataSource
 
 
 class MysqlDataSource(SQLDataSource):
+    TEXT_CAST_TYPE = "CHAR"
+    SUPPORTS_GROUPING_SETS = False
+
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
@@ -38,13 +40,35 @@ class MysqlDataSource(SQLDataSource):
                 port=self.data_connection.get("port"),
                 database=self.data_connection.get("database"),
             )
-            engine = create_engine(
+            engine = self.create_pooled_engine(
                 url,
                 isolation_level="AUTOCOMMIT",
             )
-            self.connection = engine.connect()
-            return self.connection
+            self.check_connection()
+            return engine
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to Mysql data source: [{str(e)}]"
             )
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        return (
+            f"(SELECT * FROM {self.qualified_table_name(table_name)} "
+            f"WHERE RAND() < {percentage / 100}) sampled_rows"
+        )
+
+    def _load_column_metadata(
+        self, table_names: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Load the column metadata of the tables from information_schema with a single query
+        """
+        return self.query_get_information_schema_column_metadata(
+            "table_schema = DATABASE()", table_names
+        )
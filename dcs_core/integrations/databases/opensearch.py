@@ -11,8 +11,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Dict
+from typing import Any, Dict
 
+from loguru import logger
 from opensearchpy import OpenSearch
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -27,24 +28,41 @@ class OpenSearchDataSource(SearchIndexDataSource):
     def __init__(self, data_source_name: str, data_connection: Dict):
         super().__init__(data_source_name, data_connection)
 
+    def _client_options(self) -> Dict:
+        auth = (
+            self.data_connection.get("username"),
+            self.data_connection.get("password"),
+        )
+        host = self.data_connection.get("host")
+        port = int(self.data_connection.get("port"))
+        return {
+            "hosts": [{"host": host, "port": port}],
+            "http_auth": auth,
+            "use_ssl": True,
+            "verify_certs": False,
+            "ca_certs": False,
+        }
+
+    def create_async_client(self) -> Any:
+        """
+        Create the asyncio client, it needs the aiohttp package
+        """
+        try:
+            from opensearchpy import AsyncOpenSearch
+        except ImportError:
+            logger.warning(
+                "OpenSearch asyncio client is not available, install "
+                '"opensearch-py[async]". Requests will run on the synchronous client'
+            )
+            return None
+        return AsyncOpenSearch(**self._client_options())
+
     def connect(self) -> OpenSearch:
         """
         Connect to the data source
         """
         try:
-            auth = (
-                self.data_connection.get("username"),
-                self.data_connection.get("password"),
-            )
-            host = self.data_connection.get("host")
-            port = int(self.data_connection.get("port"))
-            self.client = OpenSearch(
-                hosts=[{"host": host, "port": port}],
-                http_auth=auth,
-                use_ssl=True,
-                verify_certs=False,
-                ca_certs=False,
-            )
+            self.client = OpenSearch(**self._client_options())
             if not self.client.ping():
                 raise Exception("Failed to connect to OpenSearch data source")
             return self.client
@@ -12,9 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -30,7 +29,7 @@ class OracleDataSource(SQLDataSource):
         Connect to the data source
         """
         try:
-            engine = create_engine(
+            engine = self.create_pooled_engine(
                 f"oracle+oracledb://:@",
                 thick_mode=False,
                 connect_args={
@@ -41,9 +40,26 @@ class OracleDataSource(SQLDataSource):
                     "service_name": self.data_connection.get("service_name"),
                 },
             )
-            self.connection = engine.connect()
-            return self.connection
+            self.check_connection()
+            return engine
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to Oracle data source: [{str(e)}]"
             )
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        return f"{self.qualified_table_name(table_name)} SAMPLE ({percentage})"
+
+    def approximate_distinct_count_aggregate(self, field: str) -> Optional[str]:
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def approximate_percentile_aggregate(
+        self, field: str, percentile: float
+    ) -> Optional[str]:
+        return f"APPROX_PERCENTILE({percentile}) WITHIN GROUP (ORDER BY {field})"
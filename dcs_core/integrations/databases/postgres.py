@@ -14,7 +14,6 @@
 
 from typing import Any, Dict
 
-from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -39,13 +38,13 @@ class PostgresDataSource(SQLDataSource):
                 database=self.data_connection.get("database"),
             )
             schema = self.data_connection.get("schema") or "public"
-            engine = create_engine(
+            engine = self.create_pooled_engine(
                 url,
                 connect_args={"options": f"-csearch_path={schema}"},
                 isolation_level="AUTOCOMMIT",
             )
-            self.connection = engine.connect()
-            return self.connection
+            self.check_connection()
+            return engine
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to PostgresSQL data source: [{str(e)}]"
@@ -12,9 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
@@ -39,15 +38,47 @@ class RedShiftDataSource(SQLDataSource):
                 database=self.data_connection.get("database"),
             )
             schema = self.data_connection.get("schema")
-            engine = create_engine(
+            engine = self.create_pooled_engine(
                 url,
                 connect_args={"options": f"-csearch_path={schema}"} if schema else None,
                 isolation_level="AUTOCOMMIT",
             )
 
-            self.connection = engine.connect()
-            return self.connection
+            self.check_connection()
+            return engine
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to AWS RedShift data source: [{str(e)}]"
             )
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        return (
+            f"(SELECT * FROM {self.qualified_table_name(table_name)} "
+            f"WHERE RANDOM() < {percentage / 100}) sampled_rows"
+        )
+
+    def approximate_distinct_count_aggregate(self, field: str) -> Optional[str]:
+        return f"APPROXIMATE COUNT(DISTINCT {field})"
+
+    def approximate_percentile_aggregate(
+        self, field: str, percentile: float
+    ) -> Optional[str]:
+        return (
+            f"APPROXIMATE PERCENTILE_DISC({percentile}) WITHIN GROUP (ORDER BY {field})"
+        )
+
+    def _load_column_metadata(
+        self, table_names: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Load the column metadata of the tables from information_schema with a single query
+        """
+        return self.query_get_information_schema_column_metadata(
+            "table_schema = current_schema()", table_names
+        )
@@ -12,10 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import urllib.parse
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from snowflake.sqlalchemy import URL
-from sqlalchemy import create_engine
 
 from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
@@ -39,10 +38,52 @@ class SnowFlakeDataSource(SQLDataSource):
                 warehouse=self.data_connection.get("warehouse"),
                 role=self.data_connection.get("role"),
             )
-            engine = create_engine(url)
-            self.connection = engine.connect()
-            return self.connection
+            engine = self.create_pooled_engine(url)
+            self.check_connection()
+            return engine
         except Exception as e:
             raise DataChecksDataSourcesConnectionError(
                 message=f"Failed to connect to Snowflake data source: [{str(e)}]"
             )
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        # row sampling, block sampling would violate the independence of the rows that
+        # the confidence interval assumes
+        return f"{self.qualified_table_name(table_name)} SAMPLE ROW ({percentage})"
+
+    def approximate_distinct_count_aggregate(self, field: str) -> Optional[str]:
+        return f"APPROX_COUNT_DISTINCT({field})"
+
+    def approximate_percentile_aggregate(
+        self, field: str, percentile: float
+    ) -> Optional[str]:
+        return f"APPROX_PERCENTILE({field}, {percentile})"
+
+    def query_get_table_fingerprint(
+        self, table: str, updated_column: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get a fingerprint of the table from LAST_ALTERED of the information schema,
+        without scanning the table
+        :param table: name of the table
+        :param updated_column: column that holds the last update time of a row
+        :return: table fingerprint
+        """
+        if updated_column is not None:
+            return super().query_get_table_fingerprint(table, updated_column)
+        schema = self.data_connection.get("schema")
+        row = self.fetchone(
+            "SELECT LAST_ALTERED, ROW_COUNT FROM information_schema.tables "
+            "WHERE table_schema = "
+            + (f"UPPER('{schema}')" if schema else "CURRENT_SCHEMA()")
+            + f" AND table_name = UPPER('{table}')"
+        )
+        if row is None:
+            return super().query_get_table_fingerprint(table)
+        return f"{row[1]}:{row[0]}"
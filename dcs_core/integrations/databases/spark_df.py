@@ -11,13 +11,19 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any, List, Union
+import time
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
+from loguru import logger
 from pyspark.sql import DataFrame
+from pyspark.sql import functions as F
 from pyspark.sql.session import SparkSession
 from pyspark.sql.types import Row
 
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.utils.instrumentation import record_query
+from dcs_core.core.utils.tracing import SpanKind, trace
 
 
 class SparkDfCursor:
@@ -27,11 +33,13 @@ class SparkDfCursor:
         self.description: Union[tuple[tuple], None] = None
         self.rowcount: int = -1
         self.cursor_index: int = -1
+        self.row_iterator: Union[Iterator[Row], None] = None
 
     def execute(self, sql: str):
         self.df = self.spark_session.sql(sqlQuery=sql)
         self.description = self.convert_spark_df_schema_to_dbapi_description(self.df)
         self.cursor_index = 0
+        self.row_iterator = None
 
     def fetchall(self) -> tuple[List, ...]:
         rows = []
@@ -43,19 +51,21 @@ class SparkDfCursor:
         return tuple(rows)
 
     def fetchmany(self, size: int) -> tuple[List, ...]:
+        # the rows are pulled one partition at a time by a single job, instead of a
+        # count and a limit/offset job per page
+        if self.row_iterator is None:
+            self.row_iterator = self.df.toLocalIterator()
         rows = []
-        self.rowcount = self.df.count()
-        spark_rows: list[Row] = self.df.limit(size).offset(self.cursor_index).collect()
-        self.cursor_index += len(spark_rows)
-        for spark_row in spark_rows:
+        for spark_row in islice(self.row_iterator, size):
             row = self.convert_spark_row_to_dbapi_row(spark_row)
             rows.append(row)
+        self.cursor_index += len(rows)
         return tuple(rows)
 
-    def fetchone(self) -> tuple:
-        spark_rows: list[Row] = self.df.collect()
-        self.rowcount = len(spark_rows)
-        spark_row = spark_rows[0]
+    def fetchone(self) -> Union[tuple, None]:
+        spark_row: Union[Row, None] = self.df.first()
+        if spark_row is None:
+            return None
         row = self.convert_spark_row_to_dbapi_row(spark_row)
         return tuple(row)
 
@@ -91,10 +101,15 @@ class SparkDfConnection:
 
 
 class SparkDFDataSource(SQLDataSource):
+    TEXT_CAST_TYPE = "STRING"
+
     def __init__(self, data_source_name: str, data_connection: dict):
         super().__init__(data_source_name, data_connection)
         self.spark_session = data_connection.get("spark_session")
         self.use_sa_text_query = False
+        # cache the queried tables for the duration of a run
+        self.persist = bool(data_connection.get("persist"))
+        self._persisted_tables: Optional[set] = None
 
     def connect(self):
         self.connection = SparkDfConnection(self.spark_session)
@@ -102,12 +117,128 @@ class SparkDFDataSource(SQLDataSource):
     def close(self):
         pass
 
+    def start_run(self, datasets: Iterable[str] = ()):
+        """
+        With persist, cache the tables queried in the run, so the first job scans the
+        source files and fills the cache and all the later jobs on a table read from
+        memory. Tables that are already cached are left as they are.
+        """
+        super().start_run(datasets)
+        self._persisted_tables = set()
+        if not self.persist:
+            return
+        for table_name in datasets:
+            try:
+                if self.spark_session.catalog.isCached(table_name):
+                    continue
+                self.spark_session.catalog.cacheTable(table_name)
+                self._persisted_tables.add(table_name)
+            except Exception as e:
+                logger.warning(f"Failed to cache table {table_name}: {str(e)}")
+
+    def end_run(self):
+        """
+        Uncache the tables cached by start_run
+        """
+        try:
+            for table_name in self._persisted_tables or ():
+                try:
+                    self.spark_session.catalog.uncacheTable(table_name)
+                except Exception as e:
+                    logger.warning(f"Failed to uncache table {table_name}: {str(e)}")
+        finally:
+            self._persisted_tables = None
+            super().end_run()
+
     def fetchone(self, query):
+        start = time.perf_counter()
         cursor = self.connection.cursor()
-        cursor.execute(query)
-        return cursor.fetchone()
+        with trace(
+            SpanKind.QUERY, "fetchone", data_source=self.data_source_name, query=query
+        ):
+            cursor.execute(query)
+            row = cursor.fetchone()
+        record_query(query, start, rows=0 if row is None else 1)
+        return row
 
     def fetchall(self, query):
+        start = time.perf_counter()
+        cursor = self.connection.cursor()
+        with trace(
+            SpanKind.QUERY, "fetchall", data_source=self.data_source_name, query=query
+        ):
+            cursor.execute(query)
+            rows = cursor.fetchall()
+        record_query(query, start, rows=len(rows))
+        return rows
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        return f"{self.qualified_table_name(table_name)} TABLESAMPLE ({percentage} PERCENT)"
+
+    def approximate_distinct_count_aggregate(self, field: str) -> Optional[str]:
+        return f"approx_count_distinct({field})"
+
+    def approximate_percentile_aggregate(
+        self, field: str, percentile: float
+    ) -> Optional[str]:
+        return f"percentile_approx({field}, {percentile})"
+
+    def fetch_batches(self, query, batch_size: int) -> Iterator[List]:
+        """
+        Stream the rows of a query in batches of batch_size rows
+        """
+        start = time.perf_counter()
+        row_count = 0
         cursor = self.connection.cursor()
-        cursor.execute(query)
-        return cursor.fetchall()
+        with trace(
+            SpanKind.QUERY,
+            "fetch_batches",
+            data_source=self.data_source_name,
+            query=query,
+        ):
+            cursor.execute(query)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                record_query(query, start, rows=row_count)
+                return
+            row_count += len(rows)
+            yield rows
+
+    def query_aggregates(
+        self, table: str, expressions: List[str], filters: Optional[str] = None
+    ) -> Tuple:
+        """
+        Compute many aggregate expressions over a table with one DataFrame.agg job
+        :param table: name of the table
+        :param expressions: Spark SQL aggregate expressions
+        :param filters: optional filter
+        :return: values of the expressions, in order
+        """
+        start = time.perf_counter()
+        query = f"SELECT {', '.join(expressions)} FROM {table}" + (
+            f" WHERE {filters}" if filters else ""
+        )
+        with trace(
+            SpanKind.QUERY,
+            "query_aggregates",
+            data_source=self.data_source_name,
+            query=query,
+        ):
+            df = self.spark_session.table(self.qualified_table_name(table))
+            if filters:
+                df = df.where(filters)
+            row = df.agg(
+                *[
+                    F.expr(expression).alias(f"agg_{index}")
+                    for index, expression in enumerate(expressions)
+                ]
+            ).first()
+        record_query(query, start, rows=1)
+        return tuple(row)
@@ -0,0 +1,247 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+
+from dcs_core.core.common.errors import DataChecksDataSourcesConnectionError
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+
+IN_MEMORY_DATABASE = ":memory:"
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def regexp(pattern: Optional[str], value: Any) -> Optional[bool]:
+    """
+    The REGEXP function of SQLite, true if the pattern matches anywhere in the value
+    like the ~ operator of Postgres
+    """
+    if pattern is None or value is None:
+        return None
+    return _compile_pattern(pattern).search(str(value)) is not None
+
+
+class _SampleVariance:
+    """
+    Aggregate of the sample variance with Welford's algorithm
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.sum_squared_deviations = 0.0
+
+    def step(self, value):
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_squared_deviations += delta * (value - self.mean)
+
+    def finalize(self) -> Optional[float]:
+        if self.count < 2:
+            return None
+        return self.sum_squared_deviations / (self.count - 1)
+
+
+class _SampleStandardDeviation(_SampleVariance):
+    def finalize(self) -> Optional[float]:
+        variance = super().finalize()
+        return None if variance is None else math.sqrt(variance)
+
+
+class SQLiteDataSource(SQLDataSource):
+    """
+    SQL data source on a SQLite database file, e.g. a local extract of a table.
+    SQLite has no regex operator and no sample variance, REGEXP, VAR_SAMP and STDDEV_SAMP
+    are registered as Python functions on every connection.
+    """
+
+    SUPPORTS_GROUPING_SETS = False
+
+    def __init__(self, data_source_name: str, data_connection: Dict):
+        super().__init__(data_source_name, data_connection)
+
+    @staticmethod
+    def _register_functions(dbapi_connection, _):
+        dbapi_connection.create_function("REGEXP", 2, regexp, deterministic=True)
+        dbapi_connection.create_aggregate("VAR_SAMP", 1, _SampleVariance)
+        dbapi_connection.create_aggregate("STDDEV_SAMP", 1, _SampleStandardDeviation)
+
+    def connect(self) -> Any:
+        """
+        Connect to the data source
+        """
+        try:
+            database = self.data_connection.get("database") or IN_MEMORY_DATABASE
+            if database == IN_MEMORY_DATABASE:
+                # every connection to :memory: opens a new database, share a single one
+                engine = self.create_pooled_engine(
+                    "sqlite://",
+                    poolclass=StaticPool,
+                    connect_args={"check_same_thread": False},
+                )
+            else:
+                engine = self.create_pooled_engine(
+                    f"sqlite:///{database}",
+                    connect_args={"check_same_thread": False},
+                )
+            event.listen(engine, "connect", self._register_functions)
+            self.check_connection()
+            return engine
+        except Exception as e:
+            raise DataChecksDataSourcesConnectionError(
+                message=f"Failed to connect to SQLite data source: [{str(e)}]"
+            )
+
+    def regex_match_condition(self, field: str, pattern: str) -> str:
+        """
+        Get the condition that matches a column against a regex pattern
+        :param field: column name
+        :param pattern: regex pattern
+        :return: regex match condition
+        """
+        return f"{field} REGEXP '{pattern}'"
+
+    def _query_valid_timestamp_count(
+        self,
+        table: str,
+        field: str,
+        operation: str,
+        predefined_regex: str,
+        filters: Optional[str],
+        condition: Optional[str] = None,
+    ) -> Tuple[int, int]:
+        """
+        Count the values that are valid ISO 8601 timestamps and match the condition.
+        The timestamp validity queries of SQLDataSource are written for Postgres. Here the
+        format is matched with REGEXP, and the calendar date is valid when SQLite's date()
+        shifted by 0 days gives it back unchanged, e.g. 2023-02-29 becomes 2023-03-01.
+        :return: count of the valid values and total count
+        """
+        if predefined_regex != "timestamp_iso":
+            raise ValueError(f"Unknown predefined regex pattern: {predefined_regex}")
+        if operation not in ("count", "percent"):
+            raise ValueError(f"Unknown operation: {operation}")
+        conditions = [
+            self.regex_match_condition(field, self.TIMESTAMP_ISO_REGEX),
+            f"date(substr({field}, 1, 10), '+0 days') = substr({field}, 1, 10)",
+        ]
+        if condition is not None:
+            conditions.append(condition)
+        if filters:
+            conditions.append(f"({filters})")
+        valid_count = self.fetchone(
+            f"SELECT COUNT(*) FROM {self.qualified_table_name(table)} "
+            f"WHERE {' AND '.join(conditions)}"
+        )[0]
+        total_count = self.query_get_row_count(table=table, filters=filters)
+        return valid_count, total_count
+
+    def query_timestamp_metric(
+        self,
+        table: str,
+        field: str,
+        operation: str,
+        predefined_regex: str,
+        filters: str = None,
+    ) -> Tuple[int, int]:
+        return self._query_valid_timestamp_count(
+            table, field, operation, predefined_regex, filters
+        )
+
+    def query_timestamp_not_in_future_metric(
+        self,
+        table: str,
+        field: str,
+        operation: str,
+        predefined_regex: str,
+        filters: str = None,
+    ) -> Tuple[int, int]:
+        return self._query_valid_timestamp_count(
+            table,
+            field,
+            operation,
+            predefined_regex,
+            filters,
+            condition=f"julianday({field}) <= julianday('now')",
+        )
+
+    def query_timestamp_date_not_in_future_metric(
+        self,
+        table: str,
+        field: str,
+        operation: str,
+        predefined_regex: str,
+        filters: str = None,
+    ) -> Tuple[int, int]:
+        return self._query_valid_timestamp_count(
+            table,
+            field,
+            operation,
+            predefined_regex,
+            filters,
+            condition=f"date(substr({field}, 1, 10)) <= date('now')",
+        )
+
+    def percentile_aggregate(self, field: str, percentile: float) -> Optional[str]:
+        # percentiles are computed with a window function, they can not be fused
+        return None
+
+    def sampled_table_name(self, table_name: str, percentage: float) -> str:
+        """
+        Get the table expression of a random sample of the table, used in the FROM clause
+        :param table_name: name of the table
+        :param percentage: percentage of the rows to sample, between 0 and 100
+        :return: sampled table expression
+        """
+        return (
+            f"(SELECT * FROM {self.qualified_table_name(table_name)} "
+            f"WHERE ABS(RANDOM()) % 1000000 < {int(percentage * 10000)}) sampled_rows"
+        )
+
+    def query_get_percentile(
+        self, table: str, field: str, percentile: float, filters: str = None
+    ) -> float:
+        """
+        Get the specified percentile value of a numeric column in a table, the first value
+        whose cumulative distribution reaches the percentile like PERCENTILE_DISC
+        :param table: table name
+        :param field: column name
+        :param percentile: percentile to calculate (e.g., 0.2 for 20th percentile)
+        :param filters: filter condition
+        :return: the value at the specified percentile
+        """
+        qualified_table_name = self.qualified_table_name(table)
+        where_clause = f"WHERE {field} IS NOT NULL"
+        if filters:
+            where_clause += f" AND ({filters})"
+        query = (
+            f"SELECT {field} FROM ("
+            f"SELECT {field}, CUME_DIST() OVER (ORDER BY {field}) AS cumulative_distribution "
+            f"FROM {qualified_table_name} {where_clause}"
+            f") ranked_values WHERE cumulative_distribution >= {percentile} "
+            f"ORDER BY {field} LIMIT 1"
+        )
+        row = self.fetchone(query)
+        return None if row is None else round(row[0], 2)
@@ -13,15 +13,26 @@
 #  limitations under the License.
 
 import datetime as dt
+import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Literal, Tuple, Union
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+from loguru import logger
 
 from dcs_core.core.common.errors import DataChecksRuntimeError
 from dcs_core.core.common.models.metric import MetricValue
 from dcs_core.core.repository.metric_repository import MetricRepository
-from dcs_core.core.utils.utils import ensure_directory_exists, write_to_file
+from dcs_core.core.repository.validation_state_repository import (
+    ValidationStateRepository,
+)
+from dcs_core.core.utils.utils import (
+    EnhancedJSONEncoder,
+    ensure_directory_exists,
+    write_to_file,
+    write_to_file_atomically,
+)
 
 
 class LocalFileMetricRepository(MetricRepository):
@@ -162,3 +173,48 @@ class LocalFileMetricRepository(MetricRepository):
             metrics[metric_id] = (daily_metrics, hourly_metrics)
 
         return metrics
+
+
+class LocalFileValidationStateRepository(ValidationStateRepository):
+    """
+    Directory Structure:
+
+    Dir:validation_states
+    - file:validation_identifier.json
+    """
+
+    def __init__(self, storage_path):
+        self.storage_path = f"{storage_path}/validation_states"
+        try:
+            ensure_directory_exists(self.storage_path, create_if_not_exists=True)
+        except Exception as e:
+            raise DataChecksRuntimeError(
+                f"Unable to locate validation state storage directory: {self.storage_path} due to error: {e}"
+            )
+
+    def _state_file_name(self, validation_id: str) -> str:
+        return f"{self.storage_path}/{validation_id.replace(os.sep, '_')}.json"
+
+    def get_state(self, validation_id: str) -> Optional[Dict]:
+        file_path = self._state_file_name(validation_id)
+        if not Path(file_path).exists():
+            return None
+        try:
+            with open(file_path, "r") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError) as e:
+            # an unreadable state is recomputed from a full scan
+            logger.warning(f"Ignoring invalid validation state {file_path}: {e}")
+            return None
+
+    def save_state(self, validation_id: str, state: Dict) -> int:
+        try:
+            write_to_file_atomically(
+                self._state_file_name(validation_id),
+                json.dumps(state, cls=EnhancedJSONEncoder),
+            )
+            return 1
+        except Exception as e:
+            raise DataChecksRuntimeError(
+                f"Unable to save state of validation: {validation_id} due to error: {e}"
+            )
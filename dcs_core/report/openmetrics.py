@@ -0,0 +1,347 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from dcs_core.core.common.models.validation import ValidationInfo
+from dcs_core.core.inspect import InspectOutput
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+        + "}"
+    )
+
+
+def _numeric_value(value) -> Optional[float]:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    return None
+
+
+@dataclass
+class _Histogram:
+    bucket_counts: List[int]
+    count: int = 0
+    sum: float = 0.0
+
+    def observe(self, buckets: Sequence[float], value: float):
+        for index, upper_bound in enumerate(buckets):
+            if value <= upper_bound:
+                self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+
+@dataclass
+class _MetricFamily:
+    name: str
+    type: str
+    help: str
+    unit: Optional[str] = None
+    samples: List[Tuple[str, Labels, float]] = field(default_factory=list)
+
+    def add(self, labels: Labels, value: float, suffix: str = ""):
+        self.samples.append((self.name + suffix, labels, value))
+
+    def render(self) -> List[str]:
+        lines = [f"# TYPE {self.name} {self.type}"]
+        if self.unit is not None:
+            lines.append(f"# UNIT {self.name} {self.unit}")
+        lines.append(f"# HELP {self.name} {self.help}")
+        for name, labels, value in self.samples:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class OpenMetricsTextfileExporter:
+    """
+    Writes the results of the inspections to a file in the OpenMetrics text format,
+    to be scraped with the textfile collector of node_exporter.
+
+    The file holds the latest value and pass/fail state of every validation, and the
+    duration and validation counts of the latest run. The latency histograms of the
+    validations are cumulative over the runs exported by the same exporter, so a long
+    running process that inspects on a schedule exports their distribution.
+    With a state file, the histograms are kept in it and are cumulative over the runs
+    of all the processes exporting to the file, e.g. the CLI run by cron.
+    The files are replaced atomically, a scrape never reads a partially written file.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        prefix: str = "dcs",
+        state_path: Optional[str] = None,
+    ):
+        """
+        :param file_path: path of the file, it must end with .prom for node_exporter
+        :param buckets: upper bounds of the latency histogram buckets, in seconds
+        :param prefix: prefix of the metric names
+        :param state_path: path of the JSON file the histograms are kept in between
+            processes, it must not end with .prom
+        """
+        self.file_path = file_path
+        self.buckets = sorted(buckets)
+        self.prefix = prefix
+        self.state_path = state_path
+        self._histograms: Dict[Labels, _Histogram] = {}
+        self._state_loaded = False
+        self._lock = threading.Lock()
+
+    def _load_state(self):
+        """
+        Merge the histograms of the state file into the histograms of the exporter.
+        The state is dropped if it was kept with other buckets, Prometheus reads it
+        as a counter reset.
+        """
+        self._state_loaded = True
+        if self.state_path is None or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, encoding="utf-8") as file:
+                state = json.load(file)
+            if state["buckets"] != self.buckets:
+                return
+            for entry in state["histograms"]:
+                labels = tuple((name, value) for name, value in entry["labels"])
+                histogram = self._histograms.setdefault(
+                    labels, _Histogram(bucket_counts=[0] * len(self.buckets))
+                )
+                histogram.bucket_counts = [
+                    count + saved_count
+                    for count, saved_count in zip(
+                        histogram.bucket_counts, entry["bucket_counts"]
+                    )
+                ]
+                histogram.count += entry["count"]
+                histogram.sum += entry["sum"]
+        except Exception as e:
+            logger.warning(f"Failed to load the state of {self.state_path}: {str(e)}")
+
+    def _state(self) -> str:
+        return json.dumps(
+            {
+                "buckets": self.buckets,
+                "histograms": [
+                    {
+                        "labels": labels,
+                        "bucket_counts": histogram.bucket_counts,
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                    }
+                    for labels, histogram in self._histograms.items()
+                ],
+            }
+        )
+
+    @staticmethod
+    def _replace_file(file_path: str, text: str):
+        directory = os.path.dirname(os.path.abspath(file_path))
+        # the temporary file does not end with .prom, so the collector never reads it
+        fd, temporary_path = tempfile.mkstemp(
+            dir=directory, prefix=".dcs_metrics_", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(text)
+            # mkstemp creates a private file, let the collector read it
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    @staticmethod
+    def _validation_labels(validation_info: ValidationInfo) -> Labels:
+        return (
+            ("validation", validation_info.name),
+            ("data_source", validation_info.data_source_name),
+            ("dataset", validation_info.dataset),
+            (
+                "validation_function",
+                getattr(
+                    validation_info.validation_function,
+                    "value",
+                    str(validation_info.validation_function),
+                ),
+            ),
+        )
+
+    def observe(self, inspect_output: InspectOutput):
+        """
+        Add the latencies of the validations of a run to the histograms
+        """
+        if not self._state_loaded:
+            self._load_state()
+        for validation_info in inspect_output.validations.values():
+            if validation_info is None or validation_info.instrumentation is None:
+                continue
+            labels = self._validation_labels(validation_info)
+            histogram = self._histograms.setdefault(
+                labels, _Histogram(bucket_counts=[0] * len(self.buckets))
+            )
+            histogram.observe(self.buckets, validation_info.instrumentation.time_taken)
+
+    def generate(
+        self, inspect_output: InspectOutput, run_duration: Optional[float] = None
+    ) -> str:
+        """
+        Generate the OpenMetrics text of a run and of the observed latencies
+        :param inspect_output: output of the run
+        :param run_duration: wall time of the run in seconds
+        :return: OpenMetrics text
+        """
+        value = _MetricFamily(
+            f"{self.prefix}_validation_value", "gauge", "Latest value of the validation"
+        )
+        valid = _MetricFamily(
+            f"{self.prefix}_validation_valid",
+            "gauge",
+            "1 if the validation passed its threshold, 0 if it failed",
+        )
+        cached = _MetricFamily(
+            f"{self.prefix}_validation_cached",
+            "gauge",
+            "1 if the validation was served from the result of an earlier run",
+        )
+        counts = {"passed": 0, "failed": 0, "unchecked": 0, "errored": 0}
+        for validation_info in inspect_output.validations.values():
+            if validation_info is None:
+                counts["errored"] += 1
+                continue
+            labels = self._validation_labels(validation_info)
+            metric_value = _numeric_value(validation_info.value)
+            if metric_value is not None:
+                value.add(labels, metric_value)
+            cached.add(labels, float(validation_info.cached))
+            if validation_info.is_valid is None:
+                counts["unchecked"] += 1
+            else:
+                valid.add(labels, float(validation_info.is_valid))
+                counts["passed" if validation_info.is_valid else "failed"] += 1
+
+        validations = _MetricFamily(
+            f"{self.prefix}_run_validations",
+            "gauge",
+            "Number of validations of the latest run by state",
+        )
+        for state, count in counts.items():
+            validations.add((("state", state),), count)
+        timestamp = _MetricFamily(
+            f"{self.prefix}_run_timestamp_seconds",
+            "gauge",
+            "Time the latest run was exported at",
+            unit="seconds",
+        )
+        timestamp.add((), time.time())
+        families = [value, valid, cached, validations, timestamp]
+        if run_duration is not None:
+            duration = _MetricFamily(
+                f"{self.prefix}_run_duration_seconds",
+                "gauge",
+                "Wall time of the latest run",
+                unit="seconds",
+            )
+            duration.add((), run_duration)
+            families.append(duration)
+
+        latency = _MetricFamily(
+            f"{self.prefix}_validation_duration_seconds",
+            "histogram",
+            "Wall time of the validations, including their share of fused queries",
+            unit="seconds",
+        )
+        for labels, histogram in self._histograms.items():
+            for upper_bound, bucket_count in zip(self.buckets, histogram.bucket_counts):
+                latency.add(
+                    labels + (("le", _format_value(upper_bound)),),
+                    bucket_count,
+                    "_bucket",
+                )
+            latency.add(labels + (("le", "+Inf"),), histogram.count, "_bucket")
+            latency.add(labels, histogram.count, "_count")
+            latency.add(labels, histogram.sum, "_sum")
+        families.append(latency)
+
+        lines: List[str] = []
+        for family in families:
+            lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def export(
+        self, inspect_output: InspectOutput, run_duration: Optional[float] = None
+    ):
+        """
+        Observe the latencies of a run and atomically replace the file with its metrics,
+        and the state file with the histograms
+        :param inspect_output: output of the run
+        :param run_duration: wall time of the run in seconds
+        """
+        with self._lock:
+            self.observe(inspect_output)
+            self._replace_file(
+                self.file_path, self.generate(inspect_output, run_duration)
+            )
+            if self.state_path is not None:
+                self._replace_file(self.state_path, self._state())
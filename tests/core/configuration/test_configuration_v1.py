@@ -33,6 +33,72 @@ def test_should_read_datasource_config_for_opensearch():
     assert configuration.data_sources["test"].type == DataSourceType.OPENSEARCH
 
 
+def test_should_read_datasource_max_concurrency():
+    yaml_string = """
+    data_sources:
+      - name: "test"
+        type: "postgres"
+        max_concurrency: 4
+        connection:
+          host: "localhost"
+          port: 5432
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.data_sources["test"].max_concurrency == 4
+
+
+def test_should_read_datasource_pool_options():
+    yaml_string = """
+    data_sources:
+      - name: "test"
+        type: "postgres"
+        connection:
+          host: "localhost"
+          port: 5432
+          pool_size: 10
+          max_overflow: 5
+          pool_recycle: 1800
+          pool_pre_ping: true
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    connection_config = configuration.data_sources["test"].connection_config
+    assert connection_config.pool_size == 10
+    assert connection_config.max_overflow == 5
+    assert connection_config.pool_recycle == 1800
+    assert connection_config.pool_pre_ping is True
+    assert connection_config.pool_timeout is None
+
+
+def test_should_read_watermark_and_storage_config():
+    yaml_string = """
+    storage:
+      type: local_file
+      params:
+        path: /tmp/dcs
+    validations for source.table:
+      - test:
+          on: avg(amount)
+          watermark: created_at
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    assert configuration.storage.params.path == "/tmp/dcs"
+    validation_config = configuration.validations["source.table"].validations["test"]
+    assert validation_config.watermark == "created_at"
+
+
+def test_should_read_validation_sample_config():
+    yaml_string = """
+    validations for source.table:
+      - test:
+          on: percent_null(amount)
+          sample: 1.5
+          threshold: "< 10"
+    """
+    configuration = load_configuration_from_yaml_str(yaml_string)
+    validation_config = configuration.validations["source.table"].validations["test"]
+    assert validation_config.sample == 1.5
+
+
 def test_should_read_datasource_config_for_elasticsearch():
     yaml_string = """
     data_sources:
@@ -0,0 +1,67 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from sqlalchemy import text
+
+from dcs_core.core.common.models.configuration import ValidationConfig
+from tests.utils import InMemorySQLDataSource, insert_rows
+
+
+@pytest.fixture
+def data_source(request):
+    """
+    In-memory data source with the table of the test module, created from its
+    TABLE_NAME, TABLE_COLUMNS and TABLE_ROWS. Parametrize the fixture indirectly to
+    insert other rows.
+    """
+    module = request.module
+    data_source = InMemorySQLDataSource()
+    data_source.connect()
+    data_source.connection.execute(
+        text(f"CREATE TABLE {module.TABLE_NAME} ({module.TABLE_COLUMNS})")
+    )
+    insert_rows(
+        data_source, module.TABLE_NAME, getattr(request, "param", module.TABLE_ROWS)
+    )
+    yield data_source
+    data_source.close()
+
+
+@pytest.fixture
+def make_validation(request):
+    """
+    Factory of the validations on the table of the test module
+    """
+
+    def make_validation(
+        validation_class,
+        name: str,
+        on: str,
+        data_source,
+        dataset_name: str = None,
+        state_repository=None,
+        **config,
+    ):
+        validation_config = ValidationConfig(name=name, on=on, **config)
+        validation = validation_class(
+            name=name,
+            validation_config=validation_config,
+            data_source=data_source,
+            dataset_name=dataset_name or request.module.TABLE_NAME,
+            field_name=validation_config.get_validation_field_name,
+        )
+        validation.state_repository = state_repository
+        return validation
+
+    return make_validation
@@ -0,0 +1,129 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from dcs_core.core.configuration.configuration_parser import (
+    load_configuration_from_yaml_str,
+)
+from dcs_core.core.datasource.manager import DataSourceManager
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from dcs_core.integrations.databases.sqlite import SQLiteDataSource
+
+
+def _configuration(tmp_path, *names):
+    return load_configuration_from_yaml_str(
+        "data_sources:\n"
+        + "".join(
+            f"""
+  - name: {name}
+    type: sqlite
+    connection:
+      database: {tmp_path / name}.sqlite
+"""
+            for name in names
+        )
+    )
+
+
+@pytest.fixture
+def connect(mocker):
+    return mocker.spy(SQLiteDataSource, "connect")
+
+
+@pytest.fixture
+def close(mocker):
+    return mocker.spy(SQLiteDataSource, "close")
+
+
+class TestDataSourceManager:
+    def test_should_connect_unchanged_data_sources_once(self, tmp_path, connect):
+        data_source_manager = DataSourceManager(_configuration(tmp_path, "first"))
+        data_source_manager.connect()
+        data_source = data_source_manager.get_data_source("first")
+        engine = data_source.engine
+
+        data_source_manager.connect()
+
+        assert connect.call_count == 1
+        assert data_source_manager.get_data_source("first") is data_source
+        assert data_source.engine is engine
+        data_source_manager.close()
+
+    def test_should_close_changed_data_sources(self, tmp_path, close):
+        configuration = _configuration(tmp_path, "first")
+        data_source_manager = DataSourceManager(configuration)
+        data_source_manager.connect()
+        data_source = data_source_manager.get_data_source("first")
+
+        configuration.data_sources["first"].connection_config.database = str(
+            tmp_path / "other.sqlite"
+        )
+        data_source_manager.connect()
+
+        assert close.call_count == 1
+        assert not data_source.is_connected()
+        assert data_source_manager.get_data_source("first") is not data_source
+        data_source_manager.close()
+
+    def test_should_close_removed_data_sources(self, tmp_path, close):
+        configuration = _configuration(tmp_path, "first", "second")
+        data_source_manager = DataSourceManager(configuration)
+        data_source_manager.connect()
+        data_source = data_source_manager.get_data_source("second")
+
+        del configuration.data_sources["second"]
+        data_source_manager.connect()
+
+        assert close.call_count == 1
+        assert not data_source.is_connected()
+        assert data_source_manager.get_data_source_names() == ["first"]
+
+        data_source_manager.close()
+        assert data_source_manager.get_data_source_names() == []
+
+    def test_should_retry_a_failed_connection(self, tmp_path, mocker):
+        data_source_manager = DataSourceManager(_configuration(tmp_path, "first"))
+        mocker.patch.object(
+            SQLiteDataSource, "check_connection", side_effect=[Exception("down"), None]
+        )
+
+        with pytest.raises(Exception):
+            data_source_manager.connect()
+        data_source_manager.connect()
+
+        assert data_source_manager.get_data_source("first").is_connected()
+        data_source_manager.close()
+
+    def test_should_close_async_client_of_removed_data_source_on_the_event_loop(
+        self, tmp_path
+    ):
+        configuration = _configuration(tmp_path, "first")
+        data_source_manager = DataSourceManager(configuration)
+        data_source_manager.connect()
+        search_data_source = Mock(spec=SearchIndexDataSource)
+        search_data_source.data_source_name = "search"
+        search_data_source.async_client = Mock()
+        search_data_source.close_async = AsyncMock()
+        data_source_manager.get_data_sources["search"] = search_data_source
+
+        data_source_manager.connect()
+        search_data_source.close.assert_called_once()
+        search_data_source.close_async.assert_not_awaited()
+        asyncio.run(data_source_manager.connect_async())
+
+        search_data_source.close_async.assert_awaited_once()
+        data_source_manager.close()
@@ -0,0 +1,124 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from dcs_core.integrations.databases.opensearch import OpenSearchDataSource
+
+INDEX_NAME = "search_datasource_test"
+
+
+@pytest.fixture
+def data_source():
+    data_source = OpenSearchDataSource("test_search_data_source", {})
+    data_source.client = Mock()
+    data_source.client.indices.get_mapping.return_value = {
+        INDEX_NAME: {"mappings": {"properties": {"age": {"type": "integer"}}}}
+    }
+    return data_source
+
+
+def _page(buckets, after_key=None):
+    aggregation = {
+        "buckets": [
+            {"key": {"value": key}, "doc_count": doc_count}
+            for key, doc_count in buckets
+        ]
+    }
+    if after_key is not None:
+        aggregation["after_key"] = {"value": after_key}
+    return {"aggregations": {"duplicate_count": aggregation}}
+
+
+class TestSearchIndexDataSourceDuplicateCount:
+    def test_should_add_up_duplicate_counts_across_pages(self, data_source):
+        data_source.client.search.side_effect = [
+            _page([(1, 2), (2, 1)], after_key=2),
+            _page([(3, 5), (4, 3)], after_key=4),
+            _page([]),
+        ]
+
+        assert data_source.query_get_duplicate_count(INDEX_NAME, "age") == 3
+
+        bodies = [c.kwargs["body"] for c in data_source.client.search.call_args_list]
+        assert len(bodies) == 3
+        composite = bodies[-1]["aggs"]["duplicate_count"]["composite"]
+        assert composite["size"] == data_source.DUPLICATE_COUNT_PAGE_SIZE
+        assert composite["sources"] == [{"value": {"terms": {"field": "age"}}}]
+        assert composite["after"] == {"value": 4}
+
+    def test_should_stop_when_there_is_no_after_key(self, data_source):
+        data_source.client.search.side_effect = [_page([(1, 2), (2, 2)])]
+
+        assert data_source.query_get_duplicate_count(INDEX_NAME, "age") == 2
+        assert data_source.client.search.call_count == 1
+
+
+class TestSearchIndexDataSourceAsyncMsearch:
+    def test_should_limit_msearch_requests_in_flight(self, data_source, mocker):
+        mocker.patch.object(OpenSearchDataSource, "MAX_MSEARCH_REQUESTS", 1)
+        in_flight, max_in_flight = 0, 0
+
+        async def msearch(body):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"responses": [{"index": body[0]["index"]}]}
+
+        data_source.async_client = Mock()
+        data_source.async_client.msearch = msearch
+        searches = [(f"index_{i}", {"size": 0}) for i in range(5)]
+
+        responses = asyncio.run(data_source._msearch_async(searches, max_concurrency=2))
+
+        assert [response["index"] for response in responses] == [
+            f"index_{i}" for i in range(5)
+        ]
+        assert max_in_flight == 2
+
+
+class TestSearchIndexDataSourceAsyncClient:
+    def test_should_keep_async_client_on_the_same_event_loop(self, data_source, mocker):
+        create_async_client = mocker.patch.object(
+            data_source, "create_async_client", side_effect=lambda: AsyncMock()
+        )
+
+        async def runs():
+            await data_source.connect_async()
+            async_client = data_source.async_client
+            await data_source.connect_async()
+            assert data_source.async_client is async_client
+            await data_source.close_async()
+            async_client.close.assert_awaited_once()
+
+        asyncio.run(runs())
+
+        assert create_async_client.call_count == 1
+        assert data_source.async_client is None
+
+    def test_should_create_async_client_again_on_a_new_event_loop(
+        self, data_source, mocker
+    ):
+        create_async_client = mocker.patch.object(
+            data_source, "create_async_client", side_effect=lambda: AsyncMock()
+        )
+
+        asyncio.run(data_source.connect_async())
+        asyncio.run(data_source.connect_async())
+
+        assert create_async_client.call_count == 2
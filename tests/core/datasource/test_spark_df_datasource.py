@@ -0,0 +1,129 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("pyspark")
+
+from pyspark.sql.types import IntegerType, Row, StringType, StructField, StructType
+
+from dcs_core.integrations.databases.spark_df import SparkDfCursor, SparkDFDataSource
+
+SCHEMA = StructType(
+    [StructField("name", StringType()), StructField("age", IntegerType())]
+)
+ROWS = [Row(name="thor", age=1500), Row(name="loki", age=0), Row(name="hulk", age=-40)]
+
+
+@pytest.fixture
+def spark_session():
+    spark_session = Mock()
+    df = spark_session.sql.return_value
+    df.schema = SCHEMA
+    df.first.return_value = ROWS[0]
+    df.collect.return_value = ROWS
+    df.toLocalIterator.side_effect = lambda: iter(ROWS)
+    spark_session.catalog.isCached.side_effect = lambda table_name: (
+        table_name == "cached_by_user"
+    )
+    return spark_session
+
+
+def _data_source(spark_session, persist=False):
+    data_source = SparkDFDataSource(
+        "spark_df", {"spark_session": spark_session, "persist": persist}
+    )
+    data_source.connect()
+    return data_source
+
+
+class TestSparkDfCursor:
+    def test_should_fetch_one_row(self, spark_session):
+        cursor = SparkDfCursor(spark_session)
+        cursor.execute("SELECT name, age FROM people")
+
+        assert cursor.fetchone() == ("thor", 1500)
+        assert cursor.description == (("name", "StringType"), ("age", "IntegerType"))
+        spark_session.sql.assert_called_once_with(
+            sqlQuery="SELECT name, age FROM people"
+        )
+
+    def test_should_fetch_many_rows_from_one_iterator(self, spark_session):
+        cursor = SparkDfCursor(spark_session)
+        cursor.execute("SELECT name, age FROM people")
+
+        assert cursor.fetchmany(2) == (["thor", 1500], ["loki", 0])
+        assert cursor.fetchmany(2) == (["hulk", -40],)
+        assert cursor.fetchmany(2) == ()
+        df = spark_session.sql.return_value
+        df.toLocalIterator.assert_called_once()
+        df.count.assert_not_called()
+
+
+class TestSparkDFDataSource:
+    def test_should_compute_aggregates_in_one_job(self, spark_session, mocker):
+        functions = mocker.patch("dcs_core.integrations.databases.spark_df.F")
+        df = spark_session.table.return_value
+        df.where.return_value.agg.return_value.first.return_value = Row(
+            agg_0=3, agg_1=1500
+        )
+        data_source = _data_source(spark_session)
+
+        values = data_source.query_aggregates(
+            "people", ["COUNT(*)", "MAX(age)"], filters="age >= 0"
+        )
+
+        assert values == (3, 1500)
+        spark_session.table.assert_called_once_with("people")
+        df.where.assert_called_once_with("age >= 0")
+        assert [call.args[0] for call in functions.expr.call_args_list] == [
+            "COUNT(*)",
+            "MAX(age)",
+        ]
+        df.where.return_value.agg.assert_called_once()
+
+    def test_should_cache_the_tables_of_the_run(self, spark_session):
+        data_source = _data_source(spark_session, persist=True)
+
+        data_source.start_run(["people", "cached_by_user"])
+        assert data_source.qualified_table_name("people") == "people"
+        data_source.end_run()
+
+        catalog = spark_session.catalog
+        catalog.cacheTable.assert_called_once_with("people")
+        catalog.uncacheTable.assert_called_once_with("people")
+
+    def test_should_not_cache_without_persist(self, spark_session):
+        data_source = _data_source(spark_session)
+
+        data_source.start_run(["people"])
+        data_source.end_run()
+
+        spark_session.catalog.cacheTable.assert_not_called()
+        spark_session.catalog.uncacheTable.assert_not_called()
+
+    def test_should_end_run_when_uncache_fails(self, spark_session):
+        spark_session.catalog.uncacheTable.side_effect = [
+            Exception("Table or view not found"),
+            None,
+        ]
+        data_source = _data_source(spark_session, persist=True)
+
+        data_source.start_run(["dropped", "people"])
+        data_source.end_run()
+
+        assert spark_session.catalog.uncacheTable.call_count == 2
+        assert data_source._persisted_tables is None
+        assert data_source._row_count_cache is None
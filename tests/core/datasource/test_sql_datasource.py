@@ -0,0 +1,249 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+
+from dcs_core.integrations.databases.mysql import MysqlDataSource
+from tests.utils import InMemorySQLDataSource
+
+TABLE_NAME = "sql_datasource_test"
+
+
+@pytest.fixture
+def data_source():
+    data_source = InMemorySQLDataSource()
+    data_source.connect()
+    data_source.connection.execute(
+        text(f"CREATE TABLE {TABLE_NAME} (name VARCHAR(50), age INTEGER)")
+    )
+    data_source.connection.execute(
+        text(
+            f"INSERT INTO {TABLE_NAME} VALUES "
+            "('thor', 1500), ('loki', 0), ('hulk', -40), ('thor', 0)"
+        )
+    )
+    yield data_source
+    data_source.close()
+
+
+class TestSQLDataSourceRowCountCache:
+    def test_should_not_cache_row_count_outside_of_a_run(self, data_source):
+        data_source.query_get_row_count(table=TABLE_NAME)
+        data_source.query_get_row_count(table=TABLE_NAME)
+
+        assert len(data_source.queries) == 2
+
+    def test_should_share_row_count_per_table_and_filter_in_a_run(self, data_source):
+        data_source.start_run()
+        assert data_source.query_zero_metric(TABLE_NAME, "age", "percent") == 50.0
+        assert data_source.query_negative_metric(TABLE_NAME, "age", "percent") == 25.0
+        assert data_source.query_get_row_count(table=TABLE_NAME) == 4
+
+        # one count per metric plus a single shared total count
+        assert len(data_source.queries) == 3
+
+        data_source.query_get_row_count(table=TABLE_NAME, filters="name = 'thor'")
+        assert len(data_source.queries) == 4
+
+    def test_should_clear_row_count_cache_at_the_end_of_a_run(self, data_source):
+        data_source.start_run()
+        data_source.query_get_row_count(table=TABLE_NAME)
+        data_source.end_run()
+        data_source.query_get_row_count(table=TABLE_NAME)
+
+        assert len(data_source.queries) == 2
+
+
+class TestSQLDataSourceConnectionPool:
+    def test_should_read_only_configured_pool_options(self):
+        data_source = InMemorySQLDataSource()
+        data_source.data_connection = {
+            "host": "localhost",
+            "pool_size": 10,
+            "pool_pre_ping": True,
+            "max_overflow": None,
+        }
+
+        assert data_source.pool_options() == {"pool_size": 10, "pool_pre_ping": True}
+
+    def test_should_check_out_a_connection_per_query(self, data_source, mocker):
+        connect = mocker.spy(data_source.engine, "connect")
+
+        assert data_source.query_get_row_count(table=TABLE_NAME) == 4
+        assert data_source.query_get_row_count(table=TABLE_NAME) == 4
+
+        assert connect.call_count == 2
+
+
+class TestSQLDataSourceDuplicateCount:
+    def test_should_count_duplicate_values_in_the_database(self, data_source, mocker):
+        fetchall = mocker.spy(data_source, "fetchall")
+
+        assert data_source.query_get_duplicate_count(TABLE_NAME, "name") == 1
+        assert data_source.query_get_duplicate_count(TABLE_NAME, "age") == 1
+        assert (
+            data_source.query_get_duplicate_count(
+                TABLE_NAME, "name", filters="name <> 'thor'"
+            )
+            == 0
+        )
+        fetchall.assert_not_called()
+
+
+class TestSQLDataSourceBulkColumnMetadata:
+    def test_should_load_column_metadata_of_all_tables(self, data_source):
+        data_source.connection.execute(text("CREATE TABLE other (id INTEGER)"))
+
+        metadata = data_source.query_get_bulk_column_metadata(
+            [TABLE_NAME, "other", "missing"]
+        )
+
+        assert metadata == {
+            TABLE_NAME: {"name": "str", "age": "int"},
+            "other": {"id": "int"},
+            "missing": {},
+        }
+
+    def test_should_cache_column_metadata_for_the_run(self, data_source, mocker):
+        data_source.start_run()
+        load = mocker.spy(data_source, "_load_column_metadata")
+
+        data_source.query_get_bulk_column_metadata([TABLE_NAME])
+        data_source.query_get_bulk_column_metadata([TABLE_NAME])
+
+        assert load.call_count == 1
+        assert data_source.query_get_column_metadata(TABLE_NAME) == {
+            "name": "str",
+            "age": "int",
+        }
+        data_source.end_run()
+
+    def test_should_read_information_schema_once_per_schema(self):
+        data_source = MysqlDataSource("test_mysql", {})
+        data_source.connection = Mock()
+        data_source.connection.engine.dialect = mysql.dialect()
+        data_source.fetchall = Mock(
+            return_value=[
+                ("customers", "id", "int"),
+                ("customers", "email", "varchar"),
+                ("orders", "amount", "decimal"),
+                ("ignored", "id", "int"),
+            ]
+        )
+
+        metadata = data_source.query_get_bulk_column_metadata(["customers", "orders"])
+
+        assert metadata == {
+            "customers": {"id": "int", "email": "str"},
+            "orders": {"amount": "Decimal"},
+        }
+        data_source.fetchall.assert_called_once()
+
+
+class TestSQLDataSourceTableProfilingAggregates:
+    COLUMNS = {
+        "age": {"min": "min({column})", "max": "max({column})"},
+        "name": {"distinct_count": "count(distinct({column}))"},
+    }
+
+    def test_should_profile_all_columns_in_one_query(self, data_source):
+        data_source.start_run()
+
+        row_count, values = data_source.profiling_sql_aggregates_table(
+            TABLE_NAME, self.COLUMNS
+        )
+
+        assert row_count == 4
+        assert values == {
+            "age": {"min": -40, "max": 1500},
+            "name": {"distinct_count": 3},
+        }
+        assert len(data_source.queries) == 1
+        assert data_source.query_get_row_count(TABLE_NAME) == 4
+        assert len(data_source.queries) == 1
+        data_source.end_run()
+
+    def test_should_split_columns_on_select_list_limit(self, data_source, mocker):
+        mocker.patch.object(InMemorySQLDataSource, "MAX_SELECT_COLUMNS", 3)
+
+        row_count, values = data_source.profiling_sql_aggregates_table(
+            TABLE_NAME, self.COLUMNS
+        )
+
+        assert row_count == 4
+        assert values["name"] == {"distinct_count": 3}
+        assert len(data_source.queries) == 2
+
+
+class TestSQLDataSourceTableProfilingFrequencies:
+    def test_should_compute_histograms_and_top_k_in_one_query(
+        self, data_source, mocker
+    ):
+        mocker.patch.object(InMemorySQLDataSource, "PROFILING_HISTOGRAM_BINS", 4)
+        mocker.patch.object(InMemorySQLDataSource, "PROFILING_TOP_K", 2)
+
+        frequencies = data_source.profiling_sql_frequencies_table(
+            TABLE_NAME, {"age": (-40.0, 1500.0)}, ["name", "age"]
+        )
+
+        assert sorted(
+            (int(float(bucket)), count)
+            for bucket, count in frequencies["histogram"]["age"]
+        ) == [(0, 3), (3, 1)]
+        assert frequencies["top_k"]["name"] == [("thor", 2), ("hulk", 1)]
+        assert frequencies["top_k"]["age"][0] == ("0", 2)
+        assert len(data_source.queries) == 1
+
+    def test_should_group_all_columns_in_one_scan(self, data_source, mocker):
+        mocker.patch.object(InMemorySQLDataSource, "SUPPORTS_GROUPING_SETS", True)
+        fetchall = mocker.patch.object(
+            data_source,
+            "fetchall",
+            return_value=[(0, "0", 3), (0, "3", 1), (1, "thor", 2)],
+        )
+
+        frequencies = data_source.profiling_sql_frequencies_table(
+            TABLE_NAME, {"age": (-40.0, 1500.0)}, ["name"]
+        )
+
+        assert frequencies == {
+            "histogram": {"age": [("0", 3), ("3", 1)]},
+            "top_k": {"name": [("thor", 2)]},
+        }
+        query = fetchall.call_args[0][0]
+        assert query.count(f"FROM {TABLE_NAME}") == 1
+        assert "GROUP BY GROUPING SETS ((group_0), (group_1))" in query
+
+    def test_should_not_query_without_columns(self, data_source):
+        assert data_source.profiling_sql_frequencies_table(TABLE_NAME, {}, []) == {
+            "histogram": {},
+            "top_k": {},
+        }
+        assert data_source.queries == []
+
+
+class TestSQLDataSourceQueryAggregates:
+    def test_should_compute_all_aggregates_in_one_query(self, data_source):
+        values = data_source.query_aggregates(
+            TABLE_NAME, ["COUNT(*)", "MAX(age)"], filters="name = 'thor'"
+        )
+
+        assert values == (2, 1500)
+        assert data_source.queries == [
+            f"SELECT COUNT(*) AS agg_0, MAX(age) AS agg_1 FROM {TABLE_NAME} "
+            "WHERE name = 'thor'"
+        ]
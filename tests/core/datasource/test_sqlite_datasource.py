@@ -0,0 +1,205 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import sqlite3
+
+import numpy as np
+import pytest
+
+from dcs_core.core import Inspect
+from dcs_core.core.configuration.configuration_parser import (
+    load_configuration_from_yaml_str,
+)
+from dcs_core.core.datasource.manager import DataSourceManager
+from dcs_core.integrations.databases.sqlite import SQLiteDataSource, regexp
+
+TABLE_NAME = "local_extract_test"
+AGES = [1500, 0, -40, 0, 35, None, 27, 1000, 12, 90]
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    path = str(tmp_path / "test.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        f"CREATE TABLE {TABLE_NAME} (name VARCHAR(50), email VARCHAR(50), age INTEGER)"
+    )
+    connection.executemany(
+        f"INSERT INTO {TABLE_NAME} VALUES (?, ?, ?)",
+        [
+            (f"name_{index}", f"user{index}@example.com" if index % 3 else "-", age)
+            for index, age in enumerate(AGES)
+        ],
+    )
+    connection.commit()
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def data_source(database_path):
+    data_source = SQLiteDataSource("sqlite_db", {"database": database_path})
+    data_source.connect()
+    yield data_source
+    data_source.close()
+
+
+class TestSQLiteDataSource:
+    def test_should_match_regex_anywhere_in_value(self):
+        assert regexp("^[a-z]+$", "thor")
+        assert regexp("[0-9]", "thor1")
+        assert not regexp("^[a-z]+$", "Thor")
+        assert regexp("^[a-z]+$", None) is None
+
+    def test_should_count_regex_matches(self, data_source):
+        valid_count, total_count = data_source.query_string_pattern_validity(
+            TABLE_NAME, "email", predefined_regex_pattern="email"
+        )
+
+        assert (valid_count, total_count) == (6, 10)
+
+    @pytest.mark.parametrize("percentile", [0.2, 0.4, 0.6, 0.8, 0.9])
+    def test_should_compute_discrete_percentile(self, data_source, percentile):
+        ages = [age for age in AGES if age is not None]
+
+        value = data_source.query_get_percentile(TABLE_NAME, "age", percentile)
+
+        assert value == np.percentile(ages, percentile * 100, method="inverted_cdf")
+
+    def test_should_compute_percentile_with_filter(self, data_source):
+        assert data_source.query_get_percentile(TABLE_NAME, "age", 0.5, "age > 0") == 35
+
+    def test_should_compute_sample_variance_and_stddev(self, data_source):
+        ages = [age for age in AGES if age is not None]
+
+        variance = data_source.query_get_variance(TABLE_NAME, "age")
+        stddev = data_source.query_get_stddev(TABLE_NAME, "age")
+
+        assert variance == pytest.approx(round(np.var(ages, ddof=1), 2))
+        assert stddev == pytest.approx(round(np.std(ages, ddof=1), 2))
+
+    def test_should_not_hold_a_connection_between_queries(self, data_source):
+        assert data_source.connection is None
+        assert data_source.engine.pool.checkedout() == 0
+
+        data_source.query_get_row_count(TABLE_NAME)
+
+        assert data_source.engine.pool.checkedout() == 0
+
+    def test_should_share_in_memory_database_between_connections(self):
+        data_source = SQLiteDataSource("sqlite_db", {})
+        data_source.connect()
+        with data_source.engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE numbers (value INTEGER)")
+            connection.exec_driver_sql("INSERT INTO numbers VALUES (1)")
+
+        assert data_source.query_get_row_count("numbers") == 1
+        data_source.close()
+
+
+class TestSQLiteDataSourceTimestamp:
+    TIMESTAMPS = [
+        "2023-01-15T10:30:00Z",
+        "2023-06-01T08:00:00.123+05:30",
+        "2023-02-30T10:00:00Z",
+        "2999-01-01T00:00:00Z",
+        "15/01/2023 10:30",
+        None,
+    ]
+
+    @pytest.fixture
+    def data_source(self, database_path, data_source):
+        connection = sqlite3.connect(database_path)
+        connection.execute("CREATE TABLE timestamps (created_at VARCHAR(50))")
+        connection.executemany(
+            "INSERT INTO timestamps VALUES (?)",
+            [(timestamp,) for timestamp in self.TIMESTAMPS],
+        )
+        connection.commit()
+        connection.close()
+        return data_source
+
+    def test_should_count_valid_timestamps(self, data_source):
+        assert data_source.query_timestamp_metric(
+            "timestamps", "created_at", "count", "timestamp_iso"
+        ) == (3, 6)
+
+    def test_should_count_timestamps_not_in_future(self, data_source):
+        assert data_source.query_timestamp_not_in_future_metric(
+            "timestamps", "created_at", "count", "timestamp_iso"
+        ) == (2, 6)
+        assert data_source.query_timestamp_date_not_in_future_metric(
+            "timestamps",
+            "created_at",
+            "percent",
+            "timestamp_iso",
+            filters="created_at LIKE '2023%'",
+        ) == (2, 3)
+
+    def test_should_reject_unknown_regex(self, data_source):
+        with pytest.raises(ValueError):
+            data_source.query_timestamp_metric(
+                "timestamps", "created_at", "count", "date_iso"
+            )
+
+
+class TestSQLiteDataSourceConfiguration:
+    def test_should_create_sqlite_data_source(self, database_path):
+        configuration = load_configuration_from_yaml_str(
+            f"""
+data_sources:
+  - name: sqlite_db
+    type: sqlite
+    connection:
+      database: {database_path}
+"""
+        )
+        data_source_manager = DataSourceManager(configuration)
+        data_source_manager.connect()
+
+        data_source = data_source_manager.get_data_source("sqlite_db")
+        assert isinstance(data_source, SQLiteDataSource)
+        assert data_source.query_get_row_count(TABLE_NAME) == 10
+        data_source.close()
+
+    def test_should_run_validations(self, database_path):
+        inspect = Inspect()
+        inspect.add_validations_yaml_str(
+            f"""
+data_sources:
+  - name: sqlite_db
+    type: sqlite
+    connection:
+      database: {database_path}
+validations for sqlite_db.{TABLE_NAME}:
+  - max_age:
+      on: max(age)
+      threshold: "< 2000"
+  - percent_email:
+      on: percent_email(email)
+  - percentile_80_age:
+      on: percentile_80(age)
+"""
+        )
+
+        validations = inspect.run().validations
+
+        values = {
+            validation_info.name: validation_info.value
+            for validation_info in validations.values()
+        }
+        assert values == {
+            "max_age": 1500,
+            "percent_email": 60.0,
+            "percentile_80_age": 1000,
+        }
@@ -11,65 +11,156 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from datetime import datetime, timezone
+import time
 from unittest.mock import Mock
 
-from dcs_core.core.common.models.metric import MetricsType, MetricValue
-from dcs_core.core.common.models.profile import NumericFieldProfile, TextFieldProfile
+import pytest
+
+from dcs_core.core.common.models.metric import MetricsType
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.profiling.checkpoint import ProfilingCheckpoint
 from dcs_core.core.profiling.datasource_profiling import DataSourceProfiling
 
 
 class TestFieldProfiling:
-    def test_should_generate_profile_for_sql_datasource_numeric_field(self, mocker):
-        mocker.patch(
-            "dcs_core.core.profiling.numeric_field_profiling.NumericSQLFieldProfiler.generate",
-            return_value=NumericFieldProfile(
-                field_name="test_field",
-                data_type="int",
-                min=MetricValue(
-                    value=1,
-                    identity="test_identity",
-                    metric_type=MetricsType("min"),
-                    timestamp=datetime.now(timezone.utc),
-                    data_source="test_data_source",
-                ),
-            ),
-        )
+    def test_should_generate_profile_for_sql_datasource_numeric_field(self):
         mock_data_source = Mock(spec=SQLDataSource)
-        mock_data_source.data_source_name.return_value = "test_data_source"
+        mock_data_source.data_source_name = "test_data_source"
         mock_data_source.query_get_table_metadata.return_value = ["test_table"]
-        mock_data_source.query_get_column_metadata.return_value = {"test_field": "int"}
+        mock_data_source.query_get_bulk_column_metadata.return_value = {
+            "test_table": {"test_field": "int"}
+        }
+        mock_data_source.profiling_sql_aggregates_table.return_value = (
+            4,
+            {"test_field": {"min": 1}},
+        )
+        mock_data_source.profiling_sql_frequencies_table.return_value = {}
 
         field_profile = DataSourceProfiling(mock_data_source)
         list_metric = field_profile.generate()
 
         assert len(list_metric) == 1
         assert list_metric[0].table_name == "test_table"
+        metric_types = {m.metric_type for m in list_metric[0].metrics.values()}
+        assert metric_types == {MetricsType.MIN, MetricsType.ROW_COUNT}
 
-    def test_should_generate_profile_for_sql_datasource_string_field(self, mocker):
-        mocker.patch(
-            "dcs_core.core.profiling.text_field_profiling.TextSQLFieldProfiler.generate",
-            return_value=TextFieldProfile(
-                field_name="test_field",
-                data_type="str",
-                distinct_count=MetricValue(
-                    value=1,
-                    identity="test_identity",
-                    metric_type=MetricsType("min"),
-                    timestamp=datetime.now(timezone.utc),
-                    data_source="test_data_source",
-                    table_name="test_table",
-                ),
-            ),
-        )
-
+    def test_should_generate_profile_for_sql_datasource_string_field(self):
         mock_data_source = Mock(spec=SQLDataSource)
-        mock_data_source.data_source_name.return_value = "test_data_source"
+        mock_data_source.data_source_name = "test_data_source"
         mock_data_source.query_get_table_metadata.return_value = ["test_table"]
-        mock_data_source.query_get_column_metadata.return_value = {"test_field": "str"}
+        mock_data_source.query_get_bulk_column_metadata.return_value = {
+            "test_table": {"test_field": "str"}
+        }
+        mock_data_source.profiling_sql_aggregates_table.return_value = (
+            4,
+            {"test_field": {"distinct_count": 1}},
+        )
+        mock_data_source.profiling_sql_frequencies_table.return_value = {}
 
         field_profile = DataSourceProfiling(mock_data_source)
         list_metric = field_profile.generate()
 
         assert len(list_metric) == 1
+        metric_types = {m.metric_type for m in list_metric[0].metrics.values()}
+        assert metric_types == {MetricsType.DISTINCT_COUNT, MetricsType.ROW_COUNT}
+
+
+def _mock_data_source(tables, failing_tables=()):
+    mock_data_source = Mock(spec=SQLDataSource)
+    mock_data_source.data_source_name = "test_data_source"
+    mock_data_source.engine = Mock()
+    mock_data_source.query_get_table_metadata.return_value = tables
+    mock_data_source.query_get_bulk_column_metadata.return_value = {
+        table: {"test_field": "int"} for table in tables
+    }
+    mock_data_source.query_get_row_count.return_value = 4
+
+    def profiling_sql_aggregates_table(table_name, columns):
+        if table_name in failing_tables:
+            raise Exception(f"Failed to profile {table_name}")
+        return 4, {"test_field": {"min": 1}}
+
+    mock_data_source.profiling_sql_aggregates_table.side_effect = (
+        profiling_sql_aggregates_table
+    )
+    mock_data_source.profiling_sql_frequencies_table.return_value = {
+        "top_k": {"test_field": [("1", 3)]}
+    }
+    return mock_data_source
+
+
+class TestParallelDataSourceProfiling:
+    def test_should_profile_tables_concurrently_in_order(self):
+        tables = [f"table_{i}" for i in range(8)]
+        field_profile = DataSourceProfiling(_mock_data_source(tables), max_workers=4)
+        list_metric = field_profile.generate()
+
+        assert [table_metrics.table_name for table_metrics in list_metric] == tables
+        assert field_profile.progress.total_tables == 8
+        assert field_profile.progress.completed_tables == 8
+        assert set(field_profile.progress.table_timings) == set(tables)
+
+    def test_should_profile_sequentially_without_pooled_engine(self):
+        mock_data_source = _mock_data_source(["table_1", "table_2"])
+        mock_data_source.engine = None
+
+        assert DataSourceProfiling(mock_data_source, max_workers=4).max_workers == 1
+
+    def test_should_resume_interrupted_profiling_from_checkpoint(self, tmp_path):
+        tables = ["table_1", "table_2"]
+        failing_data_source = _mock_data_source(tables, failing_tables=["table_2"])
+        with pytest.raises(Exception):
+            DataSourceProfiling(
+                failing_data_source, max_workers=1, checkpoint_path=str(tmp_path)
+            ).generate()
+        checkpoint_dir = tmp_path / "profiling_checkpoints" / "test_data_source"
+        assert (checkpoint_dir / "table_1.json").exists()
+
+        data_source = _mock_data_source(tables)
+        field_profile = DataSourceProfiling(data_source, checkpoint_path=str(tmp_path))
+        list_metric = field_profile.generate()
+
+        profiled_tables = [
+            call.args[0]
+            for call in data_source.profiling_sql_aggregates_table.call_args_list
+        ]
+        assert profiled_tables == ["table_2"]
+        assert [table_metrics.table_name for table_metrics in list_metric] == tables
+        metric_types = {m.metric_type for m in list_metric[0].metrics.values()}
+        assert metric_types == {MetricsType.MIN, MetricsType.ROW_COUNT}
+        assert list_metric[0].distributions["test_field"].top_counts.tolist() == [3]
+        assert field_profile.progress.resumed_tables == 1
+        assert list(field_profile.progress.table_timings) == ["table_2"]
+        assert list(checkpoint_dir.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "row_count, elapsed_seconds",
+        [(4, ProfilingCheckpoint.DEFAULT_MAX_AGE_SECONDS + 1), (5, 1)],
+        ids=["expired", "changed"],
+    )
+    def test_should_profile_again_on_stale_checkpoint(
+        self, tmp_path, mocker, row_count, elapsed_seconds
+    ):
+        tables = ["table_1", "table_2"]
+        with pytest.raises(Exception):
+            DataSourceProfiling(
+                _mock_data_source(tables, failing_tables=["table_2"]),
+                max_workers=1,
+                checkpoint_path=str(tmp_path),
+            ).generate()
+        mocker.patch(
+            "dcs_core.core.profiling.checkpoint.time.time",
+            return_value=time.time() + elapsed_seconds,
+        )
+
+        data_source = _mock_data_source(tables)
+        data_source.query_get_row_count.return_value = row_count
+        field_profile = DataSourceProfiling(data_source, checkpoint_path=str(tmp_path))
+        field_profile.generate()
+
+        profiled_tables = [
+            call.args[0]
+            for call in data_source.profiling_sql_aggregates_table.call_args_list
+        ]
+        assert profiled_tables == tables
+        assert field_profile.progress.resumed_tables == 0
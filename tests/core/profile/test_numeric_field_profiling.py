@@ -12,8 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from decimal import Decimal, localcontext
 from unittest.mock import Mock
 
+import numpy as np
+import pytest
+
 from dcs_core.core.datasource.sql_datasource import SQLDataSource
 from dcs_core.core.profiling.numeric_field_profiling import NumericSQLFieldProfiler
 
@@ -88,3 +92,27 @@ class TestNumericSQLFieldProfiler:
         assert field_profile.variance.value is None
         assert field_profile.distinct_count.value is None
         assert field_profile.missing_count.value is None
+
+    @pytest.mark.parametrize("offset", [1e4, 1e5])
+    def test_should_derive_shape_of_large_offset_column(self, offset):
+        values = np.random.default_rng(7).normal(size=100_000).round(6)
+        deviations = values - values.mean()
+        variance = np.mean(deviations**2)
+        # exact numeric sums, as returned by Postgres
+        decimals = [Decimal(offset) + Decimal(str(value)) for value in values]
+        with localcontext() as context:
+            context.prec = 60
+            sums = [sum(value**power for value in decimals) for power in range(1, 5)]
+
+        skewness, kurtosis = NumericSQLFieldProfiler._skewness_and_kurtosis(
+            sums[0], len(decimals), *sums[1:]
+        )
+
+        assert skewness == pytest.approx(np.mean(deviations**3) / variance**1.5)
+        assert kurtosis == pytest.approx(np.mean(deviations**4) / variance**2 - 3)
+        assert (
+            NumericSQLFieldProfiler._skewness_and_kurtosis(
+                *[float(value) for value in [sums[0], len(decimals), *sums[1:]]]
+            )
+            is None
+        )
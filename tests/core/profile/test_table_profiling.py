@@ -0,0 +1,78 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from dcs_core.core.common.models.metric import MetricsType
+from dcs_core.core.profiling.table_profiling import TableSQLProfiler
+from tests.utils import InMemorySQLDataSource
+
+TABLE_NAME = "table_profiling_test"
+AMOUNTS = [1, 2, 2, 3, 3, 3, 4, 10, 25, None]
+
+
+@pytest.fixture
+def data_source():
+    data_source = InMemorySQLDataSource()
+    data_source.connect()
+    data_source.connection.execute(
+        text(f"CREATE TABLE {TABLE_NAME} (city VARCHAR(50), amount INTEGER)")
+    )
+    values = ", ".join(
+        f"('{'pune' if i % 3 else 'delhi'}', {'NULL' if amount is None else amount})"
+        for i, amount in enumerate(AMOUNTS)
+    )
+    data_source.connection.execute(text(f"INSERT INTO {TABLE_NAME} VALUES {values}"))
+    yield data_source
+    data_source.close()
+
+
+class TestTableSQLProfiler:
+    def test_should_profile_distributions_with_one_extra_query(self, data_source):
+        table_metrics = TableSQLProfiler(
+            data_source, TABLE_NAME, {"city": "str", "amount": "int"}
+        ).generate()
+
+        assert len(data_source.queries) == 2
+        amount = table_metrics.distributions["amount"]
+        assert amount.histogram_counts.tolist() == [6, 1, 0, 1, 0, 0, 0, 0, 0, 1]
+        assert amount.histogram_edges.tolist() == np.linspace(1, 25, 11).tolist()
+        assert amount.top_values[0] == "3"
+        assert amount.top_counts[0] == 3
+        city = table_metrics.distributions["city"]
+        assert city.histogram_counts is None
+        assert city.top_values.tolist() == ["pune", "delhi"]
+        assert city.top_counts.tolist() == [6, 4]
+
+    def test_should_derive_skewness_and_kurtosis_from_moments(self, data_source):
+        table_metrics = TableSQLProfiler(
+            data_source, TABLE_NAME, {"amount": "int"}
+        ).generate()
+
+        values = np.array([amount for amount in AMOUNTS if amount is not None])
+        deviations = values - values.mean()
+        variance = np.mean(deviations**2)
+        metrics = {
+            metric.metric_type: metric.value
+            for metric in table_metrics.metrics.values()
+        }
+        assert metrics[MetricsType.SKEWNESS] == pytest.approx(
+            np.mean(deviations**3) / variance**1.5
+        )
+        assert metrics[MetricsType.KURTOSIS] == pytest.approx(
+            np.mean(deviations**4) / variance**2 - 3
+        )
+        assert metrics[MetricsType.STDDEV] == pytest.approx(np.std(values, ddof=1))
+        assert metrics[MetricsType.ROW_COUNT] == 10
@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import sqlite3
 from datetime import datetime, timezone
 from unittest.mock import Mock
 
@@ -32,6 +33,9 @@ from dcs_core.core.common.models.metric import (
 )
 from dcs_core.core.datasource.base import DataSource
 from dcs_core.core.datasource.manager import DataSourceManager
+from dcs_core.core.utils.tracing import InMemoryTracer, SpanKind, set_tracer
+from dcs_core.core.validation.executor import ValidationExecutor
+from dcs_core.core.validation.planner import FusedQueryPlanner
 
 TABLE_NAME = "inspect_metric_test_table"
 
@@ -126,3 +130,81 @@ class TestInspect:
                 str(e)
                 == "Either expression or resource should be provided for a metric"
             )
+
+
+class TestInspectRuns:
+    def test_should_requery_after_a_failed_run(self, tmp_path, mocker):
+        database_path = str(tmp_path / "inspect.sqlite")
+        connection = sqlite3.connect(database_path)
+        connection.execute("CREATE TABLE events (age INTEGER)")
+        connection.execute("INSERT INTO events VALUES (1)")
+        connection.commit()
+        inspect = Inspect()
+        inspect.add_validations_yaml_str(
+            f"""
+data_sources:
+  - name: sqlite_db
+    type: sqlite
+    connection:
+      database: {database_path}
+validations for sqlite_db.events:
+  - max_age:
+      on: max(age)
+  - min_age:
+      on: min(age)
+"""
+        )
+        execute = mocker.patch.object(
+            ValidationExecutor, "execute", side_effect=Exception("worker died")
+        )
+
+        # the fused query runs, then the run fails before the value is used
+        assert inspect.run() is None
+        connection.execute("INSERT INTO events VALUES (100)")
+        connection.commit()
+        connection.close()
+        mocker.stop(execute)
+        mocker.patch.object(FusedQueryPlanner, "execute")
+
+        validations = inspect.run().validations
+
+        values = {info.name: info.value for info in validations.values()}
+        assert values == {"max_age": 100, "min_age": 1}
+        inspect.close()
+
+    def test_should_trace_a_run_under_one_root(self, tmp_path):
+        database_path = str(tmp_path / "inspect.sqlite")
+        connection = sqlite3.connect(database_path)
+        connection.execute("CREATE TABLE events (age INTEGER)")
+        connection.execute("INSERT INTO events VALUES (1)")
+        connection.commit()
+        connection.close()
+        inspect = Inspect()
+        inspect.add_validations_yaml_str(
+            f"""
+data_sources:
+  - name: sqlite_db
+    type: sqlite
+    connection:
+      database: {database_path}
+validations for sqlite_db.events:
+  - max_age:
+      on: max(age)
+"""
+        )
+        tracer = InMemoryTracer()
+        set_tracer(tracer)
+        try:
+            inspect.run()
+        finally:
+            set_tracer(None)
+            inspect.close()
+
+        (run_span,) = tracer.get_spans(SpanKind.RUN)
+        (connect_span,) = tracer.get_spans(SpanKind.DATA_SOURCE)
+        (dataset_span,) = tracer.get_spans(SpanKind.DATASET)
+        (validation_span,) = tracer.get_spans(SpanKind.VALIDATION)
+        assert run_span.parent_id is None
+        assert connect_span.parent_id == run_span.span_id
+        assert dataset_span.parent_id == run_span.span_id
+        assert validation_span.parent_id == dataset_span.span_id
@@ -0,0 +1,86 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import numpy as np
+import pytest
+
+from dcs_core.core.utils.sketches import HyperLogLog, TDigest
+
+
+class TestHyperLogLog:
+    def test_should_estimate_distinct_count(self):
+        sketch = HyperLogLog()
+        sketch.add(value % 50000 for value in range(100000))
+
+        assert sketch.count() == pytest.approx(50000, rel=0.02)
+
+    def test_should_ignore_none_values(self):
+        sketch = HyperLogLog()
+        sketch.add(["a", None, "b", "a", None])
+
+        assert sketch.count() == 2
+
+    def test_should_merge_sketches(self):
+        first, second = HyperLogLog(), HyperLogLog()
+        first.add(range(0, 60000))
+        second.add(range(40000, 100000))
+
+        assert first.merge(second).count() == pytest.approx(100000, rel=0.02)
+
+    def test_should_restore_sketch_from_dict(self):
+        sketch = HyperLogLog()
+        sketch.add(range(1000))
+
+        restored = HyperLogLog.from_dict(sketch.to_dict())
+
+        assert restored.count() == sketch.count()
+
+
+class TestTDigest:
+    def test_should_estimate_quantiles(self):
+        values = np.random.default_rng(7).normal(100, 15, 100000)
+        sketch = TDigest()
+        sketch.add(values)
+
+        for q in [0.2, 0.4, 0.6, 0.8, 0.9]:
+            assert sketch.quantile(q) == pytest.approx(np.quantile(values, q), rel=0.01)
+
+    def test_should_return_none_when_empty(self):
+        assert TDigest().quantile(0.5) is None
+
+    def test_should_add_weighted_values(self):
+        values = [value for value in range(1000) for _ in range(value % 3 + 1)]
+        sketch = TDigest()
+        sketch.add(range(1000), [value % 3 + 1 for value in range(1000)])
+
+        assert sketch.count == len(values)
+        for q in [0.2, 0.5, 0.9]:
+            assert sketch.quantile(q) == pytest.approx(np.quantile(values, q), rel=0.01)
+
+    def test_should_merge_sketches(self):
+        first, second = TDigest(), TDigest()
+        first.add(range(0, 5000))
+        second.add(range(5000, 10000))
+
+        merged = first.merge(second)
+
+        assert merged.count == 10000
+        assert merged.quantile(0.5) == pytest.approx(5000, rel=0.01)
+
+    def test_should_restore_sketch_from_dict(self):
+        sketch = TDigest()
+        sketch.add(range(1000))
+
+        restored = TDigest.from_dict(sketch.to_dict())
+
+        assert restored.quantile(0.9) == sketch.quantile(0.9)
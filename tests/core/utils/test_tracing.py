@@ -0,0 +1,193 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+
+import pytest
+from sqlalchemy import text
+
+from dcs_core.core.utils.tracing import (
+    InMemoryTracer,
+    JsonLinesFileTracer,
+    SpanKind,
+    set_tracer,
+    trace,
+)
+from dcs_core.core.validation.executor import ValidationExecutor
+from dcs_core.core.validation.numeric_validation import MaxValidation, MinValidation
+from dcs_core.core.validation.planner import FusedQueryPlanner
+
+TABLE_NAME = "tracing_test"
+TABLE_COLUMNS = "name VARCHAR(50), age INTEGER"
+TABLE_ROWS = [("thor", 1500), ("loki", 1000)]
+
+
+@pytest.fixture
+def tracer():
+    tracer = InMemoryTracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+class TestTracing:
+    def test_should_not_create_spans_without_tracer(self):
+        with trace(SpanKind.QUERY, "query") as span:
+            assert span is None
+
+    def test_should_nest_spans(self, tracer):
+        with trace(SpanKind.DATASET, "outer") as outer:
+            with trace(SpanKind.QUERY, "inner", query="SELECT 1") as inner:
+                pass
+
+        assert tracer.spans == [inner, outer]
+        assert inner.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert inner.attributes == {"query": "SELECT 1"}
+        assert outer.duration >= inner.duration >= 0
+
+    def test_should_record_error(self, tracer):
+        with pytest.raises(ValueError):
+            with trace(SpanKind.QUERY, "query"):
+                raise ValueError("failed")
+
+        assert tracer.spans[0].error == "ValueError('failed')"
+
+    def test_should_stop_tracing(self, tracer):
+        set_tracer(None)
+        with trace(SpanKind.QUERY, "query"):
+            pass
+
+        assert tracer.spans == []
+
+    def test_should_write_json_lines(self, tmp_path):
+        file_path = tmp_path / "spans.jsonl"
+        set_tracer(JsonLinesFileTracer(str(file_path)))
+        try:
+            with trace(SpanKind.DATASET, "outer", dataset="products"):
+                with trace(SpanKind.QUERY, "inner"):
+                    pass
+        finally:
+            set_tracer(None)
+
+        spans = [json.loads(line) for line in file_path.read_text().splitlines()]
+        assert [span["name"] for span in spans] == ["inner", "outer"]
+        assert spans[0]["parent_id"] == spans[1]["span_id"]
+        assert spans[1]["kind"] == "dataset"
+        assert spans[1]["attributes"] == {"dataset": "products"}
+
+
+class TestValidationTracing:
+    def test_should_trace_queries_of_a_validation(
+        self, tracer, data_source, make_validation
+    ):
+        validation = make_validation(MaxValidation, "max_age", "max(age)", data_source)
+
+        validation.get_validation_info()
+
+        (validation_span,) = tracer.get_spans(SpanKind.VALIDATION)
+        (query_span,) = tracer.get_spans(SpanKind.QUERY)
+        assert validation_span.name == "max_age"
+        assert validation_span.attributes == {
+            "data_source": "test_data_source",
+            "dataset": TABLE_NAME,
+        }
+        assert query_span.parent_id == validation_span.span_id
+        assert query_span.attributes["query"] == data_source.queries[0]
+
+    def test_should_record_error_of_a_failed_validation(
+        self, tracer, data_source, make_validation
+    ):
+        validation = make_validation(
+            MaxValidation, "max_size", "max(size)", data_source
+        )
+
+        assert validation.get_validation_info() is None
+
+        (validation_span,) = tracer.get_spans(SpanKind.VALIDATION)
+        (query_span,) = tracer.get_spans(SpanKind.QUERY)
+        assert validation_span.error is not None
+        assert query_span.error is not None
+
+    def test_should_trace_fused_query_of_a_dataset(
+        self, tracer, data_source, make_validation
+    ):
+        validations = {
+            "min_age": make_validation(
+                MinValidation, "min_age", "min(age)", data_source
+            ),
+            "max_age": make_validation(
+                MaxValidation, "max_age", "max(age)", data_source
+            ),
+        }
+
+        with trace(SpanKind.DATA_SOURCE, "run") as run_span:
+            FusedQueryPlanner().execute(
+                {"test_data_source": {TABLE_NAME: validations}},
+                executor=ValidationExecutor(),
+            )
+
+        (dataset_span,) = tracer.get_spans(SpanKind.DATASET)
+        (query_span,) = tracer.get_spans(SpanKind.QUERY)
+        assert dataset_span.name == "fused_query"
+        assert dataset_span.attributes["validations"] == 2
+        # the span of the worker thread is a child of the span open in the caller
+        assert dataset_span.parent_id == run_span.span_id
+        assert query_span.parent_id == dataset_span.span_id
+
+    def test_should_trace_validations_under_their_dataset(
+        self, tracer, data_source, make_validation
+    ):
+        data_source.connection.execute(text("CREATE TABLE other (age INTEGER)"))
+        validations = {
+            TABLE_NAME: {
+                "min_age": make_validation(
+                    MinValidation, "min_age", "min(age)", data_source
+                ),
+                "max_age": make_validation(
+                    MaxValidation, "max_age", "max(age)", data_source
+                ),
+            },
+            "other": {
+                "max_age": make_validation(
+                    MaxValidation, "max_age", "max(age)", data_source, "other"
+                )
+            },
+        }
+
+        with trace(SpanKind.RUN, "inspect") as run_span:
+            ValidationExecutor(max_concurrency={"test_data_source": 2}).execute(
+                {"test_data_source": validations}
+            )
+
+        dataset_spans = {
+            span.attributes["dataset"]: span
+            for span in tracer.get_spans(SpanKind.DATASET)
+        }
+        assert dataset_spans[TABLE_NAME].attributes["validations"] == 2
+        assert dataset_spans["other"].attributes["validations"] == 1
+        assert all(
+            span.parent_id == run_span.span_id for span in dataset_spans.values()
+        )
+        validation_spans = tracer.get_spans(SpanKind.VALIDATION)
+        assert sorted(
+            (span.attributes["dataset"], span.parent_id) for span in validation_spans
+        ) == sorted(
+            [
+                ("other", dataset_spans["other"].span_id),
+                (TABLE_NAME, dataset_spans[TABLE_NAME].span_id),
+                (TABLE_NAME, dataset_spans[TABLE_NAME].span_id),
+            ]
+        )
+        for span in dataset_spans.values():
+            assert span.duration >= 0
@@ -0,0 +1,120 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from sqlalchemy import text
+
+from dcs_core.core.common.models.validation import Threshold
+from dcs_core.core.validation.cache import ValidationResultCache
+from dcs_core.core.validation.numeric_validation import MaxValidation
+from dcs_core.integrations.storage.local_file import LocalFileValidationStateRepository
+
+TABLE_NAME = "cache_test"
+TABLE_COLUMNS = "id INTEGER, amount INTEGER"
+TABLE_ROWS = [(1, 10), (2, 30)]
+
+
+def _run(
+    make_validation,
+    data_source,
+    state_repository,
+    threshold=None,
+    updated_column=None,
+):
+    validation = make_validation(
+        MaxValidation,
+        "max_amount",
+        "max(amount)",
+        data_source,
+        state_repository=state_repository,
+        cache=True,
+        threshold=threshold,
+        updated_column=updated_column,
+    )
+    data_source.queries.clear()
+    ValidationResultCache().execute(
+        {data_source.data_source_name: {TABLE_NAME: {"max_amount": validation}}}
+    )
+    return validation.get_validation_info()
+
+
+class TestValidationResultCache:
+    def test_should_serve_unchanged_dataset_from_cache(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        first = _run(
+            make_validation, data_source, state_repository, updated_column="id"
+        )
+        assert first.value == 30
+        assert not first.cached
+
+        second = _run(
+            make_validation, data_source, state_repository, updated_column="id"
+        )
+
+        assert second.value == 30
+        assert second.cached
+        assert data_source.queries == [f"SELECT COUNT(*), MAX(id) FROM {TABLE_NAME}"]
+
+    def test_should_not_cache_without_updated_column(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        _run(make_validation, data_source, state_repository)
+        # an in-place update keeps the row count
+        data_source.connection.execute(
+            text(f"UPDATE {TABLE_NAME} SET amount = 70 WHERE id = 1")
+        )
+
+        validation_info = _run(make_validation, data_source, state_repository)
+
+        assert validation_info.value == 70
+        assert not validation_info.cached
+        assert data_source.queries == [f"SELECT MAX(amount) FROM {TABLE_NAME}"]
+
+    def test_should_rerun_validation_when_dataset_changes(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        _run(make_validation, data_source, state_repository, updated_column="id")
+        data_source.connection.execute(text(f"INSERT INTO {TABLE_NAME} VALUES (3, 50)"))
+
+        validation_info = _run(
+            make_validation, data_source, state_repository, updated_column="id"
+        )
+
+        assert validation_info.value == 50
+        assert not validation_info.cached
+
+    def test_should_apply_current_threshold_to_cached_result(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        _run(
+            make_validation,
+            data_source,
+            state_repository,
+            threshold=Threshold(lt=100),
+            updated_column="id",
+        )
+
+        validation_info = _run(
+            make_validation,
+            data_source,
+            state_repository,
+            threshold=Threshold(lt=20),
+            updated_column="id",
+        )
+
+        assert validation_info.cached
+        assert validation_info.is_valid is False
@@ -0,0 +1,99 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import threading
+import time
+from unittest.mock import Mock
+
+from dcs_core.core.validation.base import Validation
+from dcs_core.core.validation.executor import ValidationExecutor
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {}
+        self.max_running = {}
+
+    def task(self, data_source_name: str, value):
+        def run():
+            with self.lock:
+                self.running[data_source_name] = (
+                    self.running.get(data_source_name, 0) + 1
+                )
+                self.max_running[data_source_name] = max(
+                    self.max_running.get(data_source_name, 0),
+                    self.running[data_source_name],
+                )
+            time.sleep(0.01)
+            with self.lock:
+                self.running[data_source_name] -= 1
+            return value
+
+        return data_source_name, run
+
+
+class TestValidationExecutor:
+    def test_should_return_results_in_task_order(self):
+        tracker = ConcurrencyTracker()
+        executor = ValidationExecutor(max_concurrency={"ds_a": 3, "ds_b": 2})
+        tasks = [
+            tracker.task("ds_a" if index % 3 else "ds_b", index) for index in range(20)
+        ]
+
+        assert executor.run(tasks) == list(range(20))
+
+    def test_should_limit_concurrency_per_data_source(self):
+        tracker = ConcurrencyTracker()
+        executor = ValidationExecutor(max_workers=8, max_concurrency={"ds_a": 2})
+        tasks = [tracker.task("ds_a", index) for index in range(10)]
+        tasks += [tracker.task("ds_b", index) for index in range(10)]
+
+        executor.run(tasks)
+
+        assert tracker.max_running["ds_a"] <= 2
+        assert tracker.max_running["ds_b"] == 1
+
+    def test_should_run_data_sources_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5)
+        executor = ValidationExecutor(max_workers=2)
+
+        executor.run(
+            [("ds_a", barrier.wait), ("ds_a", lambda: None), ("ds_b", barrier.wait)]
+        )
+
+        assert not barrier.broken
+
+    def test_should_execute_validations_by_identity(self):
+        validations = {}
+        for data_source_name in ["ds_a", "ds_b"]:
+            for name in ["v1", "v2"]:
+                validation = Mock(spec=Validation)
+                validation.data_source = Mock()
+                validation.data_source.data_source_name = data_source_name
+                validation.get_validation_identity.return_value = (
+                    f"{data_source_name}.{name}"
+                )
+                validation.get_validation_info.return_value = name
+                validations.setdefault(data_source_name, {}).setdefault("table", {})[
+                    name
+                ] = validation
+
+        validation_infos = ValidationExecutor().execute(validations)
+
+        assert list(validation_infos.items()) == [
+            ("ds_a.v1", "v1"),
+            ("ds_a.v2", "v2"),
+            ("ds_b.v1", "v1"),
+            ("ds_b.v2", "v2"),
+        ]
@@ -0,0 +1,155 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+
+import pytest
+
+from dcs_core.core.validation.completeness_validation import PercentageNullValidation
+from dcs_core.core.validation.numeric_validation import (
+    AvgValidation,
+    MaxValidation,
+    StdDevValidation,
+)
+from dcs_core.core.validation.uniqueness_validation import CountDistinctValidation
+from dcs_core.integrations.storage.local_file import LocalFileValidationStateRepository
+from tests.utils import insert_rows
+
+TABLE_NAME = "incremental_test"
+TABLE_COLUMNS = "id INTEGER, amount INTEGER"
+TABLE_ROWS = [(1, 10), (2, None), (3, 30)]
+
+
+class TestIncrementalValidation:
+    @pytest.mark.parametrize(
+        "validation_class, on, first_value, second_value",
+        [
+            (AvgValidation, "avg(amount)", 20.0, 32.5),
+            (MaxValidation, "max(amount)", 30, 60),
+            (StdDevValidation, "stddev(amount)", 14.14, 20.62),
+            (PercentageNullValidation, "percent_null(amount)", 33.33, 33.33),
+        ],
+    )
+    def test_should_merge_new_rows_into_stored_state(
+        self,
+        data_source,
+        tmp_path,
+        validation_class,
+        on,
+        first_value,
+        second_value,
+        make_validation,
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        validation = make_validation(
+            validation_class,
+            "incremental",
+            on,
+            data_source,
+            state_repository=state_repository,
+            watermark="id",
+        )
+
+        assert validation.get_validation_info().value == first_value
+
+        insert_rows(data_source, TABLE_NAME, [(4, 30), (5, None), (6, 60)])
+        data_source.queries.clear()
+        assert validation.get_validation_info().value == second_value
+        assert data_source.queries[0].endswith("WHERE id > 3")
+
+        state = state_repository.get_state(validation.get_validation_identity())
+        assert state["watermark"] == 6
+
+    def test_should_keep_state_when_there_are_no_new_rows(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        validation = make_validation(
+            AvgValidation,
+            "incremental",
+            "avg(amount)",
+            data_source,
+            state_repository=state_repository,
+            watermark="id",
+        )
+
+        assert validation.get_validation_info().value == 20.0
+        assert validation.get_validation_info().value == 20.0
+        state = state_repository.get_state(validation.get_validation_identity())
+        assert state["watermark"] == 3
+        assert state["values"] == [40, 2]
+
+    def test_should_rescan_when_state_is_unreadable(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        validation = make_validation(
+            AvgValidation,
+            "incremental",
+            "avg(amount)",
+            data_source,
+            state_repository=state_repository,
+            watermark="id",
+        )
+        assert validation.get_validation_info().value == 20.0
+        state_file = state_repository._state_file_name(
+            validation.get_validation_identity()
+        )
+        # a write interrupted before the atomic writes left truncated JSON
+        with open(state_file, "w") as file:
+            file.write('{"watermark": 3, "val')
+
+        assert validation.get_validation_info().value == 20.0
+        assert state_repository.get_state(validation.get_validation_identity())[
+            "values"
+        ] == [40, 2]
+        assert os.listdir(tmp_path / "validation_states") == [
+            os.path.basename(state_file)
+        ]
+
+    def test_should_rescan_when_filter_changes(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        validation = make_validation(
+            AvgValidation,
+            "incremental",
+            "avg(amount)",
+            data_source,
+            state_repository=state_repository,
+            watermark="id",
+        )
+        assert validation.get_validation_info().value == 20.0
+
+        validation.where_filter = "amount > 10"
+        data_source.queries.clear()
+
+        assert validation.get_validation_info().value == 30.0
+        assert data_source.queries[0].endswith("WHERE (amount > 10)")
+
+    def test_should_scan_whole_table_when_validation_is_not_mergeable(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        validation = make_validation(
+            CountDistinctValidation,
+            "incremental",
+            "count_distinct(amount)",
+            data_source,
+            state_repository=state_repository,
+            watermark="id",
+        )
+
+        assert not validation.is_incremental
+        assert validation.get_validation_info().value == 2
+        assert state_repository.get_state(validation.get_validation_identity()) is None
@@ -0,0 +1,75 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from dcs_core.core.inspect import InspectOutput
+from dcs_core.core.validation.numeric_validation import MaxValidation, MinValidation
+from dcs_core.core.validation.planner import FusedQueryPlanner
+from dcs_core.core.validation.uniqueness_validation import CountDuplicateValidation
+
+TABLE_NAME = "instrumentation_test"
+TABLE_COLUMNS = "name VARCHAR(50), age INTEGER"
+TABLE_ROWS = [("thor", 1500), ("loki", 1000), ("thor", 40)]
+
+
+class TestValidationInstrumentation:
+    def test_should_record_queries_of_a_validation(self, data_source, make_validation):
+        validation = make_validation(
+            CountDuplicateValidation, "duplicates", "count_duplicate(name)", data_source
+        )
+
+        instrumentation = validation.get_validation_info().instrumentation
+
+        assert instrumentation.query_count == len(data_source.queries) == 1
+        assert instrumentation.queries[0].text == data_source.queries[0]
+        assert instrumentation.queries[0].rows == 1
+        assert instrumentation.time_taken >= instrumentation.queries[0].time_taken
+
+    def test_should_share_fused_query_between_validations(
+        self, data_source, make_validation
+    ):
+        validations = {
+            "min_age": make_validation(
+                MinValidation, "min_age", "min(age)", data_source
+            ),
+            "max_age": make_validation(
+                MaxValidation, "max_age", "max(age)", data_source
+            ),
+        }
+        FusedQueryPlanner().execute({"test_data_source": {TABLE_NAME: validations}})
+
+        for validation in validations.values():
+            instrumentation = validation.get_validation_info().instrumentation
+            assert instrumentation.query_count == 1
+            assert instrumentation.queries[0].shared_by == 2
+        # the shared query is only reported by the run it served
+        instrumentation = validations["min_age"].get_validation_info().instrumentation
+        assert [query.shared_by for query in instrumentation.queries] == [1]
+
+    def test_should_sort_timing_report_by_cost(self, data_source, make_validation):
+        validations = [
+            make_validation(MinValidation, "min_age", "min(age)", data_source),
+            make_validation(MaxValidation, "max_age", "max(age)", data_source),
+        ]
+        validation_infos = {
+            validation.name: validation.get_validation_info()
+            for validation in validations
+        }
+        validation_infos["min_age"].instrumentation.time_taken = 1.0
+        validation_infos["max_age"].instrumentation.time_taken = 2.0
+
+        report = InspectOutput(validations=validation_infos).get_timing_report()
+
+        assert [validation_info.name for validation_info in report] == [
+            "max_age",
+            "min_age",
+        ]
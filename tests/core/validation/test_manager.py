@@ -0,0 +1,99 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from unittest.mock import Mock
+
+from dcs_core.core.configuration.configuration_parser import (
+    load_configuration_from_yaml_str,
+)
+from dcs_core.core.datasource.manager import DataSourceManager
+from dcs_core.core.validation.manager import ValidationManager
+from tests.utils import InMemorySQLDataSource
+
+CONFIGURATION = """
+data_sources:
+  - name: "test"
+    type: "postgres"
+    connection:
+      host: "localhost"
+      port: 5432
+validations for test.customers:
+  - customers_min_age:
+      on: min(age)
+"""
+
+
+def _validation_manager(data_source):
+    configuration = load_configuration_from_yaml_str(CONFIGURATION)
+    data_source_manager = Mock(spec=DataSourceManager)
+    data_source_manager.get_data_source.return_value = data_source
+    data_source_manager.get_data_sources = {"test": data_source}
+    return ValidationManager(configuration, data_source_manager)
+
+
+class TestValidationManager:
+    def test_should_reuse_validations_of_an_unchanged_configuration(self):
+        validation_manager = _validation_manager(InMemorySQLDataSource())
+        validation_manager.build_validations()
+        validation = validation_manager.get_validation(
+            "test", "customers", "customers_min_age"
+        )
+        plan_key = validation_manager.plan_key
+
+        validation_manager.build_validations()
+
+        assert plan_key is not None
+        assert validation_manager.plan_key == plan_key
+        assert (
+            validation_manager.get_validation("test", "customers", "customers_min_age")
+            is validation
+        )
+
+    def test_should_rebuild_validations_on_new_data_source(self):
+        validation_manager = _validation_manager(InMemorySQLDataSource())
+        validation_manager.build_validations()
+        plan_key = validation_manager.plan_key
+
+        data_source = InMemorySQLDataSource()
+        validation_manager.data_source_manager.get_data_source.return_value = (
+            data_source
+        )
+        validation_manager.data_source_manager.get_data_sources = {"test": data_source}
+        validation_manager.build_validations()
+
+        assert validation_manager.plan_key != plan_key
+        validation = validation_manager.get_validation(
+            "test", "customers", "customers_min_age"
+        )
+        assert validation.data_source is data_source
+
+    def test_should_drop_validations_removed_from_configuration(self):
+        validation_manager = _validation_manager(InMemorySQLDataSource())
+        validation_manager.build_validations()
+        validation_manager.set_validation_configs(
+            load_configuration_from_yaml_str(
+                CONFIGURATION.replace("customers", "orders")
+            ).validations
+        )
+
+        validation_manager.build_validations()
+
+        assert validation_manager.get_validations == {
+            "test": {
+                "orders": {
+                    "orders_min_age": validation_manager.get_validation(
+                        "test", "orders", "orders_min_age"
+                    )
+                }
+            }
+        }
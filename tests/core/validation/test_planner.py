@@ -0,0 +1,354 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from dcs_core.core.common.models.configuration import DataSourceLanguageSupport
+from dcs_core.core.validation.completeness_validation import (
+    CountNullValidation,
+    PercentageNullValidation,
+)
+from dcs_core.core.validation.numeric_validation import MaxValidation, MinValidation
+from dcs_core.core.validation.planner import FusedQueryPlanner, SearchRequestBatcher
+from dcs_core.core.validation.reliability_validation import (
+    CountDocumentsValidation,
+    CountRowValidation,
+)
+from dcs_core.core.validation.uniqueness_validation import CountDuplicateValidation
+from dcs_core.integrations.databases.opensearch import OpenSearchDataSource
+from tests.utils import InMemorySQLDataSource
+
+TABLE_NAME = "planner_test"
+TABLE_COLUMNS = "name VARCHAR(50), age INTEGER"
+TABLE_ROWS = [("thor", 1500), ("loki", None), ("hulk", 40), ("thor", 35)]
+
+
+class TestFusedQueryPlanner:
+    def test_should_fuse_validations_on_same_dataset_and_filter(
+        self, data_source, make_validation
+    ):
+        validations = {
+            "min_age": make_validation(
+                MinValidation, "min_age", "min(age)", data_source
+            ),
+            "max_age": make_validation(
+                MaxValidation, "max_age", "max(age)", data_source
+            ),
+            "rows": make_validation(
+                CountRowValidation, "rows", "count_rows", data_source
+            ),
+            "null_pct": make_validation(
+                PercentageNullValidation, "null_pct", "percent_null(age)", data_source
+            ),
+            "filtered_null": make_validation(
+                CountNullValidation,
+                "filtered_null",
+                "count_null(age)",
+                data_source,
+                where="name = 'loki'",
+            ),
+        }
+        fused_queries = FusedQueryPlanner().plan(
+            {"test_data_source": {TABLE_NAME: validations}}
+        )
+
+        assert len(fused_queries) == 2
+        assert [v.name for v, _ in fused_queries[0].targets] == [
+            "min_age",
+            "max_age",
+            "rows",
+            "null_pct",
+        ]
+        # COUNT(*) is shared between the row count and the null percentage
+        assert fused_queries[0].expressions.count("COUNT(*)") == 1
+        assert fused_queries[1].where_filter == "name = 'loki'"
+
+    def test_should_give_fused_values_back_to_validations(
+        self, data_source, make_validation
+    ):
+        validations = {
+            "min_age": make_validation(
+                MinValidation, "min_age", "min(age)", data_source
+            ),
+            "max_age": make_validation(
+                MaxValidation, "max_age", "max(age)", data_source
+            ),
+            "rows": make_validation(
+                CountRowValidation, "rows", "count_rows", data_source
+            ),
+            "null_pct": make_validation(
+                PercentageNullValidation, "null_pct", "percent_null(age)", data_source
+            ),
+        }
+        fused_count = FusedQueryPlanner().execute(
+            {"test_data_source": {TABLE_NAME: validations}}
+        )
+
+        assert fused_count == 4
+        assert len(data_source.queries) == 1
+        values = {
+            name: validation.get_validation_info().value
+            for name, validation in validations.items()
+        }
+        assert values == {"min_age": 35, "max_age": 1500, "rows": 4, "null_pct": 25.0}
+        assert len(data_source.queries) == 1
+
+    def test_should_skip_validations_that_can_not_be_fused(
+        self, data_source, make_validation
+    ):
+        validations = {
+            "rows": make_validation(
+                CountRowValidation, "rows", "count_rows", data_source
+            ),
+            "duplicates": make_validation(
+                CountDuplicateValidation,
+                "duplicates",
+                "count_duplicate(name)",
+                data_source,
+            ),
+        }
+        fused_queries = FusedQueryPlanner().plan(
+            {"test_data_source": {TABLE_NAME: validations}}
+        )
+
+        assert len(fused_queries) == 1
+        assert len(fused_queries[0].targets) == 1
+
+    def test_should_split_fused_query_on_select_list_limit(
+        self, data_source, mocker, make_validation
+    ):
+        mocker.patch.object(InMemorySQLDataSource, "MAX_SELECT_COLUMNS", 2)
+        validations = {
+            "min_age": make_validation(
+                MinValidation, "min_age", "min(age)", data_source
+            ),
+            "max_age": make_validation(
+                MaxValidation, "max_age", "max(age)", data_source
+            ),
+            "null_pct": make_validation(
+                PercentageNullValidation, "null_pct", "percent_null(age)", data_source
+            ),
+        }
+        fused_queries = FusedQueryPlanner().plan(
+            {"test_data_source": {TABLE_NAME: validations}}
+        )
+
+        assert [len(q.expressions) for q in fused_queries] == [2, 2]
+
+    def test_should_cache_fused_row_count_for_the_run(
+        self, data_source, make_validation
+    ):
+        data_source.start_run()
+        validations = {
+            "min_age": make_validation(
+                MinValidation, "min_age", "min(age)", data_source
+            ),
+            "rows": make_validation(
+                CountRowValidation, "rows", "count_rows", data_source
+            ),
+        }
+        FusedQueryPlanner().execute({"test_data_source": {TABLE_NAME: validations}})
+
+        assert data_source.query_get_row_count(table=TABLE_NAME) == 4
+        assert len(data_source.queries) == 1
+
+    def test_should_fall_back_to_own_query_when_fused_query_fails(
+        self, data_source, make_validation
+    ):
+        validations = {
+            "min_age": make_validation(
+                MinValidation, "min_age", "min(age)", data_source
+            ),
+            "max_age": make_validation(
+                MaxValidation, "max_age", "max(unknown_column)", data_source
+            ),
+        }
+        fused_count = FusedQueryPlanner().execute(
+            {"test_data_source": {TABLE_NAME: validations}}
+        )
+
+        assert fused_count == 0
+        assert validations["min_age"].get_validation_info().value == 35
+
+    def test_should_reuse_plan_of_an_earlier_run(
+        self, data_source, mocker, make_validation
+    ):
+        validations = {
+            TABLE_NAME: {
+                "min_age": make_validation(
+                    MinValidation, "min_age", "min(age)", data_source
+                ),
+                "max_age": make_validation(
+                    MaxValidation, "max_age", "max(age)", data_source
+                ),
+            }
+        }
+        planner = FusedQueryPlanner()
+        plan = mocker.spy(planner, "plan")
+
+        for _ in range(2):
+            assert planner.execute({"ds": validations}, plan_key="key") == 2
+            assert (
+                validations[TABLE_NAME]["max_age"].get_validation_info().value == 1500
+            )
+        assert plan.call_count == 1
+
+        # a validation served from the result cache is left out of a new plan
+        validations[TABLE_NAME]["max_age"].set_cached_validation_info(Mock())
+        assert planner.execute({"ds": validations}, plan_key="key") == 0
+        assert plan.call_count == 2
+
+
+@pytest.fixture
+def search_data_source():
+    data_source = OpenSearchDataSource("test_search_data_source", {})
+    data_source.language_support = DataSourceLanguageSupport.DSL_ES
+    data_source.client = Mock()
+    return data_source
+
+
+class TestSearchRequestBatcher:
+    def test_should_combine_aggregations_of_an_index_in_one_search(
+        self, search_data_source, make_validation
+    ):
+        max_validation = make_validation(
+            MaxValidation, "max_age", "max(age)", search_data_source
+        )
+        null_count = make_validation(
+            CountNullValidation, "null_age", "count_null(age)", search_data_source
+        )
+        document_count = make_validation(
+            CountDocumentsValidation, "documents", "count_documents", search_data_source
+        )
+        search_data_source.client.msearch.return_value = {
+            "responses": [
+                {
+                    "aggregations": {
+                        "agg_0": {"value": 1500},
+                        "agg_1": {"doc_count": 1},
+                        "agg_2": {"doc_count": 4},
+                    }
+                }
+            ]
+        }
+
+        served = SearchRequestBatcher().execute(
+            {
+                "test_search_data_source": {
+                    TABLE_NAME: {
+                        "max_age": max_validation,
+                        "null_age": null_count,
+                        "documents": document_count,
+                    }
+                }
+            }
+        )
+
+        assert served == 3
+        search_data_source.client.msearch.assert_called_once()
+        header, body = search_data_source.client.msearch.call_args.kwargs["body"]
+        assert header == {"index": TABLE_NAME}
+        assert body == {
+            "size": 0,
+            "aggs": {
+                "agg_0": {"max": {"field": "age"}},
+                "agg_1": {"missing": {"field": "age"}},
+                "agg_2": {"filter": {"match_all": {}}},
+            },
+        }
+        assert max_validation.get_validation_info().value == 1500
+        assert null_count.get_validation_info().value == 1
+        assert document_count.get_validation_info().value == 4
+        search_data_source.client.search.assert_not_called()
+
+    def test_should_send_one_search_per_filter(
+        self, search_data_source, make_validation
+    ):
+        min_validation = make_validation(
+            MinValidation, "min_age", "min(age)", search_data_source
+        )
+        max_validation = make_validation(
+            MaxValidation,
+            "max_age",
+            "max(age)",
+            search_data_source,
+            where='{"term": {"name": "thor"}}',
+        )
+        search_data_source.client.msearch.return_value = {
+            "responses": [
+                {"error": {"type": "search_phase_execution_exception"}},
+                {"aggregations": {"agg_0": {"value": 1500}}},
+            ]
+        }
+        search_data_source.client.search.return_value = {
+            "aggregations": {"min_value": {"value": 35}}
+        }
+
+        served = SearchRequestBatcher().execute(
+            {
+                "test_search_data_source": {
+                    TABLE_NAME: {"min_age": min_validation, "max_age": max_validation}
+                }
+            }
+        )
+
+        assert served == 1
+        body = search_data_source.client.msearch.call_args.kwargs["body"]
+        assert body[3]["query"] == {"term": {"name": "thor"}}
+        assert min_validation.get_validation_info().value == 35
+        assert max_validation.get_validation_info().value == 1500
+        search_data_source.client.search.assert_called_once()
+
+    def test_should_await_batched_searches_on_async_client(
+        self, search_data_source, make_validation
+    ):
+        max_validation = make_validation(
+            MaxValidation, "max_age", "max(age)", search_data_source
+        )
+        search_data_source.async_client = AsyncMock()
+        search_data_source.async_client.msearch.return_value = {
+            "responses": [{"aggregations": {"agg_0": {"value": 1500}}}]
+        }
+
+        served = asyncio.run(
+            SearchRequestBatcher().execute_async(
+                {"test_search_data_source": {TABLE_NAME: {"max_age": max_validation}}}
+            )
+        )
+
+        assert served == 1
+        search_data_source.async_client.msearch.assert_awaited_once()
+        search_data_source.client.msearch.assert_not_called()
+        assert max_validation.get_validation_info().value == 1500
+
+    def test_should_use_sync_client_without_async_client(
+        self, search_data_source, make_validation
+    ):
+        max_validation = make_validation(
+            MaxValidation, "max_age", "max(age)", search_data_source
+        )
+        search_data_source.client.msearch.return_value = {
+            "responses": [{"aggregations": {"agg_0": {"value": 1500}}}]
+        }
+
+        served = asyncio.run(
+            SearchRequestBatcher().execute_async(
+                {"test_search_data_source": {TABLE_NAME: {"max_age": max_validation}}}
+            )
+        )
+
+        assert served == 1
+        search_data_source.client.msearch.assert_called_once()
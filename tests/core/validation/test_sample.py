@@ -0,0 +1,124 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from dcs_core.core.common.models.validation import Threshold
+from dcs_core.core.validation.completeness_validation import (
+    CountNullValidation,
+    PercentageNullValidation,
+)
+from dcs_core.core.validation.numeric_validation import AvgValidation, MaxValidation
+
+TABLE_NAME = "sample_test"
+TABLE_COLUMNS = "id INTEGER, amount INTEGER"
+TABLE_ROWS = [
+    (row_id, None if row_id % 10 == 0 else row_id % 100) for row_id in range(1, 20001)
+]
+
+
+class TestSampledValidation:
+    def test_should_estimate_percentage_with_confidence_interval(
+        self, data_source, make_validation
+    ):
+        validation = make_validation(
+            PercentageNullValidation,
+            "sampled",
+            "percent_null(amount)",
+            data_source,
+            sample=10,
+        )
+
+        validation_info = validation.get_validation_info()
+
+        assert "sampled_rows" in data_source.queries[0]
+        assert validation_info.value == pytest.approx(10, abs=4)
+        lower, upper = validation_info.confidence_interval
+        assert lower < validation_info.value < upper
+
+    def test_should_scale_count_by_sampled_fraction(self, data_source, make_validation):
+        validation = make_validation(
+            CountNullValidation, "sampled", "count_null(amount)", data_source, sample=10
+        )
+
+        validation_info = validation.get_validation_info()
+
+        assert validation_info.value == pytest.approx(2000, abs=800)
+        lower, upper = validation_info.confidence_interval
+        assert lower < validation_info.value < upper
+
+    def test_should_estimate_average_with_confidence_interval(
+        self, data_source, make_validation
+    ):
+        validation = make_validation(
+            AvgValidation, "sampled", "avg(amount)", data_source, sample=10
+        )
+
+        validation_info = validation.get_validation_info()
+
+        assert validation_info.value == pytest.approx(50, abs=5)
+        lower, upper = validation_info.confidence_interval
+        assert lower < validation_info.value < upper
+
+    def test_should_not_collapse_interval_when_no_row_matches(
+        self, data_source, make_validation
+    ):
+        percentage = make_validation(
+            PercentageNullValidation,
+            "sampled",
+            "percent_null(amount)",
+            data_source,
+            sample=10,
+        )
+        count = make_validation(
+            CountNullValidation, "sampled", "count_null(amount)", data_source, sample=10
+        )
+
+        assert percentage.sampled_metric_value((0, 1000), 0.1) == (0, (0.0, 0.38))
+        assert percentage.sampled_metric_value((1000, 1000), 0.1) == (
+            100.0,
+            (99.62, 100.0),
+        )
+        assert percentage.sampled_metric_value((100, 1000), 0.1)[1] == (8.29, 12.02)
+        assert count.sampled_metric_value((0,), 0.1) == (0, (0.0, 34.57))
+
+    def test_should_run_exact_query_when_metric_can_not_be_sampled(
+        self, data_source, make_validation
+    ):
+        validation = make_validation(
+            MaxValidation, "sampled", "max(amount)", data_source, sample=10
+        )
+
+        validation_info = validation.get_validation_info()
+
+        assert validation_info.value == 99
+        assert validation_info.confidence_interval is None
+
+    def test_should_fail_threshold_only_when_whole_interval_violates_it(
+        self, data_source, make_validation
+    ):
+        validation = make_validation(
+            PercentageNullValidation,
+            "sampled",
+            "percent_null(amount)",
+            data_source,
+            sample=10,
+            threshold=Threshold(lt=10),
+        )
+
+        assert validation._validate_threshold(10.5, (9.5, 11.5)) == (True, None)
+        assert validation._validate_threshold(12.5, (11.5, 13.5)) == (
+            False,
+            "Confidence interval [11.5, 13.5] Greater than or equal to threshold "
+            "value of 10",
+        )
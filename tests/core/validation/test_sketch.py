@@ -0,0 +1,145 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from dcs_core.core.validation.numeric_validation import (
+    Percentile20Validation,
+    Percentile40Validation,
+    Percentile60Validation,
+    Percentile80Validation,
+    Percentile90Validation,
+)
+from dcs_core.core.validation.uniqueness_validation import CountDistinctValidation
+from dcs_core.integrations.storage.local_file import LocalFileValidationStateRepository
+from tests.utils import insert_rows
+
+TABLE_NAME = "sketch_test"
+TABLE_COLUMNS = "id INTEGER, amount INTEGER"
+TABLE_ROWS = [(row_id, row_id % 100) for row_id in range(1, 1001)]
+
+
+class TestApproximateValidation:
+    def test_should_use_the_approximate_aggregate_of_the_database(
+        self, data_source, mocker, make_validation
+    ):
+        mocker.patch.object(
+            data_source,
+            "approximate_distinct_count_aggregate",
+            return_value="COUNT(DISTINCT amount)",
+        )
+        fetch_batches = mocker.spy(data_source, "fetch_batches")
+        validation = make_validation(
+            CountDistinctValidation,
+            "count_distinct(amount)",
+            "count_distinct(amount)",
+            data_source,
+            approximate=True,
+        )
+
+        assert validation.get_validation_info().value == 100
+        assert data_source.queries == [
+            f"SELECT COUNT(DISTINCT amount) AS agg_0 FROM {TABLE_NAME}"
+        ]
+        fetch_batches.assert_not_called()
+
+    def test_should_fall_back_to_the_exact_query(
+        self, data_source, mocker, make_validation
+    ):
+        fetch_batches = mocker.spy(data_source, "fetch_batches")
+        validation = make_validation(
+            CountDistinctValidation,
+            "count_distinct(amount)",
+            "count_distinct(amount)",
+            data_source,
+            approximate=True,
+        )
+
+        assert validation.get_validation_info().value == 100
+        assert data_source.queries == [
+            f"SELECT COUNT(DISTINCT amount) FROM {TABLE_NAME}"
+        ]
+        fetch_batches.assert_not_called()
+
+    def test_should_answer_all_percentiles_from_one_sketch(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        data_source.start_run()
+        validations = [
+            make_validation(
+                validation_class,
+                on,
+                on,
+                data_source,
+                approximate=True,
+                watermark="id",
+                state_repository=state_repository,
+            )
+            for validation_class, on in [
+                (Percentile20Validation, "percentile_20(amount)"),
+                (Percentile40Validation, "percentile_40(amount)"),
+                (Percentile60Validation, "percentile_60(amount)"),
+                (Percentile80Validation, "percentile_80(amount)"),
+                (Percentile90Validation, "percentile_90(amount)"),
+            ]
+        ]
+
+        values = [validation.get_validation_info().value for validation in validations]
+
+        assert values == pytest.approx([20, 40, 60, 80, 90], abs=1.5)
+        # only the distinct values are read, with their row count
+        assert data_source.queries == [
+            f"SELECT amount, COUNT(*), MAX(id) FROM {TABLE_NAME} GROUP BY amount"
+        ]
+        data_source.end_run()
+
+    def test_should_merge_new_rows_into_stored_sketch(
+        self, data_source, tmp_path, make_validation
+    ):
+        state_repository = LocalFileValidationStateRepository(str(tmp_path))
+        validation = make_validation(
+            CountDistinctValidation,
+            "count_distinct(id)",
+            "count_distinct(id)",
+            data_source,
+            approximate=True,
+            watermark="id",
+            state_repository=state_repository,
+        )
+        assert validation.get_validation_info().value == pytest.approx(1000, rel=0.02)
+
+        insert_rows(
+            data_source,
+            TABLE_NAME,
+            [(row_id, row_id % 100) for row_id in range(1001, 1501)],
+        )
+        data_source.queries.clear()
+        validation = make_validation(
+            CountDistinctValidation,
+            "count_distinct(id)",
+            "count_distinct(id)",
+            data_source,
+            approximate=True,
+            watermark="id",
+            state_repository=state_repository,
+        )
+
+        assert validation.get_validation_info().value == pytest.approx(1500, rel=0.02)
+        assert "id > 1000" in data_source.queries[0]
+
+    def test_should_lock_each_sketch_separately(self, data_source):
+        first = data_source.sketch_lock(("first", "id"))
+
+        assert data_source.sketch_lock(("first", "id")) is first
+        assert data_source.sketch_lock(("second", "id")) is not first
@@ -0,0 +1,170 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import stat
+from datetime import datetime
+
+import pytest
+
+from dcs_core.core.common.models.validation import (
+    ValidationFunction,
+    ValidationInfo,
+    ValidationInstrumentation,
+)
+from dcs_core.core.inspect import InspectOutput
+from dcs_core.report.openmetrics import OpenMetricsTextfileExporter
+
+LABELS = (
+    'validation="{name}",data_source="product_db",dataset="products",'
+    'validation_function="{function}"'
+)
+
+
+def _validation_info(
+    name: str,
+    validation_function: ValidationFunction,
+    value,
+    is_valid=None,
+    time_taken: float = 0.2,
+):
+    return ValidationInfo(
+        name=name,
+        identity=f"product_db.products.{name}",
+        data_source_name="product_db",
+        dataset="products",
+        validation_function=validation_function,
+        value=value,
+        timestamp=datetime.utcnow(),
+        is_valid=is_valid,
+        instrumentation=ValidationInstrumentation(time_taken=time_taken),
+    )
+
+
+@pytest.fixture
+def inspect_output():
+    return InspectOutput(
+        validations={
+            "product_db.products.count_of_products": _validation_info(
+                "count_of_products", ValidationFunction.COUNT_ROWS, 10, is_valid=True
+            ),
+            "product_db.products.max_price": _validation_info(
+                "max_price", ValidationFunction.MAX, 300.5, is_valid=False, time_taken=3
+            ),
+            "product_db.products.min_price": _validation_info(
+                "min_price", ValidationFunction.MIN, 50
+            ),
+            "product_db.products.failed": None,
+        }
+    )
+
+
+def _samples(text: str):
+    return {
+        line.rsplit(" ", 1)[0]: line.rsplit(" ", 1)[1]
+        for line in text.splitlines()
+        if not line.startswith("#")
+    }
+
+
+class TestOpenMetricsTextfileExporter:
+    def test_should_generate_validation_values_and_states(self, inspect_output):
+        exporter = OpenMetricsTextfileExporter("metrics.prom")
+
+        text = exporter.generate(inspect_output, run_duration=4.5)
+
+        samples = _samples(text)
+        max_labels = LABELS.format(name="max_price", function="max")
+        min_labels = LABELS.format(name="min_price", function="min")
+        assert samples[f"dcs_validation_value{{{max_labels}}}"] == "300.5"
+        assert samples[f"dcs_validation_valid{{{max_labels}}}"] == "0.0"
+        assert samples[f"dcs_validation_value{{{min_labels}}}"] == "50.0"
+        assert f"dcs_validation_valid{{{min_labels}}}" not in samples
+        assert samples['dcs_run_validations{state="passed"}'] == "1.0"
+        assert samples['dcs_run_validations{state="failed"}'] == "1.0"
+        assert samples['dcs_run_validations{state="unchecked"}'] == "1.0"
+        assert samples['dcs_run_validations{state="errored"}'] == "1.0"
+        assert samples["dcs_run_duration_seconds"] == "4.5"
+        assert "# TYPE dcs_validation_duration_seconds histogram" in text
+        assert text.endswith("# EOF\n")
+
+    def test_should_accumulate_latency_histograms(self, inspect_output):
+        exporter = OpenMetricsTextfileExporter("metrics.prom", buckets=[1.0, 5.0])
+        exporter.observe(inspect_output)
+        exporter.observe(inspect_output)
+
+        samples = _samples(exporter.generate(inspect_output))
+
+        max_labels = LABELS.format(name="max_price", function="max")
+        histogram = "dcs_validation_duration_seconds"
+        assert samples[f'{histogram}_bucket{{{max_labels},le="1.0"}}'] == "0.0"
+        assert samples[f'{histogram}_bucket{{{max_labels},le="5.0"}}'] == "2.0"
+        assert samples[f'{histogram}_bucket{{{max_labels},le="+Inf"}}'] == "2.0"
+        assert samples[f"{histogram}_count{{{max_labels}}}"] == "2.0"
+        assert samples[f"{histogram}_sum{{{max_labels}}}"] == "6.0"
+
+    def test_should_escape_label_values(self):
+        exporter = OpenMetricsTextfileExporter("metrics.prom")
+        validation_info = _validation_info('quoted "name"', ValidationFunction.MAX, 1)
+
+        text = exporter.generate(InspectOutput(validations={"id": validation_info}))
+
+        assert 'validation="quoted \\"name\\""' in text
+
+    def test_should_replace_file(self, tmp_path, inspect_output):
+        file_path = tmp_path / "dcs.prom"
+        file_path.write_text("stale")
+        exporter = OpenMetricsTextfileExporter(str(file_path))
+
+        exporter.export(inspect_output, run_duration=1.0)
+
+        assert file_path.read_text().endswith("# EOF\n")
+        assert "stale" not in file_path.read_text()
+        assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o644
+        assert os.listdir(tmp_path) == ["dcs.prom"]
+
+    def test_should_keep_histograms_between_processes(self, tmp_path, inspect_output):
+        file_path = str(tmp_path / "dcs.prom")
+        state_path = str(tmp_path / "dcs.prom.json")
+
+        for _ in range(2):
+            OpenMetricsTextfileExporter(
+                file_path, buckets=[1.0, 5.0], state_path=state_path
+            ).export(inspect_output)
+
+        with open(file_path) as file:
+            samples = _samples(file.read())
+        max_labels = LABELS.format(name="max_price", function="max")
+        histogram = "dcs_validation_duration_seconds"
+        assert samples[f'{histogram}_bucket{{{max_labels},le="5.0"}}'] == "2.0"
+        assert samples[f"{histogram}_count{{{max_labels}}}"] == "2.0"
+        assert samples[f"{histogram}_sum{{{max_labels}}}"] == "6.0"
+        assert sorted(os.listdir(tmp_path)) == ["dcs.prom", "dcs.prom.json"]
+
+    def test_should_drop_state_of_other_buckets(self, tmp_path, inspect_output):
+        file_path = str(tmp_path / "dcs.prom")
+        state_path = str(tmp_path / "dcs.prom.json")
+        OpenMetricsTextfileExporter(
+            file_path, buckets=[1.0], state_path=state_path
+        ).export(inspect_output)
+
+        exporter = OpenMetricsTextfileExporter(
+            file_path, buckets=[1.0, 5.0], state_path=state_path
+        )
+        exporter.observe(inspect_output)
+
+        samples = _samples(exporter.generate(inspect_output))
+        max_labels = LABELS.format(name="max_price", function="max")
+        assert (
+            samples[f"dcs_validation_duration_seconds_count{{{max_labels}}}"] == "1.0"
+        )
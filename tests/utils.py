@@ -11,12 +11,61 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Iterable, Tuple
 
 from opensearchpy import OpenSearch
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Connection
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
 
 from dcs_core.core.common.models.configuration import DataSourceConnectionConfiguration
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.integrations.databases.sqlite import SQLiteDataSource
+
+
+class InMemorySQLDataSource(SQLiteDataSource):
+    """
+    SQLite data source on an in-memory database that records the queries it runs
+    """
+
+    def __init__(self, data_source_name: str = "test_data_source"):
+        super().__init__(data_source_name, {})
+        self.queries = []
+
+    def create_pooled_engine(self, url, **kwargs) -> Engine:
+        # the statements of the test setup are committed at once
+        return super().create_pooled_engine(url, isolation_level="AUTOCOMMIT", **kwargs)
+
+    def connect(self):
+        # a connection for the test setup, the queries check out their own
+        self.connection = super().connect().connect()
+        return self.connection
+
+    def fetchone(self, query):
+        self.queries.append(query)
+        return super().fetchone(query)
+
+    def fetchall(self, query):
+        self.queries.append(query)
+        return super().fetchall(query)
+
+    def fetch_batches(self, query, batch_size: int):
+        self.queries.append(query)
+        return super().fetch_batches(query, batch_size)
+
+
+def insert_rows(data_source: SQLDataSource, table_name: str, rows: Iterable[Tuple]):
+    """
+    Insert the rows into the table, None values are inserted as NULL
+    """
+    parameters = [
+        {f"value_{index}": value for index, value in enumerate(row)} for row in rows
+    ]
+    if not parameters:
+        return
+    placeholders = ", ".join(f":{name}" for name in parameters[0])
+    data_source.connection.execute(
+        text(f"INSERT INTO {table_name} VALUES ({placeholders})"), parameters
+    )
 
 
 def is_pgsql_responsive(host, port, username, password, database):